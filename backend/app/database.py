@@ -8,6 +8,12 @@ engine = create_engine(settings.database_url, connect_args=connect_args)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+def ensure_indexes():
+    """모델에 선언된 인덱스 중 기존 테이블에 없는 것 생성 (create_all은 이미 있는 테이블의 인덱스를 추가하지 않음)"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
 def get_db():
     db = SessionLocal()
     try:
@@ -1,12 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from datetime import date
+import asyncio
 from .config import get_settings
-from .routes import auth, news, briefing, feedback
-from .database import engine, Base, SessionLocal
-from .models import user, news as news_model, subscription, briefing as briefing_model, feedback as feedback_model
+from .routes import auth, news, briefing, feedback, admin
+from .database import engine, Base, SessionLocal, ensure_indexes
+from .models import user, news as news_model, subscription, briefing as briefing_model, feedback as feedback_model, feed as feed_model, fingerprint as fingerprint_model, pipeline_run as pipeline_run_model, llm_cache as llm_cache_model
 from .models.briefing import DailyBriefing
+from .services import ingest_scheduler, briefing_scheduler, search_index, tag_index
 
 settings = get_settings()
 
@@ -17,21 +18,40 @@ async def lifespan(app: FastAPI):
     # 시작 시: 오늘 브리핑 체크
     db = SessionLocal()
     try:
-        today = date.today()
+        today = briefing_scheduler.today()
         existing = db.query(DailyBriefing).filter(
             DailyBriefing.briefing_date == today
         ).first()
 
-        if not existing:
+        if not existing and briefing_scheduler.RUN_IN_APP:
+            print(f"[Startup] 오늘({today}) 브리핑 없음 - 브리핑 스케줄러가 바로 생성합니다")
+        elif not existing:
             print(f"[Startup] 오늘({today}) 브리핑 없음 - 첫 API 호출 시 자동 생성됩니다")
         else:
             print(f"[Startup] 오늘({today}) 브리핑 존재 - {len(existing.news_items)}개 뉴스")
     finally:
         db.close()
 
+    # 백그라운드 RSS 수집 (별도 워커: scripts/run_ingest_worker.py)
+    ingest_task = None
+    if ingest_scheduler.RUN_IN_APP:
+        ingest_task = asyncio.create_task(ingest_scheduler.IngestScheduler().run_forever())
+
+    # 매일 브리핑 사전 생성 (워커가 여럿이어도 생성은 한 곳에서만)
+    briefing_task = None
+    if briefing_scheduler.RUN_IN_APP:
+        briefing_task = asyncio.create_task(briefing_scheduler.BriefingScheduler().run_forever())
+
     yield  # 앱 실행
 
     # 종료 시
+    for task in (ingest_task, briefing_task):
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
     print("[Shutdown] 앱 종료")
 
 
@@ -39,6 +59,9 @@ app = FastAPI(title=settings.app_name, debug=settings.debug, lifespan=lifespan)
 
 # DB 테이블 생성
 Base.metadata.create_all(bind=engine)
+ensure_indexes()
+search_index.ensure_search_index()
+tag_index.backfill()
 
 app.add_middleware(
     CORSMiddleware,
@@ -52,6 +75,7 @@ app.include_router(auth.router, prefix="/api/v1")
 app.include_router(news.router, prefix="/api/v1")
 app.include_router(briefing.router, prefix="/api/v1")
 app.include_router(feedback.router, prefix="/api/v1")
+app.include_router(admin.router, prefix="/api/v1")
 
 
 @app.get("/")
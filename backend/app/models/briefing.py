@@ -1,6 +1,6 @@
 """데일리 브리핑 모델"""
 from datetime import datetime, date
-from sqlalchemy import Column, String, DateTime, Date, Integer, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, Date, Integer, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
 import uuid
@@ -15,12 +15,14 @@ class DailyBriefing(Base):
     daily_summary = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    news_items = relationship("BriefingNewsItem", back_populates="briefing")
+    news_items = relationship("BriefingNewsItem", back_populates="briefing", order_by="BriefingNewsItem.order")
 
 
 class BriefingNewsItem(Base):
     """브리핑 내 뉴스 아이템"""
     __tablename__ = "briefing_news_items"
+    # 브리핑별 뉴스 조회/개수 (briefing_id FK 인덱스 겸용)
+    __table_args__ = (Index("ix_briefing_news_items_briefing_order", "briefing_id", "order"),)
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     briefing_id = Column(String, ForeignKey("daily_briefings.id"))
@@ -33,3 +35,17 @@ class BriefingNewsItem(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
     briefing = relationship("DailyBriefing", back_populates="news_items")
+
+
+class BriefingJob(Base):
+    """날짜별 브리핑 생성 작업 (행 하나가 생성 권한 - 여러 워커 중 하나만 생성)"""
+    __tablename__ = "briefing_jobs"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    briefing_date = Column(Date, unique=True, nullable=False)
+    status = Column(String(20), nullable=False, default="running")  # running, done, failed
+    owner = Column(String(100), nullable=True)  # 생성 중인 워커 (host:pid)
+    briefing_id = Column(String, nullable=True)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
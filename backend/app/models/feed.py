@@ -0,0 +1,62 @@
+"""RSS 피드 수집 상태 모델"""
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Integer, Text, JSON, UniqueConstraint
+from ..database import Base
+import uuid
+
+
+class FeedState(Base):
+    """피드별 조건부 요청 상태 (ETag, Last-Modified, 본문 해시, 최근 GUID)"""
+    __tablename__ = "feed_states"
+
+    feed_name = Column(String(50), primary_key=True)  # RSS_FEEDS 키
+    url = Column(String(1000), nullable=False)
+    etag = Column(String(500), nullable=True)
+    last_modified = Column(String(100), nullable=True)
+    content_hash = Column(String(64), nullable=True)  # sha256 hex
+    seen_guids = Column(JSON, default=list)  # 최근 본 항목 GUID (최신순)
+    fetched_at = Column(DateTime, nullable=True)
+
+    # 적응형 폴링 스케줄
+    poll_interval = Column(Integer, nullable=True)  # 현재 폴링 간격 (초)
+    next_poll_at = Column(DateTime, nullable=True, index=True)
+    failure_count = Column(Integer, default=0)  # 연속 실패 횟수
+    last_new_at = Column(DateTime, nullable=True)  # 마지막으로 새 항목이 나온 시각
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class RawArticle(Base):
+    """수집된 원문 기사 (브리핑 생성 전 스테이징)"""
+    __tablename__ = "raw_articles"
+    __table_args__ = (UniqueConstraint("feed_name", "guid", name="uq_raw_articles_feed_guid"),)
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    feed_name = Column(String(50), nullable=False)
+    guid = Column(String(1000), nullable=False)
+    title = Column(String(500), nullable=False)
+    summary = Column(Text, nullable=False)
+    source_url = Column(String(1000), nullable=False, index=True)
+    publisher = Column(String(100), nullable=False)
+    published_at = Column(String(100), nullable=True)  # 피드 원본 문자열
+    fetched_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    def to_dict(self) -> dict:
+        """fetch_rss 결과와 같은 형태의 dict"""
+        return {
+            "title": self.title,
+            "summary": self.summary,
+            "source_url": self.source_url,
+            "published_at": self.published_at or "",
+            "publisher": self.publisher,
+            "guid": self.guid,
+        }
+
+
+class SchedulerLease(Base):
+    """백그라운드 루프 실행권 (워커/프로세스가 여럿이어도 한 곳에서만 실행)"""
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(50), primary_key=True)  # ingest 등
+    owner = Column(String(200), nullable=False)  # host:pid
+    expires_at = Column(DateTime, nullable=False)
@@ -0,0 +1,23 @@
+"""기사 지문 모델 (날짜를 넘는 중복 스토리 탐지)"""
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Date, Text, ForeignKey, JSON
+from ..database import Base
+import uuid
+
+
+class StoryFingerprint(Base):
+    """처리한 스토리의 제목 지문 + 재창작 결과"""
+    __tablename__ = "story_fingerprints"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    title = Column(String(500), nullable=False)  # 원문 제목
+    source_url = Column(String(1000), nullable=False)
+    shingles = Column(JSON, nullable=False)  # 제목 문자 2-gram 해시 (MinHash 입력)
+
+    # 재사용할 재창작 결과
+    recreated_title = Column(String(500), nullable=True)
+    recreated_summary = Column(Text, nullable=True)
+
+    article_id = Column(String, ForeignKey("news_articles.id"), nullable=True)
+    briefing_date = Column(Date, nullable=True, index=True)  # 브리핑에 실린 날짜
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
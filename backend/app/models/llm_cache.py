@@ -0,0 +1,18 @@
+"""LLM 응답 캐시 모델"""
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, DateTime, JSON
+from ..database import Base
+
+
+class LLMCacheEntry(Base):
+    """검증을 통과한 LLM 응답 (모델 + 프롬프트 버전 + 입력 해시로 조회)"""
+    __tablename__ = "llm_cache"
+
+    key = Column(String(64), primary_key=True)  # sha256(kind, model, prompt_version, 입력)
+    kind = Column(String(50), nullable=False)  # recreate, ...
+    model = Column(String(100), nullable=False)
+    prompt_version = Column(Integer, nullable=False)
+    response = Column(JSON, nullable=False)
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)  # TTL 기준
+    last_accessed_at = Column(DateTime, default=datetime.utcnow, index=True)  # LRU 기준
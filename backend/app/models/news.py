@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, Float, ForeignKey, JSON
+from sqlalchemy import Column, String, Text, DateTime, Float, ForeignKey, JSON, Index, Integer, Table
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
@@ -7,6 +7,8 @@ import uuid
 class NewsArticle(Base):
     """재창작된 뉴스 (원문 복제 금지, 출처 필수)"""
     __tablename__ = "news_articles"
+    # 최신순 목록 (created_at이 같으면 id 순)
+    __table_args__ = (Index("ix_news_articles_created_at_id", "created_at", "id"),)
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String, nullable=False)
@@ -19,7 +21,7 @@ class NewsArticle(Base):
     publisher = Column(String, nullable=False)
     original_published_at = Column(DateTime, nullable=False)
 
-    tags = Column(JSON, default=list)
+    tags = Column(JSON, default=list)  # 표시용 목록 (검색/집계는 tags + article_tags 테이블, services/tag_index)
     tile_size = Column(String, default="small")  # small, wide, tall, large
 
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -34,7 +36,7 @@ class CausalityAnalysis(Base):
     __tablename__ = "causality_analyses"
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    article_id = Column(String, ForeignKey("news_articles.id"), nullable=False)
+    article_id = Column(String, ForeignKey("news_articles.id"), nullable=False, index=True)
     cause = Column(Text, nullable=False)  # 원인
     effect = Column(Text, nullable=False)  # 결과
     confidence = Column(Float, default=0.0)  # 신뢰도 0.0~1.0
@@ -48,7 +50,7 @@ class Insight(Base):
     __tablename__ = "insights"
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    article_id = Column(String, ForeignKey("news_articles.id"), nullable=False)
+    article_id = Column(String, ForeignKey("news_articles.id"), nullable=False, index=True)
     title = Column(String, nullable=False)
     content = Column(Text, nullable=False)
     insight_type = Column(String, default="general")  # positive, negative, neutral, general
@@ -56,3 +58,22 @@ class Insight(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
     article = relationship("NewsArticle", back_populates="insights")
+
+
+# 태그 역색인: 기사-태그 연결 (tag_id로 기사 찾기용 인덱스)
+article_tags = Table(
+    "article_tags",
+    Base.metadata,
+    Column("article_id", String, ForeignKey("news_articles.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_article_tags_tag_article", "tag_id", "article_id"),
+)
+
+
+class Tag(Base):
+    """정규화된 태그 (이름 기준 1행)"""
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(50), unique=True, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
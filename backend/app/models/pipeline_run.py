@@ -0,0 +1,22 @@
+"""파이프라인 실행 기록 모델"""
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Float, JSON, Index
+from ..database import Base
+import uuid
+
+
+class PipelineRun(Base):
+    """생성/수집 1회 실행의 단계별 계측 기록"""
+    __tablename__ = "pipeline_runs"
+    # 종류별 최근 기록 조회/정리
+    __table_args__ = (Index("ix_pipeline_runs_kind_started_at", "kind", "started_at"),)
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    kind = Column(String(50), nullable=False, index=True)  # briefing, news_pipeline, ingest, ...
+    status = Column(String(20), default="ok")  # ok, error
+    meta = Column(JSON, default=dict)  # 실행 인자 (날짜 등)
+    stages = Column(JSON, default=list)  # [{name, duration_ms, input, output, drops}]
+    feeds = Column(JSON, default=list)  # [{name, latency_ms, count, status}]
+    llm_calls = Column(JSON, default=list)  # [{kind, latency_ms, status, ...}]
+    duration_ms = Column(Float, nullable=True)
+    started_at = Column(DateTime, default=datetime.utcnow, index=True)
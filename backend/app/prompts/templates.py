@@ -6,10 +6,12 @@
 """
 
 # 뉴스 재창작 프롬프트 (배경 -> 사건 -> 영향 구조)
-RECREATION_PROMPT = """당신은 뉴스 재창작 전문가입니다.
-원문의 사실관계만 추출하여 완전히 새로운 문장으로 작성하세요.
+# 고정 규칙은 system(프롬프트 캐시 대상), 요청마다 바뀌는 원문만 user로 보냄
+# 프롬프트를 고치면 버전을 올릴 것 (LLM 응답 캐시 키에 포함)
+RECREATION_PROMPT_VERSION = 2
 
-[필수 규칙]
+# 재창작 규칙 (단건/배치 프롬프트 공통)
+RECREATION_RULES = """[필수 규칙]
 1. 원문 표현을 절대 복제하지 마세요 (3단어 이상 연속 금지)
 2. 사실만 추출하고 의견은 제외하세요
 3. 배경 -> 사건 -> 영향 구조로 작성하세요
@@ -28,16 +30,33 @@ RECREATION_PROMPT = """당신은 뉴스 재창작 전문가입니다.
 - O: "이로 인해 시장에 변화가 예상됩니다."
 - X: "정부가 새 정책 발표" (비문)
 - X: "시장 변화가 예상된다" (반말)
+"""
 
-원문:
-{original_text}
+RECREATION_SYSTEM = """당신은 뉴스 재창작 전문가입니다.
+사용자가 보낸 원문의 사실관계만 추출하여 완전히 새로운 문장으로 작성하세요.
 
+""" + RECREATION_RULES + """
 JSON 형식으로 응답 (중요: 문자열 안에 큰따옴표 사용 금지, 작은따옴표나 다른 표현 사용):
-{{"title": "새로운 제목", "summary": "요약 내용"}}"""
+{"title": "새로운 제목", "summary": "요약 내용"}"""
+
+RECREATION_PROMPT = """원문:
+{original_text}"""
+
+# 여러 기사를 한 번에 재창작하는 프롬프트 (기사별로 RECREATION_SYSTEM과 같은 규칙)
+BATCH_RECREATION_SYSTEM = """당신은 뉴스 재창작 전문가입니다.
+사용자가 보낸 원문 목록의 각 기사마다 사실관계만 추출하여 완전히 새로운 문장으로 작성하세요.
+기사끼리 내용을 섞지 마세요.
+
+""" + RECREATION_RULES + """
+기사 번호(id)별로 JSON 배열 하나로만 응답 (중요: 문자열 안에 큰따옴표 사용 금지, 작은따옴표나 다른 표현 사용):
+[{"id": 1, "title": "새로운 제목", "summary": "요약 내용"}, ...]"""
+
+BATCH_RECREATION_PROMPT = """원문 목록 ({count}개):
+{articles}"""
 
 
 # 오늘의 요약 프롬프트
-DAILY_SUMMARY_PROMPT = """오늘 뉴스들의 공통된 흐름이나 분위기를 1~2문장으로 요약하세요.
+DAILY_SUMMARY_SYSTEM = """오늘 뉴스들의 공통된 흐름이나 분위기를 1~2문장으로 요약하세요.
 
 [필수 규칙]
 1. 개별 뉴스를 나열하지 마세요 (콤마로 연결된 목록 금지)
@@ -51,11 +70,9 @@ DAILY_SUMMARY_PROMPT = """오늘 뉴스들의 공통된 흐름이나 분위기
 
 [잘못된 예시 - 이렇게 쓰지 마세요]
 - "로또 당첨, 화재 발생, AI 등장, 정책 추진" (나열 금지)
-- "여러 사건이 발생했다" (너무 모호함)
+- "여러 사건이 발생했다" (너무 모호함)"""
 
-오늘의 뉴스 제목들:
+DAILY_SUMMARY_PROMPT = """오늘의 뉴스 제목들:
 {news_titles}
 
 응답 (1~2문장):"""
-
-
@@ -0,0 +1,71 @@
+"""운영 API (파이프라인 실행 기록, LLM 캐시/속도 제한 상태)"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from ..database import get_db
+from ..models.pipeline_run import PipelineRun
+from ..services import llm_cache, claude_service, response_cache
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def _format_run(run: PipelineRun, detail: bool = False) -> dict:
+    data = {
+        "id": run.id,
+        "kind": run.kind,
+        "status": run.status,
+        "meta": run.meta,
+        "duration_ms": run.duration_ms,
+        "started_at": run.started_at.isoformat() if run.started_at else None,
+        "stages": run.stages,
+    }
+    if detail:
+        data["feeds"] = run.feeds
+        data["llm_calls"] = run.llm_calls
+    return data
+
+
+@router.get("/runs")
+async def get_runs(
+    kind: str = Query(None, description="briefing, news_pipeline, ingest, ..."),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db)
+):
+    """최근 파이프라인 실행 목록 (단계별 소요시간/건수)"""
+    query = db.query(PipelineRun)
+    if kind:
+        query = query.filter(PipelineRun.kind == kind)
+    runs = query.order_by(PipelineRun.started_at.desc()).limit(limit).all()
+    return {"runs": [_format_run(r) for r in runs]}
+
+
+@router.get("/runs/{run_id}")
+async def get_run_detail(run_id: str, db: Session = Depends(get_db)):
+    """실행 상세 (피드별 수집 지연, LLM 호출별 지연 포함)"""
+    run = db.query(PipelineRun).filter(PipelineRun.id == run_id).first()
+    if not run:
+        raise HTTPException(status_code=404, detail="실행 기록을 찾을 수 없습니다")
+    return _format_run(run, detail=True)
+
+
+@router.get("/llm-cache")
+async def get_llm_cache_stats():
+    """LLM 응답 캐시 hit/miss 카운터 (프로세스 시작 이후)"""
+    return llm_cache.stats()
+
+
+@router.get("/response-cache")
+async def get_response_cache_stats():
+    """브리핑 응답 캐시 hit/miss/304 카운터 (이 워커)"""
+    return response_cache.stats()
+
+
+@router.get("/llm-limiter")
+async def get_llm_limiter_stats():
+    """Claude 요청 속도 제한 상태 (현재 동시성 한도, 429 횟수, 대기 시간)"""
+    return claude_service.limiter.stats()
+
+
+@router.get("/llm-outcomes")
+async def get_llm_outcomes():
+    """재창작 시도별 결과 (성공 / 파싱 실패 / 검증 실패)"""
+    return claude_service.recreation_stats()
@@ -1,18 +1,32 @@
 """브리핑 API"""
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
 from datetime import date, timedelta
-from ..database import get_db
+from ..database import get_db, SessionLocal
 from ..models.briefing import DailyBriefing, BriefingNewsItem
 from ..services.news_filter import run_pipeline
-from ..services.rss_service import fetch_all_feeds
-from ..services.claude_service import recreate_news, generate_daily_summary
+from ..services.ingest_scheduler import collect_articles
+from ..services import feed_archive
+from ..services.story_index import StoryIndex
+from ..services.claude_service import BATCH_SIZE, iter_recreate_news_batch, generate_daily_summary, is_validated
+from ..services.instrumentation import start_run, stage
+from ..services import briefing_jobs, briefing_scheduler, response_cache, search_index
+from ..services.briefing_jobs import JobPending
+import asyncio
+import json
+import logging
 import uuid
+from contextlib import aclosing
 
 router = APIRouter(prefix="/briefing", tags=["briefing"])
+logger = logging.getLogger(__name__)
 
 # 무료 사용자 보관 기간
 FREE_RETENTION_DAYS = 7
+# 스트리밍 생성 시 재창작 요청 1건당 기사 수 (작을수록 첫 뉴스가 빨리 도착, 요청 수는 늘어남)
+STREAM_BATCH_SIZE = 2
 
 
 @router.get("")
@@ -20,11 +34,18 @@ async def get_briefings(
     days: int = Query(FREE_RETENTION_DAYS, ge=1, le=30),
     db: Session = Depends(get_db)
 ):
-    """브리핑 목록 조회 (최근 N일)"""
-    cutoff_date = date.today() - timedelta(days=days)
-
-    briefings = db.query(DailyBriefing).filter(
-        DailyBriefing.briefing_date >= cutoff_date
+    """브리핑 목록 조회 (최근 N일, 미리 만들어 둔 내일 브리핑은 빼고)"""
+    today = briefing_scheduler.today()
+    cutoff_date = today - timedelta(days=days)
+
+    # 뉴스 개수는 (briefing_id, order) 인덱스로 세는 상관 서브쿼리 -> 쿼리 1번
+    news_count = select(func.count(BriefingNewsItem.id)).where(
+        BriefingNewsItem.briefing_id == DailyBriefing.id
+    ).correlate(DailyBriefing).scalar_subquery()
+
+    briefings = db.query(DailyBriefing.id, DailyBriefing.briefing_date, news_count.label("news_count")).filter(
+        DailyBriefing.briefing_date >= cutoff_date,
+        DailyBriefing.briefing_date <= today,
     ).order_by(DailyBriefing.briefing_date.desc()).all()
 
     return {
@@ -32,8 +53,8 @@ async def get_briefings(
             {
                 "id": b.id,
                 "date": b.briefing_date.isoformat(),
-                "news_count": len(b.news_items),
-                "is_today": b.briefing_date == date.today(),
+                "news_count": b.news_count,
+                "is_today": b.briefing_date == today,
             }
             for b in briefings
         ],
@@ -43,37 +64,76 @@ async def get_briefings(
 
 @router.get("/today")
 async def get_today_briefing(
+    request: Request,
     auto_generate: bool = Query(True, description="브리핑 없으면 자동 생성"),
+    wait: float = Query(None, ge=0, le=120, description="자동 생성 대기 시간(초), 넘기면 202 + job id (없으면 끝날 때까지 대기)"),
     db: Session = Depends(get_db)
 ):
-    """오늘의 브리핑 조회 (없으면 자동 생성)"""
-    today = date.today()
+    """오늘의 브리핑 조회 (없으면 자동 생성)
+
+    보통은 브리핑 스케줄러가 전날 미리 만들어 두므로 조회만 한다. 없으면(스케줄러 꺼짐/실패)
+    여기서 생성하되, 동시에 여러 요청이 와도 생성은 한 번만 (briefing_jobs, 스케줄러가 생성 중이면 그 결과).
+    나머지 요청은 같은 결과를 기다린다. wait를 주면 그 시간 안에 끝나지 않을 때 202로 job id를 돌려준다.
+    """
+    today = briefing_scheduler.today()
+
+    cached = response_cache.get_for_date(today, today)
+    if cached:
+        return _briefing_response(request, cached)
 
-    briefing = db.query(DailyBriefing).filter(
+    briefing = db.query(DailyBriefing).options(selectinload(DailyBriefing.news_items)).filter(
         DailyBriefing.briefing_date == today
     ).first()
 
     if not briefing:
-        if auto_generate:
-            # 자동 생성
-            briefing = await _generate_briefing_internal(today, db)
-        else:
+        if not auto_generate:
             raise HTTPException(status_code=404, detail="오늘의 브리핑이 없습니다")
+        try:
+            briefing_id = await briefing_jobs.run_single_flight(
+                today, lambda session, emit: _generate_briefing_internal(today, session, emit=emit), wait=wait
+            )
+        except JobPending as e:
+            return _job_pending(e.job_id)
+        briefing = db.query(DailyBriefing).options(selectinload(DailyBriefing.news_items)).filter(
+            DailyBriefing.id == briefing_id
+        ).first()
+
+    return _briefing_response(request, _cache_briefing(briefing))
 
-    return _format_briefing(briefing)
+
+@router.get("/jobs/{job_id}")
+async def get_briefing_job(job_id: str, db: Session = Depends(get_db)):
+    """브리핑 생성 작업 상태 (/today의 202 응답 후 폴링용)"""
+    job = briefing_jobs.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+    return {
+        "job_id": job.id,
+        "date": job.briefing_date.isoformat(),
+        "status": job.status,
+        "briefing_id": job.briefing_id,
+        "error": job.error,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
 
 
 @router.get("/{briefing_id}")
-async def get_briefing_detail(briefing_id: str, db: Session = Depends(get_db)):
-    """브리핑 상세 조회"""
-    briefing = db.query(DailyBriefing).filter(
+async def get_briefing_detail(briefing_id: str, request: Request, db: Session = Depends(get_db)):
+    """브리핑 상세 조회 (캐시된 응답이 있으면 DB 조회 없음)"""
+    cached = response_cache.get(briefing_id, briefing_scheduler.today())
+    if cached:
+        return _briefing_response(request, cached)
+
+    briefing = db.query(DailyBriefing).options(selectinload(DailyBriefing.news_items)).filter(
         DailyBriefing.id == briefing_id
     ).first()
 
     if not briefing:
         raise HTTPException(status_code=404, detail="브리핑을 찾을 수 없습니다")
 
-    return _format_briefing(briefing)
+    return _briefing_response(request, _cache_briefing(briefing))
 
 
 @router.post("/generate")
@@ -81,11 +141,15 @@ async def generate_briefing(
     target_date: date = None,
     news_count: int = Query(8, ge=1, le=15, description="분야당 1개씩 (기본 8개)"),
     force: bool = Query(False, description="기존 브리핑 삭제 후 재생성"),
+    snapshot: str = Query(None, description="RSS 아카이브 스냅샷으로 재생 (예: 2026-10-17, 2026-10-17T063000)"),
     db: Session = Depends(get_db)
 ):
     """브리핑 생성 (RSS 수집 + Claude 분석)"""
     if target_date is None:
-        target_date = date.today()
+        target_date = briefing_scheduler.today()
+
+    if snapshot and not feed_archive.snapshot_exists(snapshot):
+        raise HTTPException(status_code=404, detail=f"RSS 스냅샷을 찾을 수 없습니다: {snapshot}")
 
     # 이미 존재하는지 확인
     existing = db.query(DailyBriefing).filter(
@@ -95,16 +159,16 @@ async def generate_briefing(
     if existing:
         if force:
             # 기존 브리핑 삭제 (뉴스 아이템도 cascade 삭제)
-            db.query(BriefingNewsItem).filter(
-                BriefingNewsItem.briefing_id == existing.id
-            ).delete()
-            db.delete(existing)
-            db.commit()
+            _delete_briefing(db, existing)
         else:
             return {"message": "이미 브리핑이 존재합니다", "briefing_id": existing.id}
 
-    # 내부 함수로 생성
-    briefing = await _generate_briefing_internal(target_date, db, news_count)
+    # 같은 날짜를 다른 요청이 생성 중이면 그 결과를 기다림 (news_count/snapshot은 먼저 시작한 요청 기준)
+    briefing_id = await briefing_jobs.run_single_flight(
+        target_date,
+        lambda session, emit: _generate_briefing_internal(target_date, session, news_count, snapshot, emit=emit),
+    )
+    briefing = db.query(DailyBriefing).filter(DailyBriefing.id == briefing_id).first()
 
     return {
         "message": "브리핑 생성 완료",
@@ -113,74 +177,268 @@ async def generate_briefing(
     }
 
 
-async def _generate_briefing_internal(target_date: date, db: Session, news_count: int = 8) -> DailyBriefing:
-    """내부 브리핑 생성 함수"""
-    # RSS에서 뉴스 수집
-    all_news = fetch_all_feeds(limit_per_feed=10)
-
-    # 파이프라인 실행 (필터링 + 분류 + 중복제거 + 균형선정)
-    filtered_news = run_pipeline(all_news, target_count=news_count)
-
-    if len(filtered_news) < news_count:
-        filtered_news = all_news[:news_count]
+@router.get("/generate/stream")
+async def generate_briefing_stream(
+    target_date: date = None,
+    news_count: int = Query(8, ge=1, le=15, description="분야당 1개씩 (기본 8개)"),
+    snapshot: str = Query(None, description="RSS 아카이브 스냅샷으로 재생 (예: 2026-10-17, 2026-10-17T063000)"),
+):
+    """브리핑 생성 진행 상황 스트리밍 (Server-Sent Events)
 
-    # 뉴스 아이템 생성 (먼저 재창작하여 제목 수집)
-    news_items_data = []
-    recreated_titles = []
+    이벤트: stage(단계 완료), item(재창작된 뉴스 1건), done({briefing_id}), error({detail})
+    생성은 백그라운드 작업(briefing_jobs)이고 스트림은 그 진행 이벤트를 구독만 한다.
+    연결이 끊겨도 생성은 계속되고, /today·/generate로 기다리는 요청도 같은 결과를 받는다.
+    재생성(force)은 POST /generate로.
+    """
+    if target_date is None:
+        target_date = briefing_scheduler.today()
 
-    for i, news in enumerate(filtered_news):
-        original_text = f"{news['title']}. {news['summary']}"
+    if snapshot and not feed_archive.snapshot_exists(snapshot):
+        raise HTTPException(status_code=404, detail=f"RSS 스냅샷을 찾을 수 없습니다: {snapshot}")
 
+    async def events():
+        # 응답을 보내는 동안 세션을 유지해야 하므로 요청 의존성 대신 직접 관리
+        db = SessionLocal()
         try:
-            recreated = await recreate_news(original_text)
+            existing = db.query(DailyBriefing).filter(DailyBriefing.briefing_date == target_date).first()
+            if existing:
+                yield _sse("done", {"briefing_id": existing.id, "news_count": len(existing.news_items), "existing": True})
+                return
+
+            job_id, flight, briefing_id = briefing_jobs.start(
+                target_date,
+                lambda session, emit: _generate_briefing_internal(target_date, session, news_count, snapshot,
+                                                                  emit=emit, recreate_batch_size=STREAM_BATCH_SIZE),
+            )
+            existing = briefing_id is not None
+            if flight is not None:
+                async for event, data in flight.follow():
+                    yield _sse(event, data)
+                briefing_id = await asyncio.shield(flight.task)
+            elif not existing:
+                # 다른 워커가 생성 중 -> 진행 이벤트 없이 결과만 기다림
+                yield _sse("stage", {"stage": "waiting", "job_id": job_id})
+                briefing_id = await briefing_jobs.wait_for_job(job_id)
+                existing = True
+
+            briefing = db.query(DailyBriefing).filter(DailyBriefing.id == briefing_id).first()
+            yield _sse("done", {"briefing_id": briefing.id, "news_count": len(briefing.news_items), "existing": existing})
         except Exception as e:
-            print(f"Claude API error: {e}")
-            recreated = {"title": news["title"], "summary": news["summary"]}
-
-        recreated_titles.append(recreated.get("title", news["title"]))
-        news_items_data.append((news, recreated))
-
-    # 한 줄 요약 생성
-    try:
-        daily_summary = await generate_daily_summary(recreated_titles)
-    except Exception as e:
-        print(f"Daily summary error: {e}")
-        daily_summary = None
-
-    # 브리핑 생성
-    briefing = DailyBriefing(
-        id=str(uuid.uuid4()),
-        briefing_date=target_date,
-        daily_summary=daily_summary,
-    )
-    db.add(briefing)
-
-    # 뉴스 아이템 저장
-    for i, (news, recreated) in enumerate(news_items_data):
-        item = BriefingNewsItem(
-            id=str(uuid.uuid4()),
-            briefing_id=briefing.id,
-            order=i + 1,
-            title=recreated.get("title", news["title"]),
-            summary=recreated.get("summary", news["summary"]),
-            publisher=news["publisher"],
-            source_url=news["source_url"],
-            category=news.get("category", "economy"),
-        )
-        db.add(item)
-
+            logger.exception("브리핑 스트리밍 생성 실패")
+            yield _sse("error", {"detail": str(e)})
+        finally:
+            db.close()
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+def _delete_briefing(db: Session, briefing: DailyBriefing):
+    """기존 브리핑 삭제 (뉴스 아이템 포함)"""
+    items = db.query(BriefingNewsItem.id).filter(BriefingNewsItem.briefing_id == briefing.id)
+    search_index.remove_briefing_items(db, [item_id for (item_id,) in items])
+    db.query(BriefingNewsItem).filter(
+        BriefingNewsItem.briefing_id == briefing.id
+    ).delete()
+    db.delete(briefing)
     db.commit()
-    db.refresh(briefing)
+    response_cache.invalidate(briefing.id)
+
+
+async def _generate_briefing_internal(target_date: date, db: Session, news_count: int = 8, snapshot: str = None,
+                                      emit=None, recreate_batch_size: int = BATCH_SIZE) -> DailyBriefing:
+    """내부 브리핑 생성 함수 (단계별 계측 기록은 /admin/runs)
+
+    emit(event, data)를 주면 stage/item 진행 이벤트를 넘긴다 (SSE 구독용).
+    """
+    briefing = None
+    # aclosing: 중간에 취소돼도 생성 제너레이터를 이 태스크에서 바로 정리 (계측 컨텍스트 복원)
+    async with aclosing(_briefing_events(target_date, db, news_count, snapshot, recreate_batch_size)) as stream:
+        async for event, data in stream:
+            if event == "done":
+                briefing = data
+            elif emit is not None:
+                emit(event, data)
     return briefing
 
 
+async def _briefing_events(target_date: date, db: Session, news_count: int, snapshot: str | None,
+                           recreate_batch_size: int = BATCH_SIZE):
+    """브리핑 생성 단계별 진행 이벤트 (event, data)
+
+    단계가 끝날 때마다 ("stage", {...}), 재창작된 뉴스마다 ("item", {...}),
+    마지막에 ("done", DailyBriefing)을 내보낸다. recreate_batch_size를 줄이면
+    재창작 요청이 여러 묶음으로 나뉘어 뉴스가 더 일찍부터 도착한다.
+    """
+    async with start_run("briefing", date=target_date.isoformat(), news_count=news_count, snapshot=snapshot):
+        # 수집된 뉴스 풀 (부족하면 RSS 실시간 수집, snapshot 지정 시 아카이브 재생)
+        with stage("collect") as st:
+            all_news = await collect_articles(db, limit_per_feed=10, snapshot=snapshot)
+            st.set_output(len(all_news))
+        yield "stage", {"stage": "collect", "count": len(all_news)}
+
+        # 이전 날짜 브리핑에 이미 실린 스토리는 후보에서 제외
+        with stage("story_filter", len(all_news)) as st:
+            index = StoryIndex(db)
+            candidates = [n for n in all_news
+                          if not index.find(n["title"], before=target_date, source_url=n.get("source_url"))]
+            st.set_output(len(candidates))
+            st.drop("seen_in_earlier_briefing", len(all_news) - len(candidates))
+        all_news = candidates
+
+        # 파이프라인 실행 (필터링 + 분류 + 중복제거 + 균형선정)
+        filtered_news = run_pipeline(all_news, target_count=news_count)
+
+        if len(filtered_news) < news_count:
+            filtered_news = all_news[:news_count]
+        yield "stage", {"stage": "select", "count": len(filtered_news)}
+
+        # 뉴스 아이템 생성 (먼저 재창작하여 제목 수집)
+        recreated_list = [None] * len(filtered_news)
+
+        with stage("recreate", len(filtered_news)) as st:
+            # 최근 재창작한 같은 기사(같은 URL/같은 제목)가 있으면 결과 재사용
+            pending = []
+            for i, news in enumerate(filtered_news):
+                known = index.find_reusable(news["title"], news.get("source_url"))
+                if known:
+                    # 지문에는 검증을 통과한 재창작만 저장됨
+                    recreated_list[i] = {"title": known.recreated_title, "summary": known.recreated_summary,
+                                         "validated": True}
+                    st.drop("reused_recreation")
+                    yield "item", _item_event(i, news, recreated_list[i])
+                else:
+                    pending.append(i)
+
+            # 나머지는 배치 요청으로 재창작 (recreate_batch_size개씩, 검증 실패분만 개별 재시도)
+            failed = set()
+            texts = [f"{filtered_news[i]['title']}. {filtered_news[i]['summary']}" for i in pending]
+            try:
+                async for k, result in iter_recreate_news_batch(texts, recreate_batch_size):
+                    i = pending[k]
+                    recreated_list[i] = result
+                    yield "item", _item_event(i, filtered_news[i], result)
+            except Exception as e:
+                logger.warning(f"Claude API error: {e}")
+                for i in pending:
+                    if recreated_list[i] is None:
+                        news = filtered_news[i]
+                        recreated_list[i] = {"title": news["title"], "summary": news["summary"]}
+                        failed.add(i)
+                        yield "item", _item_event(i, news, recreated_list[i])
+                st.drop("llm_error", len(failed))
+            st.drop("not_validated", sum(1 for i in pending if i not in failed and not is_validated(recreated_list[i])))
+
+            news_items_data = []
+            recreated_titles = []
+            for i, (news, recreated) in enumerate(zip(filtered_news, recreated_list)):
+                # 검증 실패/API 실패 결과(원문 포함 가능)는 재사용 대상으로 남기지 않음
+                index.add(news["title"], news["source_url"], recreated if is_validated(recreated) else None,
+                          briefing_date=target_date)
+                recreated_titles.append(recreated.get("title", news["title"]))
+                news_items_data.append((news, recreated))
+            st.set_output(len(news_items_data))
+
+        # 한 줄 요약 생성
+        with stage("daily_summary", len(recreated_titles)) as st:
+            try:
+                daily_summary = await generate_daily_summary(recreated_titles)
+                st.set_output(1)
+            except Exception as e:
+                logger.warning(f"Daily summary error: {e}")
+                daily_summary = None
+                st.drop("llm_error")
+        yield "stage", {"stage": "daily_summary", "daily_summary": daily_summary}
+
+        with stage("save", len(news_items_data)) as st:
+            # 브리핑 생성
+            briefing = DailyBriefing(
+                id=str(uuid.uuid4()),
+                briefing_date=target_date,
+                daily_summary=daily_summary,
+            )
+            db.add(briefing)
+
+            # 뉴스 아이템 저장
+            for i, (news, recreated) in enumerate(news_items_data):
+                item = BriefingNewsItem(
+                    id=str(uuid.uuid4()),
+                    briefing_id=briefing.id,
+                    order=i + 1,
+                    title=recreated.get("title", news["title"]),
+                    summary=recreated.get("summary", news["summary"]),
+                    publisher=news["publisher"],
+                    source_url=news["source_url"],
+                    category=news.get("category", "economy"),
+                )
+                db.add(item)
+
+            db.commit()
+            db.refresh(briefing)
+            st.set_output(len(news_items_data))
+        yield "done", briefing
+
+
+def _item_event(i: int, news: dict, recreated: dict) -> dict:
+    """재창작 완료된 뉴스 1건 (_format_briefing의 news_items 항목과 같은 필드, id 제외)"""
+    return {
+        "order": i + 1,
+        "title": recreated.get("title", news["title"]),
+        "summary": recreated.get("summary", news["summary"]),
+        "publisher": news["publisher"],
+        "source_url": news["source_url"],
+        "category": news.get("category", "economy"),
+    }
+
+
+def _job_pending(job_id: str) -> JSONResponse:
+    """생성 진행 중 응답 (202)"""
+    return JSONResponse(
+        status_code=202,
+        content={"job_id": job_id, "status": "running", "status_url": f"/api/v1/briefing/jobs/{job_id}"},
+        headers={"Retry-After": "5"},
+    )
+
+
+def _cache_briefing(briefing: DailyBriefing) -> response_cache.CachedResponse:
+    """포맷 + JSON 인코딩해서 응답 캐시에 저장"""
+    return response_cache.put(briefing.id, briefing.briefing_date, _format_briefing(briefing),
+                              today=briefing_scheduler.today())
+
+
+def _briefing_response(request: Request, cached: response_cache.CachedResponse) -> Response:
+    """캐시된 브리핑 응답 (If-None-Match 일치 시 304, 클라이언트가 받으면 gzip 본)"""
+    use_gzip = cached.gzip_body is not None and "gzip" in request.headers.get("accept-encoding", "")
+    headers = {
+        "ETag": cached.gzip_etag if use_gzip else cached.etag,
+        "Cache-Control": cached.cache_control,
+        "Vary": "Accept-Encoding",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or cached.etag in tags or cached.gzip_etag in tags:
+            response_cache.count_not_modified()
+            return Response(status_code=304, headers=headers)
+
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(cached.gzip_body, media_type="application/json", headers=headers)
+    return Response(cached.body, media_type="application/json", headers=headers)
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 def _format_briefing(briefing: DailyBriefing) -> dict:
     """브리핑 포맷팅"""
     return {
         "id": briefing.id,
         "date": briefing.briefing_date.isoformat(),
         "daily_summary": briefing.daily_summary,
-        "is_today": briefing.briefing_date == date.today(),
+        "is_today": briefing.briefing_date == briefing_scheduler.today(),
         "news_items": [
             {
                 "id": item.id,
@@ -191,6 +449,6 @@ def _format_briefing(briefing: DailyBriefing) -> dict:
                 "source_url": item.source_url,
                 "category": item.category,
             }
-            for item in sorted(briefing.news_items, key=lambda x: x.order)
+            for item in briefing.news_items  # relationship order_by로 순서대로 로드
         ],
     }
@@ -1,14 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, select, tuple_
+from sqlalchemy.orm import Session, joinedload, selectinload
+from datetime import datetime
 from ..database import get_db
 from ..models.news import NewsArticle, CausalityAnalysis, Insight
+from ..models.briefing import BriefingNewsItem
 from ..services.claude_service import recreate_news
-from ..services.rss_service import fetch_all_feeds
+from ..services.rss_service import fetch_all_feeds_async
 from ..services.news_pipeline import run_pipeline
+from ..services import news_count, search_index, tag_index
+import base64
+import json
 
 router = APIRouter(prefix="/news", tags=["news"])
 
+RELATED_TAG_LIMIT = 10
+
 
 class AnalyzeRequest(BaseModel):
     text: str
@@ -19,35 +27,166 @@ async def get_news_list(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     sort_by: str = Query("latest"),
+    cursor: str = Query(None, description="이전 응답의 next_cursor (있으면 page 무시)"),
+    tag: str = Query(None, description="이 태그가 붙은 뉴스만"),
+    tags: str = Query(None, description="쉼표로 구분한 태그 (모두 붙은 뉴스만)"),
+    db: Session = Depends(get_db)
+):
+    """뉴스 목록 (최신순)
+
+    (created_at, id) 인덱스 기준 키셋 페이지네이션: next_cursor로 다음 페이지를 요청하면
+    깊이와 무관하게 같은 비용. page는 첫 진입/하위 호환용 (OFFSET).
+    태그 필터는 article_tags (tag_id, article_id) 인덱스 조회.
+    """
+    query = db.query(NewsArticle).order_by(NewsArticle.created_at.desc(), NewsArticle.id.desc())
+    tag_names = tag_index.normalize([tag, *(tags or "").split(",")])
+    if tag_names:
+        query = query.filter(NewsArticle.id.in_(tag_index.tagged_article_ids(tag_names)))
+    if cursor:
+        created_at, last_id = _decode_cursor(cursor, datetime.fromisoformat, str)
+        # 행 값 비교라야 인덱스에서 바로 시작 위치를 찾음 (OR로 풀면 처음부터 스캔)
+        query = query.filter(tuple_(NewsArticle.created_at, NewsArticle.id) < tuple_(created_at, last_id))
+    elif page > 1:
+        query = query.offset((page - 1) * limit)
+
+    # 한 건 더 읽어서 다음 페이지 여부 판단
+    articles = query.limit(limit + 1).all()
+    has_more = len(articles) > limit
+    articles = articles[:limit]
+
+    if tag_names:
+        total = db.execute(select(func.count()).select_from(tag_index.tagged_article_ids(tag_names).subquery())).scalar()
+    else:
+        total = news_count.total(db)
+
+    return {
+        "articles": [_article_dict(a) for a in articles],
+        "total": total, "page": page, "limit": limit, "has_more": has_more,
+        "next_cursor": _encode_cursor(articles[-1].created_at.isoformat(), articles[-1].id) if has_more else None,
+    }
+
+
+@router.get("/tags")
+async def get_tags(limit: int = Query(50, ge=1, le=200), db: Session = Depends(get_db)):
+    """태그별 뉴스 수 (많은 순)"""
+    return {"tags": tag_index.tag_counts(db, limit)}
+
+
+@router.get("/search")
+async def search_news(
+    q: str = Query(..., min_length=1, max_length=100),
+    page: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str = Query(None, description="이전 응답의 next_cursor (있으면 page 무시)"),
     db: Session = Depends(get_db)
 ):
+    """뉴스 + 브리핑 뉴스 전문 검색 (BM25 관련도순)
+
+    결과 항목은 뉴스 목록과 같은 필드에 type(news/briefing)을 더함.
+    브리핑 뉴스는 briefing_id, briefing_date도 포함.
+    """
+    if not search_index.available():
+        return _search_like(db, q, page, limit)
+
+    after = _decode_cursor(cursor, float, int) if cursor else None
+    offset = 0 if cursor else (page - 1) * limit
+    hits, total = search_index.search(db, q, limit + 1, after=after, offset=offset)
+    has_more = len(hits) > limit
+    hits = hits[:limit]
+
+    return {
+        "articles": _load_hits(db, [(doc_type, doc_id) for doc_type, doc_id, _, _ in hits]),
+        "total": total, "page": page, "limit": limit, "has_more": has_more,
+        "next_cursor": _encode_cursor(hits[-1][2], hits[-1][3]) if has_more else None,
+    }
+
+
+def _search_like(db: Session, q: str, page: int, limit: int) -> dict:
+    """FTS 색인이 없을 때: LIKE 검색 (최신순, page만 지원)"""
+    pattern = f"%{q.strip()}%"
+    news = db.query(NewsArticle.created_at, NewsArticle.id).filter(or_(
+        NewsArticle.title.ilike(pattern), NewsArticle.summary.ilike(pattern),
+        NewsArticle.recreated_content.ilike(pattern),
+    )).all()
+    items = db.query(BriefingNewsItem.created_at, BriefingNewsItem.id).filter(or_(
+        BriefingNewsItem.title.ilike(pattern), BriefingNewsItem.summary.ilike(pattern),
+    )).all()
+
+    keys = sorted([(c, search_index.DOC_NEWS, i) for c, i in news] + [(c, search_index.DOC_BRIEFING, i) for c, i in items],
+                  key=lambda k: (k[0] or datetime.min, k[2]), reverse=True)
     offset = (page - 1) * limit
-    query = db.query(NewsArticle)
-    if sort_by == "latest":
-        query = query.order_by(NewsArticle.created_at.desc())
-    articles = query.offset(offset).limit(limit).all()
-    total = db.query(NewsArticle).count()
     return {
-        "articles": [{"id": a.id, "title": a.title, "summary": a.summary, "image_url": a.image_url,
-                      "publisher": a.publisher, "source_url": a.source_url, "published_at": a.original_published_at.isoformat(),
-                      "tile_size": a.tile_size, "tags": a.tags} for a in articles],
-        "total": total, "page": page, "limit": limit, "has_more": offset + limit < total
+        "articles": _load_hits(db, [(doc_type, doc_id) for _, doc_type, doc_id in keys[offset:offset + limit]]),
+        "total": len(keys), "page": page, "limit": limit, "has_more": offset + limit < len(keys),
+        "next_cursor": None,
     }
 
 
+def _load_hits(db: Session, hits: list) -> list:
+    """(doc_type, doc_id) 순서대로 뉴스/브리핑 뉴스를 각각 한 번에 읽어 응답 항목으로 (삭제된 문서는 제외)"""
+    news_ids = [doc_id for doc_type, doc_id in hits if doc_type == search_index.DOC_NEWS]
+    item_ids = [doc_id for doc_type, doc_id in hits if doc_type == search_index.DOC_BRIEFING]
+    news = {a.id: a for a in db.query(NewsArticle).filter(NewsArticle.id.in_(news_ids))} if news_ids else {}
+    items = {
+        i.id: i for i in db.query(BriefingNewsItem).options(joinedload(BriefingNewsItem.briefing))
+        .filter(BriefingNewsItem.id.in_(item_ids))
+    } if item_ids else {}
+
+    results = []
+    for doc_type, doc_id in hits:
+        if doc_type == search_index.DOC_NEWS and doc_id in news:
+            results.append({**_article_dict(news[doc_id]), "type": doc_type})
+        elif doc_type == search_index.DOC_BRIEFING and doc_id in items:
+            item = items[doc_id]
+            results.append({
+                "id": item.id, "title": item.title, "summary": item.summary, "image_url": None,
+                "publisher": item.publisher, "source_url": item.source_url,
+                "published_at": item.created_at.isoformat(), "tile_size": "small", "tags": [],
+                "type": doc_type, "briefing_id": item.briefing_id,
+                "briefing_date": item.briefing.briefing_date.isoformat() if item.briefing else None,
+            })
+    return results
+
+
+def _article_dict(a: NewsArticle) -> dict:
+    return {"id": a.id, "title": a.title, "summary": a.summary, "image_url": a.image_url,
+            "publisher": a.publisher, "source_url": a.source_url, "published_at": a.original_published_at.isoformat(),
+            "tile_size": a.tile_size, "tags": a.tags}
+
+
+def _encode_cursor(*values) -> str:
+    """페이지 마지막 항목의 정렬 키를 불투명 토큰으로"""
+    raw = json.dumps(list(values), separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, *types) -> list:
+    """토큰 -> 정렬 키 (types: 값별 변환 함수)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if len(values) != len(types):
+            raise ValueError(cursor)
+        return [convert(value) for convert, value in zip(types, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 cursor입니다.")
+
+
 @router.get("/{news_id}")
 async def get_news_detail(news_id: str, db: Session = Depends(get_db)):
-    article = db.query(NewsArticle).filter(NewsArticle.id == news_id).first()
+    # 인과관계/인사이트는 article_id 인덱스로 한 번씩 미리 로드 (관련 태그까지 쿼리 4번 고정)
+    article = db.query(NewsArticle).options(
+        selectinload(NewsArticle.causalities), selectinload(NewsArticle.insights)
+    ).filter(NewsArticle.id == news_id).first()
     if not article:
         raise HTTPException(status_code=404, detail="뉴스를 찾을 수 없습니다.")
     return {
-        "article": {"id": article.id, "title": article.title, "summary": article.summary, "image_url": article.image_url,
-                    "publisher": article.publisher, "source_url": article.source_url, "published_at": article.original_published_at.isoformat(),
-                    "tile_size": article.tile_size, "tags": article.tags},
+        "article": _article_dict(article),
         "recreated_content": article.recreated_content,
         "causalities": [{"cause": c.cause, "effect": c.effect, "confidence": c.confidence} for c in article.causalities],
         "insights": [{"title": i.title, "content": i.content, "type": i.insight_type, "importance": i.importance} for i in article.insights],
-        "related_tags": article.tags
+        # 함께 자주 붙은 다른 태그 (없으면 이 기사의 태그)
+        "related_tags": tag_index.related_tags(db, article.id, RELATED_TAG_LIMIT) or article.tags
     }
 
 
@@ -73,7 +212,7 @@ async def analyze_recreate(req: AnalyzeRequest):
 @router.get("/rss/fetch")
 async def fetch_rss_news(limit: int = Query(5, ge=1, le=20)):
     """RSS에서 최신 뉴스 수집 (미리보기)"""
-    return {"articles": fetch_all_feeds(limit)}
+    return {"articles": await fetch_all_feeds_async(limit)}
 
 
 @router.post("/rss/process")
@@ -0,0 +1,204 @@
+"""
+브리핑 생성 단일 실행 (single-flight)
+- 같은 날짜 생성 요청이 동시에 몰려도 한 번만 생성
+- 프로세스 안: 날짜별 진행 중 asyncio.Task를 공유 (나머지 요청은 같은 결과를 기다림)
+  생성은 요청과 분리된 태스크라 기다리던 요청(SSE 포함)이 끊겨도 계속 진행
+- 진행 이벤트(stage/item)는 Flight에 쌓아 두고 SSE 요청이 구독 (늦게 붙어도 처음부터 받음)
+- 프로세스 간: briefing_jobs 행(briefing_date unique)을 먼저 넣은 워커만 생성,
+  다른 워커는 행 상태를 폴링
+- 실패했거나 JOB_STALE_SECONDS 넘게 끝나지 않은 작업(죽은 워커)은 다음 요청이 이어받음
+- 기다리는 시간을 넘기면 JobPending (라우트에서 202 + job id)
+"""
+import asyncio
+import logging
+import os
+import socket
+from datetime import date, datetime, timedelta
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..database import SessionLocal
+from ..models.briefing import BriefingJob, DailyBriefing
+
+logger = logging.getLogger(__name__)
+
+JOB_STALE_SECONDS = 900
+POLL_INTERVAL = 1.0
+
+_OWNER = f"{socket.gethostname()}:{os.getpid()}"
+_inflight = {}  # briefing_date -> Flight
+
+
+class JobPending(Exception):
+    """기다리는 동안 생성이 끝나지 않음"""
+
+    def __init__(self, job_id: str):
+        super().__init__(job_id)
+        self.job_id = job_id
+
+
+class Flight:
+    """이 프로세스에서 진행 중인 생성 1건 (태스크 + 진행 이벤트)"""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.task = None
+        self.events = []
+        self._changed = asyncio.Event()
+
+    def emit(self, event: str, data: dict):
+        self.events.append((event, data))
+        self._changed.set()
+
+    async def follow(self):
+        """진행 이벤트를 처음부터 차례로 (생성이 끝나면 종료, 결과는 task로 확인)
+
+        구독을 끊어도(클라이언트 연결 끊김) 생성 태스크에는 영향이 없다.
+        """
+        sent = 0
+        while True:
+            while sent < len(self.events):
+                yield self.events[sent]
+                sent += 1
+            if self.task.done():
+                return
+            self._changed.clear()
+            await self._changed.wait()
+
+
+def claim(db: Session, target_date: date) -> tuple[BriefingJob, bool]:
+    """생성 권한 확보. (작업 행, 이 요청이 생성해야 하는지)"""
+    db.add(BriefingJob(briefing_date=target_date, status="running", owner=_OWNER))
+    try:
+        db.commit()
+        return db.query(BriefingJob).filter(BriefingJob.briefing_date == target_date).one(), True
+    except IntegrityError:
+        db.rollback()
+
+    job = db.query(BriefingJob).filter(BriefingJob.briefing_date == target_date).one()
+    stale_before = datetime.utcnow() - timedelta(seconds=JOB_STALE_SECONDS)
+    if job.status == "running" and job.started_at > stale_before:
+        return job, False
+    if job.status == "done" and db.query(DailyBriefing.id).filter(DailyBriefing.briefing_date == target_date).first():
+        return job, False
+
+    # 실패/중단된 작업, 또는 완료 후 브리핑이 삭제된 경우(force 재생성) 이어받기
+    # 상태와 시작 시각이 그대로일 때만 갱신 -> 동시에 이어받으려는 다른 요청과 경합해도 하나만 성공
+    taken = db.query(BriefingJob).filter(
+        BriefingJob.id == job.id,
+        BriefingJob.status == job.status,
+        BriefingJob.started_at == job.started_at,
+    ).update({
+        "status": "running", "owner": _OWNER, "briefing_id": None, "error": None,
+        "started_at": datetime.utcnow(), "finished_at": None,
+    }, synchronize_session=False)
+    db.commit()
+    db.refresh(job)
+    return job, taken == 1
+
+
+def finish(job_id: str, briefing_id: str | None = None, error: str | None = None):
+    """작업 완료/실패 기록 (실패는 아직 running인 작업에만 - 완료된 작업을 덮어쓰지 않음)"""
+    db = SessionLocal()
+    try:
+        query = db.query(BriefingJob).filter(BriefingJob.id == job_id)
+        if error:
+            query = query.filter(BriefingJob.status == "running")
+        query.update({
+            "status": "failed" if error else "done",
+            "briefing_id": briefing_id,
+            "error": error,
+            "finished_at": datetime.utcnow(),
+        }, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+async def wait_for_job(job_id: str, timeout: float | None = None) -> str:
+    """다른 워커가 생성 중인 작업을 폴링해 briefing_id 반환"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + (timeout if timeout is not None else JOB_STALE_SECONDS)
+    while True:
+        db = SessionLocal()
+        try:
+            job = db.query(BriefingJob).filter(BriefingJob.id == job_id).first()
+        finally:
+            db.close()
+        if job is None:
+            raise RuntimeError(f"브리핑 작업이 없습니다: {job_id}")
+        if job.status == "done":
+            return job.briefing_id
+        if job.status == "failed":
+            raise RuntimeError(f"브리핑 생성 실패: {job.error}")
+        if loop.time() >= deadline:
+            raise JobPending(job_id)
+        await asyncio.sleep(POLL_INTERVAL)
+
+
+async def _run(flight: Flight, generate) -> str:
+    db = SessionLocal()
+    try:
+        briefing = await generate(db, flight.emit)
+    except BaseException as e:
+        logger.exception(f"브리핑 생성 실패 (job {flight.job_id})")
+        finish(flight.job_id, error=f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        db.close()
+    finish(flight.job_id, briefing_id=briefing.id)
+    return briefing.id
+
+
+def start(target_date: date, generate) -> tuple[str, Flight | None, str | None]:
+    """날짜별로 한 번만 generate(db, emit) -> DailyBriefing을 백그라운드 태스크로 시작
+
+    (job_id, 이 프로세스에서 진행 중인 Flight, 이미 완료된 briefing_id).
+    Flight와 briefing_id가 모두 None이면 다른 워커가 생성 중 (wait_for_job으로 기다림).
+    """
+    flight = _inflight.get(target_date)
+    if flight is not None:
+        return flight.job_id, flight, None
+
+    db = SessionLocal()
+    try:
+        job, owned = claim(db, target_date)
+        job_id, status, briefing_id = job.id, job.status, job.briefing_id
+    finally:
+        db.close()
+
+    if not owned:
+        return job_id, None, briefing_id if status == "done" else None
+
+    flight = _inflight[target_date] = Flight(job_id)
+    flight.task = asyncio.create_task(_run(flight, generate))
+
+    def _done(_):
+        if _inflight.get(target_date) is flight:
+            del _inflight[target_date]
+        flight._changed.set()  # 구독 중인 follow()를 깨움
+
+    flight.task.add_done_callback(_done)
+    return job_id, flight, None
+
+
+async def run_single_flight(target_date: date, generate, wait: float | None = None) -> str:
+    """날짜별로 한 번만 생성(start)하고 끝날 때까지 기다려 briefing_id 반환
+
+    생성은 요청과 분리된 태스크에서 돌기 때문에 wait초 안에 끝나지 않아 JobPending이
+    나가도 계속 진행된다 (GET /briefing/jobs/{job_id}로 확인).
+    """
+    job_id, flight, briefing_id = start(target_date, generate)
+    if briefing_id:
+        return briefing_id
+    if flight is None:
+        return await wait_for_job(job_id, wait)
+    try:
+        # shield: 기다리던 요청이 끊겨도 생성은 계속
+        return await asyncio.wait_for(asyncio.shield(flight.task), wait)
+    except asyncio.TimeoutError:
+        raise JobPending(job_id)
+
+
+def get_job(db: Session, job_id: str) -> BriefingJob | None:
+    return db.query(BriefingJob).filter(BriefingJob.id == job_id).first()
+
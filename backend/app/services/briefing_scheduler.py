@@ -0,0 +1,135 @@
+"""
+브리핑 사전 생성 스케줄러
+- 매일 GENERATE_AT(SCHEDULE_TZ 기준, 기본 23:30 KST)에 다음 날 브리핑을 미리 생성
+  -> 날짜가 바뀌는 순간부터 /briefing/today가 바로 응답
+- 앱 시작 시 오늘 브리핑이 없으면 바로 생성, 생성 시각이 지났는데 내일 브리핑이 없으면 그것도 생성
+- 실패하면 지수 백오프로 MAX_ATTEMPTS번까지 재시도 (그래도 실패하면 /briefing/today 첫 호출이 생성)
+- 생성이 끝나면 응답 캐시(response_cache)를 미리 채움
+- 여러 워커가 함께 돌아도 briefing_jobs 행으로 한 워커만 생성 (나머지는 완료를 기다림)
+
+환경변수: BRIEFING_SCHEDULER=0 이면 끔, BRIEFING_GENERATE_AT=HH:MM, BRIEFING_TZ=Asia/Seoul
+"""
+import asyncio
+import logging
+import os
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+from sqlalchemy.orm import selectinload
+from ..database import SessionLocal
+from ..models.briefing import DailyBriefing
+from . import briefing_jobs
+
+logger = logging.getLogger(__name__)
+
+# 앱 프로세스 안에서 스케줄러 실행 여부 (끄면 /briefing/today 첫 호출 시 생성)
+RUN_IN_APP = os.getenv("BRIEFING_SCHEDULER", "1") == "1"
+
+SCHEDULE_TZ = ZoneInfo(os.getenv("BRIEFING_TZ", "Asia/Seoul"))
+GENERATE_AT = time.fromisoformat(os.getenv("BRIEFING_GENERATE_AT", "23:30"))
+
+MAX_ATTEMPTS = 5
+RETRY_DELAY = 60       # 초, 실패할 때마다 2배
+MAX_RETRY_DELAY = 1800
+
+
+def today() -> date:
+    """브리핑 기준 오늘 날짜 (서버 시간대와 무관하게 SCHEDULE_TZ 기준)"""
+    return datetime.now(SCHEDULE_TZ).date()
+
+
+def next_run_at(now: datetime) -> datetime:
+    """now 이후 첫 생성 시각 (SCHEDULE_TZ aware datetime)"""
+    local = now.astimezone(SCHEDULE_TZ)
+    run_at = datetime.combine(local.date(), GENERATE_AT, tzinfo=SCHEDULE_TZ)
+    if run_at <= local:
+        run_at += timedelta(days=1)
+    return run_at
+
+
+def target_date_for(run_at: datetime) -> date:
+    """run_at에 생성할 브리핑 날짜 (다음 날)"""
+    return run_at.astimezone(SCHEDULE_TZ).date() + timedelta(days=1)
+
+
+def _briefing_exists(target_date: date) -> bool:
+    db = SessionLocal()
+    try:
+        return db.query(DailyBriefing.id).filter(DailyBriefing.briefing_date == target_date).first() is not None
+    finally:
+        db.close()
+
+
+class BriefingScheduler:
+    """하루 한 번 브리핑 생성 루프"""
+
+    def __init__(self, max_attempts: int = MAX_ATTEMPTS, retry_delay: float = RETRY_DELAY):
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    async def generate(self, target_date: date) -> str | None:
+        """target_date 브리핑 생성 (이미 있으면 건너뜀), 실패 시 재시도. briefing_id 반환"""
+        # 순환 import 방지 (라우트가 이 모듈의 today()를 참조)
+        from ..routes.briefing import _generate_briefing_internal
+
+        for attempt in range(self.max_attempts):
+            try:
+                briefing_id = await briefing_jobs.run_single_flight(
+                    target_date, lambda session, emit: _generate_briefing_internal(target_date, session, emit=emit)
+                )
+                await self.warm(briefing_id)
+                logger.info(f"[Briefing] {target_date} 브리핑 준비 완료 ({briefing_id})")
+                return briefing_id
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if attempt + 1 >= self.max_attempts:
+                    logger.exception(f"[Briefing] {target_date} 브리핑 생성 포기 ({self.max_attempts}회 실패): {e}")
+                    return None
+                delay = min(self.retry_delay * 2 ** attempt, MAX_RETRY_DELAY)
+                logger.warning(f"[Briefing] {target_date} 브리핑 생성 실패 ({attempt + 1}회), {delay}초 후 재시도: {e!r}")
+                await asyncio.sleep(delay)
+
+    async def warm(self, briefing_id: str):
+        """생성 직후 응답 캐시 채우기 (첫 조회도 DB 조회 없이)"""
+        from ..routes.briefing import _cache_briefing
+
+        db = SessionLocal()
+        try:
+            briefing = db.query(DailyBriefing).options(selectinload(DailyBriefing.news_items)).filter(
+                DailyBriefing.id == briefing_id
+            ).first()
+            if briefing:
+                _cache_briefing(briefing)
+        finally:
+            db.close()
+
+    async def catch_up(self):
+        """오늘 브리핑이 없으면 바로 생성, 오늘 생성 시각이 지났으면 내일 브리핑도"""
+        now = datetime.now(SCHEDULE_TZ)
+        targets = [now.date()]
+        if now.time() >= GENERATE_AT:
+            targets.append(now.date() + timedelta(days=1))
+        for target_date in targets:
+            if not _briefing_exists(target_date):
+                logger.info(f"[Briefing] {target_date} 브리핑 없음 - 지금 생성")
+                await self.generate(target_date)
+
+    async def run_forever(self):
+        """취소될 때까지 매일 GENERATE_AT에 다음 날 브리핑 생성"""
+        logger.info(f"[Briefing] 브리핑 스케줄러 시작 (매일 {GENERATE_AT.strftime('%H:%M')} {SCHEDULE_TZ.key}, 다음 날 브리핑)")
+        try:
+            await self.catch_up()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(f"[Briefing] 시작 시 보충 생성 오류: {e}")
+
+        while True:
+            run_at = next_run_at(datetime.now(SCHEDULE_TZ))
+            await asyncio.sleep(max(0.0, (run_at - datetime.now(SCHEDULE_TZ)).total_seconds()))
+            try:
+                await self.generate(target_date_for(run_at))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"[Briefing] 스케줄러 루프 오류: {e}")
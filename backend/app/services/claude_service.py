@@ -1,31 +1,142 @@
+import asyncio
 import json
 import logging
-import re
-from anthropic import Anthropic
+import os
+import time
+import anthropic
+from anthropic import AsyncAnthropic
 from ..config import get_settings
-from ..prompts.templates import RECREATION_PROMPT, DAILY_SUMMARY_PROMPT
+from ..prompts.templates import (
+    RECREATION_SYSTEM, RECREATION_PROMPT, RECREATION_PROMPT_VERSION,
+    BATCH_RECREATION_SYSTEM, BATCH_RECREATION_PROMPT,
+    DAILY_SUMMARY_SYSTEM, DAILY_SUMMARY_PROMPT,
+)
+from . import copyright_validator, llm_cache, llm_json
+from .copyright_validator import SourceFingerprint
+from .fake_llm import FakeLLM
+from .instrumentation import record_llm
+from .rate_limiter import AdaptiveRateLimiter, backoff_delay
 # MVP 이후: CAUSALITY_PROMPT, INSIGHT_PROMPT
 
 settings = get_settings()
-client = Anthropic(api_key=settings.anthropic_api_key)
+# FAKE_LLM=1 이면 오프라인 가짜 클라이언트 (API 키/네트워크 없이 파이프라인 실행)
+# 재시도는 _create_message가 직접 함 (SDK 자체 재시도 끔)
+client = FakeLLM() if os.getenv("FAKE_LLM") == "1" else AsyncAnthropic(api_key=settings.anthropic_api_key, max_retries=0)
 logger = logging.getLogger(__name__)
 
+MODEL = "claude-3-haiku-20240307"
+LLM_CONCURRENCY = 4     # 시작 동시 요청 수 (오류율에 따라 1~LLM_MAX_CONCURRENCY 사이에서 조절)
+LLM_MAX_CONCURRENCY = 8
+LLM_RPM = 50            # 계정 한도에 맞출 것
+LLM_TPM = 50000
+LLM_TIMEOUT = 30.0      # 요청 1건 제한 시간 (초, 대기 시간 제외)
+MAX_API_RETRIES = 4     # 429/과부하/타임아웃 재시도 (검증 실패 재시도와 별개)
+BATCH_SIZE = 8          # 배치 재창작 요청 1건에 넣는 기사 수
+BATCH_MAX_TOKENS = 4096
+
+# 고정 system 프롬프트를 프롬프트 캐시 대상으로 표시
+# (모델별 최소 길이 미만이면 제공자가 캐시하지 않음 - Haiku 2048토큰, 결과는 cache_read_input_tokens로 확인)
+PROMPT_CACHE = True
+PROMPT_CACHE_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+limiter = AdaptiveRateLimiter(LLM_RPM, LLM_TPM, LLM_CONCURRENCY, LLM_MAX_CONCURRENCY)
+
+# 다시 보내면 되는 오류 (그 외 400/401 등은 바로 실패)
+RETRYABLE_ERRORS = (anthropic.RateLimitError, anthropic.InternalServerError,
+                    anthropic.APIConnectionError, asyncio.TimeoutError)
+
+
+def set_client(new_client):
+    """LLM 클라이언트 교체 (테스트/오프라인 재생에서 FakeLLM 주입)"""
+    global client
+    client = new_client
+
+
+RECREATION_FIELDS = ("title", "summary")
+
+# 재창작 시도별 결과 카운터 (프로세스 시작 이후, /admin/llm-outcomes)
+_outcomes = {"success": 0, "parse_failure": 0, "validation_failure": 0}
+
+
+def _count_outcome(outcome: str):
+    _outcomes[outcome] += 1
+
+
+def recreation_stats() -> dict:
+    attempts = sum(_outcomes.values())
+    return {
+        **_outcomes,
+        "attempts": attempts,
+        "success_rate": round(_outcomes["success"] / attempts, 3) if attempts else None,
+    }
+
+
+def _retry_after(error: Exception) -> float | None:
+    response = getattr(error, "response", None)
+    try:
+        return float(response.headers["retry-after"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _usage(response) -> dict:
+    """record_llm용 토큰 사용량 (프롬프트 캐시 읽기/쓰기 포함)"""
+    usage = response.usage
+    return {
+        "input_tokens": usage.input_tokens,
+        "output_tokens": usage.output_tokens,
+        "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", None) or 0,
+        "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", None) or 0,
+    }
+
+
+async def _create_message(system: str, **kwargs):
+    """Claude 요청 (고정 system 프롬프트 캐시 + 속도 제한 + 제한 시간 초과 시 취소 + 429/과부하 백오프 재시도)"""
+    if PROMPT_CACHE:
+        kwargs["system"] = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+        kwargs["extra_headers"] = PROMPT_CACHE_HEADERS
+    else:
+        kwargs["system"] = system
+
+    # 입력은 한글 1자 ~ 1토큰으로 넉넉히 추정, 응답 후 실제 사용량으로 보정
+    estimate = len(system) + sum(len(m["content"]) for m in kwargs["messages"]) + kwargs["max_tokens"] // 4
+
+    for attempt in range(MAX_API_RETRIES + 1):
+        async with limiter.slot(estimate):
+            try:
+                response = await asyncio.wait_for(client.messages.create(**kwargs), LLM_TIMEOUT)
+            except RETRYABLE_ERRORS as e:
+                error, retry_after = e, _retry_after(e)
+                if isinstance(e, anthropic.RateLimitError):
+                    limiter.on_throttled(retry_after)
+                else:
+                    limiter.on_error()
+                if attempt == MAX_API_RETRIES:
+                    raise
+            else:
+                limiter.on_success(estimate, response.usage.input_tokens + response.usage.output_tokens)
+                return response
+
+        delay = retry_after if retry_after is not None else backoff_delay(attempt)
+        logger.warning(f"Claude 요청 재시도 {attempt + 1}/{MAX_API_RETRIES} ({delay:.1f}초 후): {type(error).__name__}")
+        await asyncio.sleep(delay)
+
+
+def _response_text(response) -> str:
+    """응답의 텍스트 블록 내용 (텍스트가 없으면 ParseError - 빈 content도 파싱 실패로 처리)"""
+    text = "".join(block.text for block in response.content or () if getattr(block, "type", None) == "text")
+    if not text:
+        raise llm_json.ParseError("응답에 텍스트가 없습니다")
+    return text
+
 
 def calculate_similarity(text1: str, text2: str) -> float:
     """두 텍스트의 단어 기반 유사도 계산 (Jaccard)"""
-    if not text1 or not text2:
-        return 0.0
-    words1 = set(text1.lower().split())
-    words2 = set(text2.lower().split())
-    if not words1 or not words2:
-        return 0.0
-    intersection = words1 & words2
-    union = words1 | words2
-    return len(intersection) / len(union)
-
-
-def validate_recreation(original_text: str, recreated: dict) -> tuple[bool, str]:
-    """재작성 결과 검증 (완화된 조건)"""
+    return copyright_validator.jaccard(text1, text2)
+
+
+def validate_recreation(original_text: str, recreated: dict, fingerprint: SourceFingerprint | None = None) -> tuple[bool, str]:
+    """재작성 결과 검증 (fingerprint를 넘기면 재시도마다 원문 n-gram을 다시 만들지 않음)"""
     title = recreated.get("title", "")
     summary = recreated.get("summary", "")
 
@@ -37,77 +148,184 @@ def validate_recreation(original_text: str, recreated: dict) -> tuple[bool, str]
     if not summary or len(summary) < 20:
         return False, "요약이 너무 짧음"
 
+    report = (fingerprint or SourceFingerprint(original_text)).check(summary)
+
     # 본문 유사도 체크 (60% 이상이면 실패 - 완화)
-    summary_similarity = calculate_similarity(original_text, summary)
-    if summary_similarity > 0.6:
-        return False, f"본문 유사도 높음: {summary_similarity:.2f}"
+    if report.jaccard > copyright_validator.MAX_JACCARD:
+        return False, f"본문 유사도 높음: {report.jaccard:.2f}"
+
+    # 원문 3단어 이상 연속 복제 금지 (프롬프트 규칙)
+    if report.spans:
+        return False, f"원문 연속 복제: {', '.join(text for _, _, text in report.spans[:3])}"
 
     return True, "OK"
 
 
+def is_validated(recreated: dict | None) -> bool:
+    """validate_recreation을 통과한 재창작 결과인지 (실패 시 돌려주는 마지막 결과/기본값은 False)
+
+    검증 통과 결과만 재사용(스토리 지문, 캐시)해야 원문이 재창작인 척 퍼지지 않는다.
+    """
+    return bool(recreated) and recreated.get("validated") is True
+
+
+def _validated(result: dict) -> dict:
+    return {**{field: result[field] for field in RECREATION_FIELDS}, "validated": True}
+
+
 async def recreate_news(original_text: str, max_retries: int = 3) -> dict:
-    """뉴스 재창작 (저작권 준수, 검증 포함)"""
+    """뉴스 재창작 (저작권 준수, 검증 포함, 검증 통과 결과는 캐시)
+
+    결과의 validated가 False면 검증 실패 후의 대체 결과 (is_validated로 확인).
+    """
+    key = llm_cache.cache_key("recreate", MODEL, RECREATION_PROMPT_VERSION, original_text)
+    cached = await llm_cache.aget(key)
+    if cached:
+        record_llm("recreate", 0.0, status="cache_hit")
+        return _validated(cached)
+    return await _recreate(original_text, key, max_retries)
+
+
+async def _recreate(original_text: str, key: str, max_retries: int = 3) -> dict:
+    """캐시를 거치지 않는 단건 재창작 (파싱/검증 실패 시에만 재시도)"""
+    fingerprint = SourceFingerprint(original_text)
     last_result = None
 
     for attempt in range(max_retries + 1):
+        started = time.perf_counter()
         try:
-            response = client.messages.create(
-                model="claude-3-haiku-20240307",
+            # 응답을 "{"로 시작하게 미리 채워 JSON 객체만 받음
+            response = await _create_message(
+                RECREATION_SYSTEM,
+                model=MODEL,
                 max_tokens=2048,
-                messages=[{"role": "user", "content": RECREATION_PROMPT.format(original_text=original_text)}]
+                messages=[
+                    {"role": "user", "content": RECREATION_PROMPT.format(original_text=original_text)},
+                    {"role": "assistant", "content": "{"},
+                ]
             )
+        except Exception as e:
+            # 429/과부하는 _create_message가 백오프 재시도까지 마친 상태 -> 더 보내지 않음
+            record_llm("recreate", time.perf_counter() - started, status=type(e).__name__, attempt=attempt + 1)
+            logger.warning(f"재창작 API 오류, 재시도 중단: {type(e).__name__} {e}")
+            break
 
-            # 응답 텍스트
-            raw_text = response.content[0].text.strip()
-
-            # 정규식으로 title과 summary 직접 추출 (JSON 파싱 우회)
-            title_match = re.search(r'"title"[:\s]*"?([^"]+)"?', raw_text)
-            summary_match = re.search(r'"summary"[:\s]*"?(.+?)(?:"\s*}|$)', raw_text, re.DOTALL)
-
-            if title_match and summary_match:
-                title = title_match.group(1).strip().strip('"').strip("'")
-                summary = summary_match.group(1).strip().strip('"').strip("'")
-                # 연속 공백/줄바꿈 정리
-                summary = re.sub(r'\s+', ' ', summary)
-                result = {"title": title, "summary": summary}
-            else:
-                # 정규식 실패 시 JSON 파싱 시도
-                text = raw_text
-                if "```json" in text:
-                    text = text.split("```json")[1].split("```")[0].strip()
-                elif "```" in text:
-                    parts = text.split("```")
-                    if len(parts) >= 2:
-                        text = parts[1].strip()
-                result = json.loads(text)
+        try:
+            result = llm_json.parse_object("{" + _response_text(response), RECREATION_FIELDS)
+        except llm_json.ParseError as e:
+            outcome, reason = "parse_failure", str(e)
+        else:
             last_result = result
+            is_valid, reason = validate_recreation(original_text, result, fingerprint)
+            outcome = "success" if is_valid else "validation_failure"
 
-            # 검증
-            is_valid, reason = validate_recreation(original_text, result)
-            if is_valid:
-                return result
+        _count_outcome(outcome)
+        record_llm("recreate", time.perf_counter() - started, attempt=attempt + 1, outcome=outcome, **_usage(response))
+        if outcome == "success":
+            await llm_cache.aput_many([(key, result)], "recreate", MODEL, RECREATION_PROMPT_VERSION)
+            return _validated(result)
 
-            logger.warning(f"재창작 검증 실패 (시도 {attempt + 1}/{max_retries + 1}): {reason}")
-
-        except json.JSONDecodeError as e:
-            logger.warning(f"JSON 파싱 실패 (시도 {attempt + 1}): {e}")
-            print(f"  [DEBUG] 파싱 실패 텍스트: {text[:200] if 'text' in dir() else 'N/A'}...")
-        except Exception as e:
-            logger.warning(f"재창작 오류 (시도 {attempt + 1}): {e}")
+        logger.warning(f"재창작 {outcome} (시도 {attempt + 1}/{max_retries + 1}): {reason}")
 
     # 최대 재시도 후에도 실패하면 마지막 결과 또는 기본값 반환
     if last_result:
         logger.error(f"재창작 검증 최종 실패, 마지막 결과 사용: {original_text[:30]}...")
-        return last_result
+        return {**last_result, "validated": False}
 
     # 완전 실패 시 기본 재작성 시도
     logger.error(f"재창작 완전 실패: {original_text[:30]}...")
     return {
         "title": original_text[:50] + "..." if len(original_text) > 50 else original_text,
-        "summary": "해당 뉴스의 상세 내용은 원문을 참조해 주세요."
+        "summary": "해당 뉴스의 상세 내용은 원문을 참조해 주세요.",
+        "validated": False,
     }
 
 
+async def _recreate_chunk(original_texts: list) -> list:
+    """기사 여러 개를 요청 1건으로 재창작. 응답에 없거나 파싱 실패한 항목은 None"""
+    articles = "\n".join(f"[{i + 1}] {' '.join(text.split())}" for i, text in enumerate(original_texts))
+    started = time.perf_counter()
+    try:
+        response = await _create_message(
+            BATCH_RECREATION_SYSTEM,
+            model=MODEL,
+            max_tokens=BATCH_MAX_TOKENS,
+            messages=[
+                {"role": "user", "content": BATCH_RECREATION_PROMPT.format(count=len(original_texts), articles=articles)},
+                {"role": "assistant", "content": "["},
+            ]
+        )
+        record_llm("recreate_batch", time.perf_counter() - started, size=len(original_texts), **_usage(response))
+        parsed = {}
+        for item in llm_json.parse_array("[" + _response_text(response), ("id",) + RECREATION_FIELDS):
+            if item["id"].isdigit():
+                parsed[int(item["id"])] = {field: item[field] for field in RECREATION_FIELDS}
+    except Exception as e:
+        record_llm("recreate_batch", time.perf_counter() - started, status=type(e).__name__, size=len(original_texts))
+        logger.warning(f"배치 재창작 실패 ({len(original_texts)}건, 개별 재시도): {type(e).__name__} {e}")
+        return [None] * len(original_texts)
+    return [parsed.get(i + 1) for i in range(len(original_texts))]
+
+
+async def recreate_news_batch(original_texts: list, batch_size: int = BATCH_SIZE) -> list:
+    """여러 뉴스를 batch_size개씩 묶어 재창작 (입력 순서 유지)
+
+    캐시에 있는 기사는 요청하지 않고, 배치 결과 중 검증에 실패하거나 빠진 기사만
+    recreate_news와 같은 방식으로 하나씩 재시도한다. 항목별 검증 여부는 is_validated.
+    """
+    keys = [llm_cache.cache_key("recreate", MODEL, RECREATION_PROMPT_VERSION, text) for text in original_texts]
+    results = await llm_cache.aget_many(keys)
+    for i, cached in enumerate(results):
+        if cached:
+            record_llm("recreate", 0.0, status="cache_hit")
+            results[i] = _validated(cached)
+
+    pending = [i for i, cached in enumerate(results) if not cached]
+    chunks = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+    chunk_results = await asyncio.gather(*(_recreate_chunk([original_texts[i] for i in chunk]) for chunk in chunks))
+
+    retry, valid = [], []
+    for chunk, recreated in zip(chunks, chunk_results):
+        for i, result in zip(chunk, recreated):
+            if result is None:
+                _count_outcome("parse_failure")
+                retry.append(i)
+                continue
+            is_valid, reason = validate_recreation(original_texts[i], result)
+            if is_valid:
+                _count_outcome("success")
+                valid.append((keys[i], result))
+                results[i] = _validated(result)
+            else:
+                _count_outcome("validation_failure")
+                logger.warning(f"배치 재창작 검증 실패 (개별 재시도): {reason}")
+                retry.append(i)
+
+    await llm_cache.aput_many(valid, "recreate", MODEL, RECREATION_PROMPT_VERSION)
+
+    retried = await asyncio.gather(*(_recreate(original_texts[i], keys[i]) for i in retry))
+    for i, result in zip(retry, retried):
+        results[i] = result
+    return results
+
+
+async def iter_recreate_news_batch(original_texts: list, batch_size: int = BATCH_SIZE):
+    """batch_size개씩 나눠 동시에 재창작하고, 묶음이 끝나는 순서대로 (입력 인덱스, 결과)를 내보냄"""
+    async def run(start: int):
+        return start, await recreate_news_batch(original_texts[start:start + batch_size], batch_size)
+
+    tasks = [asyncio.create_task(run(start)) for start in range(0, len(original_texts), batch_size)]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            start, results = await finished
+            for offset, result in enumerate(results):
+                yield start + offset, result
+    finally:
+        # 소비자가 중간에 끊으면(클라이언트 연결 종료 등) 남은 요청 취소
+        for task in tasks:
+            task.cancel()
+
+
 # MVP 이후 기능 (현재 미사용)
 # async def analyze_causality(news_content: str) -> list:
 #     """인과관계 분석"""
@@ -132,9 +350,16 @@ async def recreate_news(original_text: str, max_retries: int = 3) -> dict:
 async def generate_daily_summary(news_titles: list) -> str:
     """오늘의 요약 생성 (1~2문장)"""
     titles_text = "\n".join([f"- {title}" for title in news_titles])
-    response = client.messages.create(
-        model="claude-3-haiku-20240307",
-        max_tokens=2048,
-        messages=[{"role": "user", "content": DAILY_SUMMARY_PROMPT.format(news_titles=titles_text)}]
-    )
-    return response.content[0].text.strip()
+    started = time.perf_counter()
+    try:
+        response = await _create_message(
+            DAILY_SUMMARY_SYSTEM,
+            model=MODEL,
+            max_tokens=2048,
+            messages=[{"role": "user", "content": DAILY_SUMMARY_PROMPT.format(news_titles=titles_text)}]
+        )
+    except Exception as e:
+        record_llm("daily_summary", time.perf_counter() - started, status=type(e).__name__)
+        raise
+    record_llm("daily_summary", time.perf_counter() - started, **_usage(response))
+    return _response_text(response).strip()
@@ -0,0 +1,136 @@
+"""
+저작권 검증 엔진 (원문 n-gram 지문)
+- 원문의 단어 n-gram / 문자 n-gram을 한 번만 해시 집합으로 만들고
+- 재창작 텍스트는 한 번 순회로 검사 (원문 길이와 무관하게 선형 시간)
+  1. 연속 단어 복제: 원문과 같은 n단어 연속 구간 (기본 3단어, 프롬프트 규칙과 동일)
+  2. 단어 집합 Jaccard (기존 calculate_similarity와 같은 계산)
+  3. 문자 n-gram 겹침 비율 (조사 붙은 한국어 문장 베끼기 탐지용 참고 지표)
+  4. 출처 정보 (source_url, publisher)
+- 겹친 구간을 원문 그대로의 문장 조각으로 보고
+
+DB에 의존하지 않음 (tests/test_copyright.py, scripts/audit_copyright.py에서도 사용).
+"""
+import re
+
+MAX_CONSECUTIVE_WORDS = 3   # 이 길이 이상 연속으로 같으면 복제
+MAX_JACCARD = 0.6           # 단어 집합 유사도 상한
+CHAR_NGRAM = 5
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _word_spans(text: str) -> list:
+    """소문자 단어와 원문 위치 [(word, start, end)]"""
+    return [(m.group().lower(), m.start(), m.end()) for m in _WORD_RE.finditer(text or "")]
+
+
+def _char_ngrams(text: str, n: int = CHAR_NGRAM) -> set:
+    compact = "".join((text or "").lower().split())
+    if len(compact) < n:
+        return {compact} if compact else set()
+    return {hash(compact[i:i + n]) for i in range(len(compact) - n + 1)}
+
+
+def jaccard(text1: str, text2: str) -> float:
+    """단어(공백 분리) 집합 Jaccard"""
+    words1 = set((text1 or "").lower().split())
+    words2 = set((text2 or "").lower().split())
+    if not words1 or not words2:
+        return 0.0
+    return len(words1 & words2) / len(words1 | words2)
+
+
+def check_source(data: dict) -> bool:
+    """출처 정보(source_url, publisher)가 모두 있는지"""
+    return all(data.get(field) for field in ("source_url", "publisher"))
+
+
+class OverlapReport:
+    """재창작 텍스트 1건의 검사 결과"""
+
+    def __init__(self, spans: list, jaccard: float, char_overlap: float, source_ok: bool | None = None):
+        self.spans = spans              # [(start, end, 재창작 텍스트 조각)]
+        self.jaccard = jaccard
+        self.char_overlap = char_overlap
+        self.source_ok = source_ok      # 출처를 검사하지 않았으면 None
+
+    @property
+    def errors(self) -> list:
+        errors = []
+        if self.spans:
+            errors.append(f"{MAX_CONSECUTIVE_WORDS}단어 이상 연속 복제 {len(self.spans)}곳")
+        if self.jaccard > MAX_JACCARD:
+            errors.append(f"본문 유사도 높음: {self.jaccard:.2f}")
+        if self.source_ok is False:
+            errors.append("출처 정보 누락")
+        return errors
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> dict:
+        return {
+            "valid": self.valid,
+            "errors": self.errors,
+            "copied_spans": [text for _, _, text in self.spans],
+            "jaccard": round(self.jaccard, 3),
+            "char_overlap": round(self.char_overlap, 3),
+        }
+
+
+class SourceFingerprint:
+    """원문 1건의 n-gram 지문 (재창작 시도마다 재사용)"""
+
+    def __init__(self, original: str, max_consecutive: int = MAX_CONSECUTIVE_WORDS):
+        self.original = original or ""
+        self.n = max_consecutive
+        words = [w for w, _, _ in _word_spans(self.original)]
+        self._word_ngrams = {tuple(words[i:i + self.n]) for i in range(len(words) - self.n + 1)}
+        self._char_ngrams = _char_ngrams(self.original)
+
+    def copied_spans(self, text: str) -> list:
+        """원문과 같은 n단어 연속 구간 (겹치는 구간은 합침) [(start, end, 조각)]"""
+        spans = _word_spans(text)
+        merged = []
+        for i in range(len(spans) - self.n + 1):
+            if tuple(w for w, _, _ in spans[i:i + self.n]) not in self._word_ngrams:
+                continue
+            start, end = spans[i][1], spans[i + self.n - 1][2]
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = end
+            else:
+                merged.append([start, end])
+        return [(start, end, text[start:end]) for start, end in merged]
+
+    def char_overlap(self, text: str) -> float:
+        """재창작 문자 n-gram 중 원문에도 있는 비율"""
+        grams = _char_ngrams(text)
+        if not grams:
+            return 0.0
+        return len(grams & self._char_ngrams) / len(grams)
+
+    def check(self, text: str, source: dict | None = None) -> OverlapReport:
+        """연속 복제 + Jaccard + 문자 겹침 (+ source를 주면 출처) 한 번에 검사"""
+        return OverlapReport(
+            spans=self.copied_spans(text),
+            jaccard=jaccard(self.original, text),
+            char_overlap=self.char_overlap(text),
+            source_ok=check_source(source) if source is not None else None,
+        )
+
+
+def audit(pairs) -> dict:
+    """(id, 원문, 재창작 텍스트, 출처 dict) 묶음을 일괄 검사
+
+    Returns:
+        {"checked": n, "violations": [{"id", "errors", "copied_spans", ...}]}
+    """
+    checked = 0
+    violations = []
+    for item_id, original, text, source in pairs:
+        report = SourceFingerprint(original).check(text, source)
+        checked += 1
+        if not report.valid:
+            violations.append({"id": item_id, **report.to_dict()})
+    return {"checked": checked, "violations": violations}
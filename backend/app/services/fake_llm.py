@@ -0,0 +1,105 @@
+"""
+오프라인용 가짜 LLM 클라이언트
+- AsyncAnthropic의 messages.create와 같은 모양의 응답을 돌려줌 (API 키/네트워크 불필요)
+- 재창작(단건/배치), 오늘의 요약 프롬프트를 알아보고 검증을 통과하는 결정적 응답 생성
+- FAKE_LLM=1 환경변수 또는 claude_service.set_client(FakeLLM())로 사용
+
+latency로 응답 지연을, fail_every로 N번째 요청마다 API 오류(fail_status, 429면 retry_after 헤더 포함)를
+흉내낼 수 있다.
+"""
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+import anthropic
+import httpx
+
+_BATCH_ITEM_RE = re.compile(r"^\[(\d+)\]\s*(.+)$", re.MULTILINE)
+
+
+def _api_error(status: int, retry_after: float | None, call: int) -> anthropic.APIStatusError:
+    """실제 SDK와 같은 예외 타입 (429 -> RateLimitError, 5xx -> InternalServerError)"""
+    headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(status, headers=headers, request=request)
+    error_class = anthropic.RateLimitError if status == 429 else (
+        anthropic.InternalServerError if status >= 500 else anthropic.APIStatusError
+    )
+    return error_class(f"fake error {status} (call {call})", response=response, body=None)
+
+
+def _recreation(text: str) -> dict:
+    # 원문 단어를 쓰지 않는 고정 문장 (validate_recreation 통과용), 길이만 원문에 비례
+    topic = len(text.split())
+    return {
+        "title": f"오늘의 주요 소식 정리 ({topic})",
+        "summary": "관련 기관이 최근 상황을 점검했습니다. 이에 따라 새로운 조치가 나왔습니다. "
+                   "시장과 가계에 변화가 예상됩니다.",
+    }
+
+
+class _Messages:
+    def __init__(self, owner: "FakeLLM"):
+        self._owner = owner
+
+    async def create(self, *, model: str, max_tokens: int, messages: list, system=None, **kwargs):
+        owner = self._owner
+        owner.calls += 1
+        if owner.latency:
+            await asyncio.sleep(owner.latency)
+        if owner.fail_every and owner.calls % owner.fail_every == 0:
+            raise _api_error(owner.fail_status, owner.retry_after, owner.calls)
+
+        # 마지막이 assistant면 응답 앞부분을 미리 채운 것 -> 그 뒤부터 돌려줌
+        prefill = messages[-1]["content"] if messages[-1]["role"] == "assistant" else ""
+        prompt = next(m["content"] for m in reversed(messages) if m["role"] == "user")
+        if isinstance(prompt, list):  # content 블록 형식
+            prompt = "".join(block.get("text", "") for block in prompt)
+
+        if "원문 목록" in prompt:
+            body = prompt.split("원문 목록", 1)[1]
+            items = [{"id": int(n), **_recreation(t)} for n, t in _BATCH_ITEM_RE.findall(body)]
+            text = json.dumps(items, ensure_ascii=False)
+        elif "원문:" in prompt:
+            original = prompt.split("원문:", 1)[1].split("JSON 형식으로", 1)[0]
+            text = json.dumps(_recreation(original), ensure_ascii=False)
+        else:
+            text = "여러 분야에서 변화의 흐름이 이어지고 있다"
+        if prefill and text.startswith(prefill):
+            text = text[len(prefill):]
+
+        # cache_control이 붙은 system은 두 번째 요청부터 캐시 읽기로 집계
+        cached_prefix = 0
+        cache_created = 0
+        if isinstance(system, list):
+            prefix = "".join(block["text"] for block in system)
+            if prefix in owner.cached_prefixes:
+                cached_prefix = len(prefix) // 2
+            else:
+                owner.cached_prefixes.add(prefix)
+                cache_created = len(prefix) // 2
+        elif system:
+            prompt = system + prompt
+
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=text)],
+            usage=SimpleNamespace(input_tokens=len(prompt) // 2, output_tokens=len(text) // 2,
+                                  cache_read_input_tokens=cached_prefix,
+                                  cache_creation_input_tokens=cache_created),
+            stop_reason="end_turn",
+            model=model,
+        )
+
+
+class FakeLLM:
+    """AsyncAnthropic 대역"""
+
+    def __init__(self, latency: float = 0.0, fail_every: int = 0, fail_status: int = 529,
+                 retry_after: float | None = None):
+        self.latency = latency
+        self.fail_every = fail_every
+        self.fail_status = fail_status
+        self.retry_after = retry_after
+        self.calls = 0
+        self.cached_prefixes = set()
+        self.messages = _Messages(self)
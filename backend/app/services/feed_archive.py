@@ -0,0 +1,72 @@
+"""
+RSS 원본 스냅샷 아카이브
+- 수집한 피드 응답 본문을 날짜별 디렉토리에 gzip으로 저장
+- 저장된 스냅샷을 네트워크 없이 재생 (재현/성능 측정용)
+
+디렉토리 구조: {ARCHIVE_DIR}/{YYYY-MM-DD}/{HHMMSS}_{feed_name}.xml.gz
+스냅샷 ID: "YYYY-MM-DD" (그날 피드별 마지막 응답)
+          "YYYY-MM-DDTHHMMSS" (그 시각까지의 피드별 마지막 응답)
+"""
+import gzip
+from datetime import datetime
+from pathlib import Path
+
+ARCHIVE_DIR = Path(__file__).resolve().parents[2] / "data" / "feed_archive"
+COMPRESS_LEVEL = 6
+
+
+def save_snapshot(feed_name: str, content: bytes, fetched_at: datetime | None = None) -> Path:
+    """피드 응답 본문 저장"""
+    fetched_at = fetched_at or datetime.now()
+    day_dir = ARCHIVE_DIR / fetched_at.strftime("%Y-%m-%d")
+    day_dir.mkdir(parents=True, exist_ok=True)
+
+    path = day_dir / f"{fetched_at.strftime('%H%M%S')}_{feed_name}.xml.gz"
+    with gzip.open(path, "wb", compresslevel=COMPRESS_LEVEL) as f:
+        f.write(content)
+    return path
+
+
+def list_snapshots() -> list:
+    """저장된 날짜 목록 (최신순)"""
+    if not ARCHIVE_DIR.exists():
+        return []
+    return sorted((p.name for p in ARCHIVE_DIR.iterdir() if p.is_dir()), reverse=True)
+
+
+def _parse_snapshot_id(snapshot: str) -> tuple[str, str]:
+    """스냅샷 ID -> (날짜 디렉토리, 기준 시각 HHMMSS)"""
+    day, _, cutoff = snapshot.partition("T")
+    datetime.strptime(day, "%Y-%m-%d")  # 형식 검증
+    if cutoff:
+        datetime.strptime(cutoff, "%H%M%S")
+    return day, cutoff or "235959"
+
+
+def snapshot_exists(snapshot: str) -> bool:
+    """스냅샷 ID가 올바르고 해당 날짜 디렉토리가 있는지"""
+    try:
+        day, _ = _parse_snapshot_id(snapshot)
+    except ValueError:
+        return False
+    return (ARCHIVE_DIR / day).is_dir()
+
+
+def load_snapshot(snapshot: str) -> dict:
+    """스냅샷의 피드별 원본 본문 {feed_name: bytes}"""
+    day, cutoff = _parse_snapshot_id(snapshot)
+    day_dir = ARCHIVE_DIR / day
+    if not day_dir.is_dir():
+        raise FileNotFoundError(f"스냅샷 없음: {snapshot}")
+
+    latest = {}
+    for path in sorted(day_dir.glob("*.xml.gz")):
+        stamp, _, feed_name = path.name[:-len(".xml.gz")].partition("_")
+        if stamp <= cutoff:
+            latest[feed_name] = path  # 정렬 순서상 마지막이 최신
+
+    contents = {}
+    for feed_name, path in latest.items():
+        with gzip.open(path, "rb") as f:
+            contents[feed_name] = f.read()
+    return contents
@@ -0,0 +1,140 @@
+"""
+스트리밍 RSS/Atom 파서
+- 청크 단위 증분 XML 파싱 (문서 전체를 만들지 않음)
+- 새 항목 limit개를 내보내면 즉시 중단
+- 요약 HTML 정리를 같은 패스에서 처리
+- 기사 dict 정리(build_article)는 rss_service의 feedparser 대체 경로와 공용
+"""
+import html
+import re
+from xml.etree.ElementTree import XMLPullParser
+
+# 항목 태그 (RSS 2.0 / RSS 1.0 / Atom)
+ITEM_TAGS = {"item", "entry"}
+# 피드 제목을 담는 부모 태그
+CHANNEL_TAGS = {"channel", "feed"}
+# 요약으로 쓰는 태그 (앞쪽이 우선)
+SUMMARY_TAGS = ("description", "summary", "content", "encoded")
+PUBLISHED_TAGS = ("pubDate", "published", "date", "updated")
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def clean_html(text: str) -> str:
+    """HTML 태그 제거 + 엔티티 해제 + 공백 정리"""
+    if not text:
+        return ""
+    text = _TAG_RE.sub(" ", text)
+    text = html.unescape(text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def build_article(title: str, summary: str, link: str, published: str, publisher: str, guid: str) -> dict:
+    """두 파서(스트리밍/feedparser) 공통 기사 dict - 제목/요약 HTML 정리, nbsp 등 공백 정리"""
+    return {
+        "title": clean_html(title),
+        "summary": clean_html(summary),
+        "source_url": (link or "").strip(),
+        "published_at": (published or "").strip(),
+        "publisher": clean_html(publisher) or "Unknown",
+        "guid": (guid or "").strip(),
+    }
+
+
+def _local(tag: str) -> str:
+    """네임스페이스 제거한 태그명"""
+    return tag.rsplit("}", 1)[-1] if "}" in tag else tag
+
+
+class FeedStreamParser:
+    """청크를 받아 완성된 기사 dict를 돌려주는 증분 파서
+
+    limit개의 새 항목(seen에 없는 GUID)을 내보내면 done이 된다.
+    XML 오류 시 ParseError를 그대로 던지므로 호출자가 대체 파서로 넘긴다.
+    """
+
+    def __init__(self, limit: int | None = None, seen: set | None = None):
+        self.limit = limit
+        self.seen = seen or set()
+        self.publisher = "Unknown"
+        self.emitted = 0
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._stack = []
+        self._item = None
+
+    @property
+    def done(self) -> bool:
+        return self.limit is not None and self.emitted >= self.limit
+
+    def feed(self, chunk: bytes) -> list:
+        """청크를 파싱하고 이번에 완성된 새 기사 목록 반환"""
+        if self.done:
+            return []
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> list:
+        """입력 종료 처리"""
+        if self.done:
+            return []
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> list:
+        articles = []
+        for event, elem in self._parser.read_events():
+            name = _local(elem.tag)
+
+            if event == "start":
+                self._stack.append(name)
+                if name in ITEM_TAGS:
+                    self._item = {}
+                continue
+
+            self._stack.pop()
+
+            if self._item is not None:
+                if name in ITEM_TAGS:
+                    article = self._build(self._item)
+                    self._item = None
+                    elem.clear()
+                    if article is None:
+                        continue
+                    articles.append(article)
+                    self.emitted += 1
+                    if self.done:
+                        break
+                elif name == "link":
+                    # Atom은 href 속성, RSS는 본문
+                    link = elem.get("href") or (elem.text or "").strip()
+                    if link and (elem.get("rel") in (None, "alternate")):
+                        self._item.setdefault("link", link)
+                elif name not in self._item:
+                    self._item[name] = elem.text or ""
+            elif name == "title" and self._stack and self._stack[-1] in CHANNEL_TAGS:
+                self.publisher = (elem.text or "").strip() or self.publisher
+        return articles
+
+    def _build(self, item: dict) -> dict | None:
+        title = clean_html(item.get("title", ""))
+        link = item.get("link", "")
+        guid = (item.get("guid") or item.get("id") or link or title).strip()
+        if guid in self.seen:
+            return None
+        self.seen.add(guid)
+
+        summary = next((item[t] for t in SUMMARY_TAGS if item.get(t)), "")
+        published = next((item[t] for t in PUBLISHED_TAGS if item.get(t)), "")
+        return build_article(title, summary, link, published, self.publisher, guid)
+
+
+def iter_feed_entries(chunks, limit: int | None = None, seen: set | None = None):
+    """청크 iterable에서 새 기사 dict를 순서대로 yield (limit개 후 중단)"""
+    parser = FeedStreamParser(limit, seen)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+    yield from parser.close()
+
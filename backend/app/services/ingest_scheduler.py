@@ -0,0 +1,252 @@
+"""
+백그라운드 RSS 수집 스케줄러
+- 피드마다 자체 폴링 간격으로 조건부 수집
+- 새 항목이 자주 나오면 간격 단축, 없으면 연장
+- 연속 실패 시 지수 백오프
+- 새 항목은 raw_articles 스테이징 테이블에 저장
+- uvicorn 워커가 여럿이어도 scheduler_leases 행(LEASE_NAME)을 잡은 프로세스만 폴링
+
+환경변수: INGEST_SCHEDULER=0 이면 앱 안에서 실행하지 않음 (scripts/run_ingest_worker.py 사용)
+"""
+import asyncio
+import logging
+import os
+import socket
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..database import SessionLocal
+from ..models.feed import FeedState, RawArticle, SchedulerLease
+from .instrumentation import start_run, stage, record_feed
+from .rss_service import (
+    RSS_FEEDS, FETCH_CONCURRENCY, create_http_client, fetch_rss_conditional,
+    fetch_all_feeds_async, load_feed_states, load_snapshot_articles,
+)
+
+logger = logging.getLogger(__name__)
+
+# 앱 프로세스 안에서 스케줄러 실행 여부 (별도 워커 사용 시 INGEST_SCHEDULER=0)
+RUN_IN_APP = os.getenv("INGEST_SCHEDULER", "1") == "1"
+
+# 폴링 실행권 (보유 프로세스가 매 틱 갱신, 죽으면 LEASE_SECONDS 뒤 다른 프로세스가 이어받음)
+LEASE_NAME = "ingest"
+LEASE_SECONDS = 120
+_OWNER = f"{socket.gethostname()}:{os.getpid()}"
+
+# 폴링 간격 (초)
+DEFAULT_POLL_INTERVAL = 600
+MIN_POLL_INTERVAL = 120
+MAX_POLL_INTERVAL = 3600
+MAX_BACKOFF_INTERVAL = 6 * 3600
+INTERVAL_SHRINK = 0.7  # 새 항목이 있을 때
+INTERVAL_GROW = 1.5    # 새 항목이 없을 때
+
+TICK_SECONDS = 30            # 도래한 피드 확인 주기
+MAX_ENTRIES_PER_POLL = 50    # 한 번의 폴링에서 저장할 최대 항목 수
+RAW_RETENTION_DAYS = 7       # 스테이징 보관 기간
+
+# 브리핑 후보 풀
+POOL_WINDOW_HOURS = 24
+MIN_POOL_SIZE = 30  # 이보다 적으면 실시간 수집으로 대체
+
+
+def next_interval(state: FeedState, new_count: int) -> int:
+    """수집 결과에 따라 다음 폴링 간격 계산"""
+    interval = state.poll_interval or DEFAULT_POLL_INTERVAL
+    if new_count > 0:
+        interval *= INTERVAL_SHRINK
+    else:
+        interval *= INTERVAL_GROW
+    return int(min(max(interval, MIN_POLL_INTERVAL), MAX_POLL_INTERVAL))
+
+
+def backoff_interval(state: FeedState) -> int:
+    """연속 실패 횟수에 따른 재시도 간격"""
+    interval = (state.poll_interval or DEFAULT_POLL_INTERVAL) * (2 ** state.failure_count)
+    return int(min(interval, MAX_BACKOFF_INTERVAL))
+
+
+def acquire_lease(db: Session, now: datetime, name: str = LEASE_NAME) -> bool:
+    """실행권 확보/갱신 (이미 가진 경우 또는 만료된 경우에만 성공)"""
+    expires_at = now + timedelta(seconds=LEASE_SECONDS)
+    db.add(SchedulerLease(name=name, owner=_OWNER, expires_at=expires_at))
+    try:
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+
+    # 소유자/만료 조건부 갱신 -> 동시에 이어받으려는 프로세스 중 하나만 성공
+    taken = db.query(SchedulerLease).filter(
+        SchedulerLease.name == name,
+        (SchedulerLease.owner == _OWNER) | (SchedulerLease.expires_at < now),
+    ).update({"owner": _OWNER, "expires_at": expires_at}, synchronize_session=False)
+    db.commit()
+    return taken == 1
+
+
+def store_raw_articles(db: Session, feed_name: str, articles: list) -> int:
+    """새 기사를 스테이징 테이블에 저장 (이미 있는 GUID는 무시)"""
+    if not articles:
+        return 0
+
+    guids = [a["guid"] for a in articles]
+    existing = {
+        g for (g,) in db.query(RawArticle.guid).filter(
+            RawArticle.feed_name == feed_name, RawArticle.guid.in_(guids)
+        )
+    }
+
+    stored = 0
+    for article in articles:
+        if article["guid"] in existing:
+            continue
+        existing.add(article["guid"])
+        db.add(RawArticle(
+            feed_name=feed_name,
+            guid=article["guid"],
+            title=article["title"],
+            summary=article["summary"],
+            source_url=article["source_url"],
+            publisher=article["publisher"],
+            published_at=article["published_at"],
+        ))
+        stored += 1
+    return stored
+
+
+def evict_raw_articles(db: Session, now: datetime) -> int:
+    """보관 기간이 지난 스테이징 기사 삭제"""
+    cutoff = now - timedelta(days=RAW_RETENTION_DAYS)
+    return db.query(RawArticle).filter(RawArticle.fetched_at < cutoff).delete(synchronize_session=False)
+
+
+def load_staged_articles(db: Session, limit_per_feed: int = 10, window_hours: int = POOL_WINDOW_HOURS) -> list:
+    """최근 수집된 기사를 피드별 최신순 limit_per_feed개씩 반환"""
+    since = datetime.utcnow() - timedelta(hours=window_hours)
+    ranked = db.query(
+        RawArticle.id,
+        func.row_number().over(
+            partition_by=RawArticle.feed_name, order_by=RawArticle.fetched_at.desc()
+        ).label("rank"),
+    ).filter(RawArticle.fetched_at >= since).subquery()
+
+    rows = db.query(RawArticle).join(ranked, RawArticle.id == ranked.c.id).filter(
+        ranked.c.rank <= limit_per_feed
+    ).all()
+
+    # 실시간 수집과 같은 순서 (피드 정의 순서, 피드 내 최신순)
+    feed_order = {name: i for i, name in enumerate(RSS_FEEDS)}
+    rows.sort(key=lambda r: (feed_order.get(r.feed_name, len(feed_order)), -r.fetched_at.timestamp()))
+    return [r.to_dict() for r in rows]
+
+
+async def collect_articles(db: Session, limit_per_feed: int = 10, snapshot: str | None = None) -> list:
+    """브리핑 후보 수집: 스테이징 풀 우선, 부족하면 실시간 수집
+
+    snapshot을 지정하면 feed_archive의 저장본만 사용한다 (네트워크 없음).
+    """
+    if snapshot:
+        return load_snapshot_articles(snapshot, limit_per_feed)
+
+    articles = load_staged_articles(db, limit_per_feed)
+    if len(articles) >= MIN_POOL_SIZE:
+        return articles
+
+    logger.info(f"스테이징 풀 부족({len(articles)}개) - 실시간 수집으로 대체")
+    return await fetch_all_feeds_async(limit_per_feed)
+
+
+class IngestScheduler:
+    """피드별 적응형 폴링 루프"""
+
+    def __init__(self, concurrency: int = FETCH_CONCURRENCY, tick_seconds: int = TICK_SECONDS):
+        self.concurrency = concurrency
+        self.tick_seconds = tick_seconds
+
+    async def poll_due_feeds(self) -> dict:
+        """폴링 시각이 된 피드를 수집하고 피드별 새 항목 수 반환"""
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            if not acquire_lease(db, now):
+                return {}
+            states = load_feed_states(db)
+            due = [
+                s for name, s in states.items()
+                if name in RSS_FEEDS and (s.next_poll_at is None or s.next_poll_at <= now)
+            ]
+            if not due:
+                db.commit()
+                return {}
+
+            async with start_run("ingest", feeds=len(due)):
+                results = await self._poll(db, due, now)
+
+            total = sum(results.values())
+            if total:
+                logger.info(f"[Ingest] 새 기사 {total}개 저장 ({len(due)}개 피드 폴링)")
+            return results
+        finally:
+            db.close()
+
+    async def _poll(self, db: Session, due: list, now: datetime) -> dict:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = {}
+
+        with stage("ingest.fetch", len(due)) as st:
+            async with create_http_client(self.concurrency) as client:
+                async def _poll_one(state: FeedState):
+                    async with semaphore:
+                        started = time.perf_counter()
+                        try:
+                            articles = await fetch_rss_conditional(client, state, MAX_ENTRIES_PER_POLL)
+                        except Exception as e:
+                            record_feed(state.feed_name, time.perf_counter() - started, 0, status=type(e).__name__)
+                            state.failure_count = (state.failure_count or 0) + 1
+                            delay = backoff_interval(state)
+                            state.next_poll_at = datetime.utcnow() + timedelta(seconds=delay)
+                            logger.warning(
+                                f"[Ingest] {state.feed_name} 수집 실패 ({state.failure_count}회 연속, "
+                                f"{delay}초 후 재시도): {e!r}"
+                            )
+                            return
+                        record_feed(state.feed_name, time.perf_counter() - started, len(articles))
+                        results[state.feed_name] = articles
+
+                await asyncio.gather(*(_poll_one(s) for s in due))
+            st.set_output(len(results))
+            st.drop("fetch_error", len(due) - len(results))
+
+        # DB 쓰기는 수집이 끝난 뒤 한 번에
+        with stage("ingest.store", sum(len(a) for a in results.values())) as st:
+            for state in due:
+                if state.feed_name not in results:
+                    continue
+                articles = results[state.feed_name]
+                stored = store_raw_articles(db, state.feed_name, articles)
+                state.poll_interval = next_interval(state, stored)
+                state.next_poll_at = datetime.utcnow() + timedelta(seconds=state.poll_interval)
+                state.failure_count = 0
+                if stored:
+                    state.last_new_at = now
+                results[state.feed_name] = stored
+            st.set_output(sum(results.values()))
+
+            evict_raw_articles(db, now)
+            db.commit()
+        return results
+
+    async def run_forever(self):
+        """취소될 때까지 주기적으로 폴링"""
+        logger.info("[Ingest] 수집 스케줄러 시작")
+        while True:
+            try:
+                await self.poll_due_feeds()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"[Ingest] 폴링 루프 오류: {e}")
+            await asyncio.sleep(self.tick_seconds)
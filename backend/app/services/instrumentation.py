@@ -0,0 +1,190 @@
+"""
+파이프라인 계측
+- 실행(run) 단위로 단계별 소요시간, 입출력 건수, 제외 사유를 기록
+- 피드별 수집 지연, LLM 호출별 지연도 같은 실행에 기록
+- 실행이 끝나면 pipeline_runs 테이블에 저장 (/admin/runs 에서 조회, DB 쓰기는 스레드에서)
+- 실행 중이 아니거나 ENABLED=False면 모든 기록 함수는 아무것도 하지 않음
+"""
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from ..database import SessionLocal
+from ..models.pipeline_run import PipelineRun
+
+logger = logging.getLogger(__name__)
+
+ENABLED = True
+MAX_STORED_RUNS = 1000  # 종류(kind)별로 이보다 오래된 실행 기록은 삭제 (잦은 ingest가 briefing 기록을 밀어내지 않게)
+
+_current_run: ContextVar["RunRecorder | None"] = ContextVar("pipeline_run", default=None)
+
+
+class StageRecord:
+    """단계 하나의 기록"""
+
+    def __init__(self, name: str, input_count: int | None = None):
+        self.name = name
+        self.input = input_count
+        self.output = None
+        self.drops = {}
+        self.duration_ms = None
+
+    def set_output(self, count: int):
+        self.output = count
+
+    def drop(self, reason: str, count: int = 1):
+        if count:
+            self.drops[reason] = self.drops.get(reason, 0) + count
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "duration_ms": self.duration_ms,
+            "input": self.input,
+            "output": self.output,
+            "drops": self.drops,
+        }
+
+
+class _NullStage:
+    """계측이 꺼져 있을 때 쓰는 빈 단계"""
+
+    def set_output(self, count: int):
+        pass
+
+    def drop(self, reason: str, count: int = 1):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class RunRecorder:
+    """실행 1회의 계측 기록"""
+
+    def __init__(self, kind: str, meta: dict | None = None):
+        self.kind = kind
+        self.meta = meta or {}
+        self.stages = []
+        self.feeds = []
+        self.llm_calls = []
+        self.status = "ok"
+        self.started_at = datetime.utcnow()
+        self._started = time.perf_counter()
+        self.duration_ms = None
+
+    @contextmanager
+    def stage(self, name: str, input_count: int | None = None):
+        record = StageRecord(name, input_count)
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            self.stages.append(record)
+            logger.info(
+                f"[{self.kind}] {name}: {record.duration_ms}ms "
+                f"({record.input if record.input is not None else '-'} -> "
+                f"{record.output if record.output is not None else '-'})"
+                + (f" 제외 {record.drops}" if record.drops else "")
+            )
+
+    def finish(self, status: str = "ok"):
+        self.status = status
+        self.duration_ms = round((time.perf_counter() - self._started) * 1000, 2)
+
+    def to_model(self) -> PipelineRun:
+        return PipelineRun(
+            kind=self.kind,
+            status=self.status,
+            meta=self.meta,
+            stages=[s.to_dict() for s in self.stages],
+            feeds=self.feeds,
+            llm_calls=self.llm_calls,
+            duration_ms=self.duration_ms,
+            started_at=self.started_at,
+        )
+
+
+def _save(recorder: RunRecorder):
+    db = SessionLocal()
+    try:
+        db.add(recorder.to_model())
+        db.flush()  # autoflush=False - 방금 기록도 개수에 포함
+        # 같은 종류의 오래된 기록 정리 ((kind, started_at) 인덱스)
+        stale = db.query(PipelineRun.id).filter(PipelineRun.kind == recorder.kind).order_by(
+            PipelineRun.started_at.desc()
+        ).offset(MAX_STORED_RUNS)
+        db.query(PipelineRun).filter(PipelineRun.id.in_(stale.scalar_subquery())).delete(synchronize_session=False)
+        db.commit()
+    except Exception as e:
+        logger.warning(f"실행 기록 저장 실패 ({recorder.kind}): {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def start_run(kind: str, **meta):
+    """계측 실행 시작 (async with). 블록 안의 stage/record_* 호출이 이 실행에 기록됨
+
+    기록 저장(INSERT + 오래된 기록 정리)은 이벤트 루프를 막지 않도록 스레드에서 한다.
+    """
+    if not ENABLED:
+        yield None
+        return
+
+    recorder = RunRecorder(kind, meta)
+    token = _current_run.set(recorder)
+    status = "ok"
+    try:
+        yield recorder
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        _current_run.reset(token)
+        recorder.finish(status)
+        await asyncio.to_thread(_save, recorder)
+
+
+def current_run() -> RunRecorder | None:
+    return _current_run.get()
+
+
+@contextmanager
+def stage(name: str, input_count: int | None = None):
+    """현재 실행에 단계 기록 (실행 중이 아니면 빈 단계)"""
+    recorder = _current_run.get()
+    if recorder is None:
+        yield _NULL_STAGE
+        return
+    with recorder.stage(name, input_count) as record:
+        yield record
+
+
+def record_feed(name: str, latency: float, count: int, status: str = "ok"):
+    """피드 수집 1건 기록 (latency: 초)"""
+    recorder = _current_run.get()
+    if recorder is not None:
+        recorder.feeds.append({
+            "name": name,
+            "latency_ms": round(latency * 1000, 1),
+            "count": count,
+            "status": status,
+        })
+
+
+def record_llm(kind: str, latency: float, status: str = "ok", **extra):
+    """LLM 호출 1건 기록 (latency: 초)"""
+    recorder = _current_run.get()
+    if recorder is not None:
+        recorder.llm_calls.append({
+            "kind": kind,
+            "latency_ms": round(latency * 1000, 1),
+            "status": status,
+            **extra,
+        })
@@ -0,0 +1,62 @@
+"""
+Aho-Corasick 다중 키워드 매처
+- 키워드 표로 오토마톤을 한 번만 만들고
+- 텍스트 한 번 순회로 등장한 모든 키워드를 찾음
+"""
+from collections import deque
+
+
+class KeywordMatcher:
+    """여러 키워드를 한 번에 찾는 Aho-Corasick 오토마톤"""
+
+    def __init__(self, keywords):
+        self.keywords = list(dict.fromkeys(keywords))  # 순서 유지 중복 제거
+        self._goto = [{}]      # 상태별 전이
+        self._fail = [0]       # 실패 링크
+        self._output = [()]    # 상태에서 끝나는 키워드 인덱스
+
+        for index, keyword in enumerate(self.keywords):
+            self._add(keyword, index)
+        self._build_links()
+
+    def _add(self, keyword: str, index: int):
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = nxt
+        self._output[state] = self._output[state] + (index,)
+
+    def _build_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def find_indices(self, text: str) -> set:
+        """텍스트에 등장한 키워드 인덱스 집합"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def find(self, text: str) -> set:
+        """텍스트에 등장한 키워드 집합"""
+        return {self.keywords[i] for i in self.find_indices(text)}
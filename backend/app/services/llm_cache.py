@@ -0,0 +1,145 @@
+"""
+LLM 응답 캐시 (내용 주소 기반)
+- 키: sha256(종류, 모델, 프롬프트 버전, 입력 텍스트)
+- 검증을 통과한 응답만 저장 -> 같은 입력의 재창작은 API 호출 없이 반환
+- TTL(CACHE_TTL_DAYS)이 지난 항목은 무효, 개수가 MAX_CACHE_ENTRIES를 넘으면
+  마지막 조회가 오래된 항목부터 삭제 (LRU)
+- 프로세스별 hit/miss 카운터 (/admin/llm-cache)
+
+DB 조회/쓰기는 동기 세션이므로 async 코드에서는 aget/aget_many/aput_many로 호출
+(스레드에서 실행, 여러 건은 쿼리/커밋 한 번으로 묶음).
+"""
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from ..database import SessionLocal
+from ..models.llm_cache import LLMCacheEntry
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENABLED = True
+CACHE_TTL_DAYS = 30
+MAX_CACHE_ENTRIES = 5000
+
+_stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+
+def cache_key(kind: str, model: str, prompt_version: int, text: str) -> str:
+    raw = "\x1f".join((kind, model, str(prompt_version), text.strip()))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> dict | None:
+    """캐시된 응답 (없거나 만료면 None)"""
+    return get_many([key])[0]
+
+
+def get_many(keys: list) -> list:
+    """키별 캐시된 응답 목록 (입력 순서, 없거나 만료면 None). hit 기록은 커밋 한 번"""
+    if not CACHE_ENABLED or not keys:
+        return [None] * len(keys)
+
+    db = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        entries = {
+            entry.key: entry
+            for entry in db.query(LLMCacheEntry).filter(
+                LLMCacheEntry.key.in_(set(keys)),
+                LLMCacheEntry.created_at >= now - timedelta(days=CACHE_TTL_DAYS),
+            )
+        }
+        results = []
+        for key in keys:
+            entry = entries.get(key)
+            if entry is None:
+                _stats["misses"] += 1
+                results.append(None)
+                continue
+            entry.hit_count = (entry.hit_count or 0) + 1
+            entry.last_accessed_at = now
+            _stats["hits"] += 1
+            results.append(entry.response)
+        if entries:
+            db.commit()
+        return results
+    except Exception as e:
+        logger.warning(f"LLM 캐시 조회 실패: {e}")
+        db.rollback()
+        return [None] * len(keys)
+    finally:
+        db.close()
+
+
+def put(key: str, kind: str, model: str, prompt_version: int, response: dict):
+    """검증된 응답 저장 + 만료/초과 항목 정리"""
+    put_many([(key, response)], kind, model, prompt_version)
+
+
+def put_many(items: list, kind: str, model: str, prompt_version: int):
+    """[(key, response)] 저장 + 만료/초과 항목 정리 (커밋 한 번)"""
+    if not CACHE_ENABLED or not items:
+        return
+
+    db = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        for key, response in items:
+            db.merge(LLMCacheEntry(
+                key=key, kind=kind, model=model, prompt_version=prompt_version, response=response,
+                hit_count=0, created_at=now, last_accessed_at=now,
+            ))
+        db.flush()
+
+        evicted = db.query(LLMCacheEntry).filter(
+            LLMCacheEntry.created_at < now - timedelta(days=CACHE_TTL_DAYS)
+        ).delete(synchronize_session=False)
+        overflow = db.query(LLMCacheEntry.key).order_by(
+            LLMCacheEntry.last_accessed_at.desc()
+        ).offset(MAX_CACHE_ENTRIES)
+        evicted += db.query(LLMCacheEntry).filter(
+            LLMCacheEntry.key.in_(overflow.scalar_subquery())
+        ).delete(synchronize_session=False)
+        db.commit()
+
+        _stats["stores"] += len(items)
+        _stats["evictions"] += evicted
+    except Exception as e:
+        logger.warning(f"LLM 캐시 저장 실패: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+async def aget(key: str) -> dict | None:
+    """get을 스레드에서 실행 (이벤트 루프를 막지 않음)"""
+    return (await aget_many([key]))[0]
+
+
+async def aget_many(keys: list) -> list:
+    if not CACHE_ENABLED or not keys:
+        return [None] * len(keys)
+    return await asyncio.to_thread(get_many, keys)
+
+
+async def aput_many(items: list, kind: str, model: str, prompt_version: int):
+    if CACHE_ENABLED and items:
+        await asyncio.to_thread(put_many, items, kind, model, prompt_version)
+
+
+def stats() -> dict:
+    """hit/miss 카운터 + 저장된 항목 수"""
+    lookups = _stats["hits"] + _stats["misses"]
+    db = SessionLocal()
+    try:
+        entries = db.query(LLMCacheEntry).count()
+    finally:
+        db.close()
+    return {
+        **_stats,
+        "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else None,
+        "entries": entries,
+        "max_entries": MAX_CACHE_ENTRIES,
+        "ttl_days": CACHE_TTL_DAYS,
+    }
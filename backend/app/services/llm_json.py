@@ -0,0 +1,104 @@
+"""
+LLM JSON 응답 파서 (관대한 단일 패스)
+- 코드펜스(```json)와 앞뒤 설명 문장을 무시하고 첫 JSON 값만 해석
+- 표준 JSON이 아니면(문자열 안의 큰따옴표, 줄바꿈 등) 키 위치를 기준으로 값 구간을 잘라냄
+- 필요한 키가 없으면 ParseError
+
+재창작 요청은 assistant 응답 앞부분("{" / "[")을 미리 채워 보내므로
+호출하는 쪽은 그 접두어를 응답 앞에 붙여서 넘긴다.
+"""
+import json
+import re
+
+_DECODER = json.JSONDecoder()
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL)
+
+
+class ParseError(ValueError):
+    """필요한 필드를 찾지 못함"""
+
+
+def _unfence(text: str) -> str:
+    match = _FENCE_RE.search(text)
+    return match.group(1) if match else text
+
+
+def _clean(value) -> str:
+    """공백/줄바꿈 정리"""
+    return re.sub(r"\s+", " ", str(value)).strip()
+
+
+def _unquote(raw: str) -> str:
+    """JSON이 아닌 값 구간: 바깥 따옴표 한 쌍만 벗기고 이스케이프 복원"""
+    raw = raw.strip()
+    if raw.startswith('"'):
+        raw = raw[1:]
+    if raw.endswith('"'):
+        raw = raw[:-1]
+    return _clean(raw.replace('\\"', '"').replace("\\n", "\n"))
+
+
+def _scan_fields(segment: str, keys: tuple) -> dict:
+    """표준 JSON이 아닐 때: "key": 위치들 사이를 값으로 봄"""
+    anchors = []
+    for key in keys:
+        match = re.search(rf'"{re.escape(key)}"\s*:\s*', segment)
+        if not match:
+            raise ParseError(f"'{key}' 필드 없음")
+        anchors.append((match.start(), match.end(), key))
+    anchors.sort()
+
+    result = {}
+    for i, (_, value_start, key) in enumerate(anchors):
+        if i + 1 < len(anchors):
+            end = anchors[i + 1][0]
+        else:
+            end = segment.rfind("}")
+            end = end if end > value_start else len(segment)
+        raw = segment[value_start:end].rstrip().rstrip(",").rstrip()
+        result[key] = _unquote(raw)
+    return result
+
+
+def parse_object(text: str, keys: tuple) -> dict:
+    """{key: 문자열} 객체 하나 추출"""
+    text = _unfence(text or "")
+    start = text.find("{")
+    if start < 0:
+        raise ParseError("JSON 객체 없음")
+    try:
+        value, _ = _DECODER.raw_decode(text, start)
+        if isinstance(value, dict) and all(key in value for key in keys):
+            return {key: _clean(value[key]) for key in keys}
+    except json.JSONDecodeError:
+        pass
+    return _scan_fields(text[start:], keys)
+
+
+def parse_array(text: str, keys: tuple) -> list:
+    """[{key: 문자열}, ...] 배열 추출 (필드가 빠진 항목은 건너뜀, 첫 키로 항목 구분)"""
+    text = _unfence(text or "")
+    start = text.find("[")
+    if start < 0:
+        raise ParseError("JSON 배열 없음")
+    try:
+        value, _ = _DECODER.raw_decode(text, start)
+        if isinstance(value, list):
+            return [{key: _clean(item[key]) for key in keys}
+                    for item in value if isinstance(item, dict) and all(key in item for key in keys)]
+    except json.JSONDecodeError:
+        pass
+
+    # 항목마다 첫 키 위치에서 잘라 각각 필드 추출
+    body = text[start:]
+    starts = [m.start() for m in re.finditer(rf'"{re.escape(keys[0])}"\s*:', body)]
+    items = []
+    for i, item_start in enumerate(starts):
+        segment = body[item_start:starts[i + 1] if i + 1 < len(starts) else len(body)]
+        try:
+            items.append(_scan_fields(segment, keys))
+        except ParseError:
+            continue
+    if not items:
+        raise ParseError("배열 항목 없음")
+    return items
@@ -0,0 +1,201 @@
+"""
+근접 중복 기사 탐지 (MinHash + LSH)
+- 제목을 정규화한 뒤 문자 n-gram(기본 2-gram) 집합으로 표현 (띄어쓰기 차이에 강함)
+- MinHash 서명을 밴드로 나눠 버킷에 넣고, 같은 버킷 후보만 실제 Jaccard로 검증
+- 전체 비교 O(n²) 대신 기사 수에 거의 비례 (버킷 크기 상한 + 서명 일치율 사전 필터)
+
+기본 임계값 0.4(문자 2-gram Jaccard)는 기존 SequenceMatcher ratio 0.5로 중복이던
+같은 스토리 변형(말머리/꼬리말/띄어쓰기 차이)을 거의 모두 묶는다.
+0.2처럼 낮추면 흔한 단어("금리", "영업이익")만 겹치는 다른 기사까지 후보가 되어
+후보 쌍이 기사 수의 제곱으로 늘고 서로 다른 스토리가 한 그룹으로 합쳐진다.
+밴드 수는 Jaccard가 정확히 임계값인 쌍도 TARGET_RECALL 확률로 후보가 되도록 정한다
+(S-곡선 중간점을 임계값에 맞추면 임계값 근처 쌍의 절반 가까이를 놓침).
+"""
+import math
+import re
+import zlib
+from collections import defaultdict
+import numpy as np
+
+DEFAULT_THRESHOLD = 0.4
+SHINGLE_SIZE = 2
+LSH_ROWS = 3          # 밴드당 행 수 (늘리면 무관한 쌍의 충돌은 줄지만 필요한 밴드 수가 급증)
+TARGET_RECALL = 0.95  # Jaccard = 임계값인 쌍이 후보가 될 확률
+MAX_LSH_BANDS = 128
+SIGNATURE_CHUNK = 1024  # 서명 계산 시 한 번에 처리할 기사 수 (메모리 상한)
+MAX_BUCKET_SIZE = 32    # 이보다 큰 버킷은 첫 기사와의 쌍만 후보로 (후보 쌍 수 상한)
+SIGNATURE_MARGIN = 0.1  # 서명 일치율 사전 필터 여유 (추정 오차로 실제 중복을 버리지 않도록)
+PAIR_CHUNK = 100_000    # 서명 비교 시 한 번에 처리할 쌍 수
+
+_PRIME = np.uint64(4294967311)  # 2^32보다 큰 소수
+_NON_WORD_RE = re.compile(r"[^0-9a-z가-힣]+")
+# 기사 제목 앞머리 말머리 ([속보], [단독] 등)
+_BRACKET_RE = re.compile(r"^\s*[\[\(【<][^\]\)】>]{1,10}[\]\)】>]")
+
+
+def normalize_title(title: str) -> str:
+    """말머리/기호/공백 제거, 소문자화"""
+    title = _BRACKET_RE.sub("", title or "")
+    return _NON_WORD_RE.sub("", title.lower())
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """문자 n-gram 해시 집합"""
+    normalized = normalize_title(text)
+    if len(normalized) <= size:
+        grams = {normalized} if normalized else set()
+    else:
+        grams = {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+    return {zlib.crc32(g.encode("utf-8")) for g in grams}
+
+
+def jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def lsh_bands(threshold: float, rows: int = LSH_ROWS, recall: float = TARGET_RECALL) -> int:
+    """Jaccard = threshold인 쌍이 recall 이상 확률로 후보가 되는 최소 밴드 수
+
+    한 밴드에서 만날 확률 p = threshold^rows, b개 밴드 중 하나라도 만날 확률 1 - (1 - p)^b >= recall
+    """
+    p = threshold ** rows
+    if p >= 1.0:
+        return 1
+    bands = math.ceil(math.log(1.0 - recall) / math.log(1.0 - p))
+    return int(min(max(bands, 1), MAX_LSH_BANDS))
+
+
+class MinHashLSH:
+    """MinHash 서명 계산 + 밴드 버킷팅"""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, rows: int = LSH_ROWS, seed: int = 42):
+        self.threshold = threshold
+        self.rows = rows
+        self.bands = lsh_bands(threshold, rows)
+        self.num_perm = self.bands * rows
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**32, size=self.num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 2**32, size=self.num_perm, dtype=np.uint64)
+
+    def signatures(self, shingle_sets: list) -> np.ndarray:
+        """(기사 수, num_perm) MinHash 서명 행렬. 빈 집합은 최댓값으로 채움"""
+        n = len(shingle_sets)
+        sigs = np.full((n, self.num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+
+        for start in range(0, n, SIGNATURE_CHUNK):
+            chunk = shingle_sets[start:start + SIGNATURE_CHUNK]
+            present = [i for i, s in enumerate(chunk) if s]
+            if not present:
+                continue
+            lengths = np.array([len(chunk[i]) for i in present])
+            values = np.fromiter(
+                (h for i in present for h in chunk[i]), dtype=np.uint64, count=int(lengths.sum())
+            )
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+            # (a*x mod p + b) mod p - 32비트 입력이라 uint64에서 넘치지 않음
+            hashed = (self._a[:, None] * values[None, :] % _PRIME + self._b[:, None]) % _PRIME
+            mins = np.minimum.reduceat(hashed, offsets, axis=1)
+            sigs[start + np.array(present)] = mins.T
+
+        return sigs
+
+    def band_keys(self, sigs: np.ndarray) -> np.ndarray:
+        """(기사 수, bands) 버킷 키. 밴드의 행들을 64비트 키 하나로 합침 (충돌은 Jaccard 검증에서 걸러짐)"""
+        keys = np.empty((sigs.shape[0], self.bands), dtype=np.uint64)
+        for band in range(self.bands):
+            part = sigs[:, band * self.rows:(band + 1) * self.rows]
+            key = part[:, 0].copy()
+            for col in range(1, self.rows):
+                key = key * np.uint64(1000003) ^ part[:, col]
+            keys[:, band] = key
+        return keys
+
+    def candidate_pairs(self, sigs: np.ndarray) -> np.ndarray:
+        """(i, j) 후보 쌍 배열 (i < j, 중복 없음)
+
+        밴드마다 키로 정렬해 버킷을 나누고,
+        - MAX_BUCKET_SIZE 이하 버킷: 버킷 안 모든 쌍
+        - 더 큰 버킷(흔한 n-gram이 몰린 버킷): 버킷의 첫 기사와 나머지 쌍만
+        이라서 밴드당 쌍 수가 기사 수 x MAX_BUCKET_SIZE를 넘지 않는다.
+        서명 일치율(Jaccard 추정치)이 임계값보다 SIGNATURE_MARGIN 이상 낮은 쌍은 여기서 버린다.
+        """
+        n = sigs.shape[0]
+        if n < 2:
+            return np.empty((0, 2), dtype=np.int64)
+
+        all_keys = self.band_keys(sigs)
+        positions = np.arange(n)
+        found = []
+        for band in range(self.bands):
+            order = np.argsort(all_keys[:, band], kind="stable")
+            sorted_keys = all_keys[order, band]
+            new_bucket = np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+            starts = np.flatnonzero(new_bucket)
+            sizes = np.diff(np.append(starts, n))
+            bucket_start = np.repeat(starts, sizes)
+            bucket_end = bucket_start + np.repeat(sizes, sizes)
+            small = (bucket_end - bucket_start) <= MAX_BUCKET_SIZE
+
+            # 큰 버킷: 첫 기사 - 나머지
+            star = ~small & (positions != bucket_start)
+            pairs = [np.stack((order[bucket_start[star]], order[star]), axis=1)]
+            # 작은 버킷: 간격 d인 모든 위치 쌍
+            for d in range(1, min(MAX_BUCKET_SIZE, int(sizes.max()))):
+                left = positions[:-d][small[:-d] & (positions[:-d] + d < bucket_end[:-d])]
+                if not len(left):
+                    break
+                pairs.append(np.stack((order[left], order[left + d]), axis=1))
+
+            band_pairs = np.concatenate(pairs)
+            if len(band_pairs):
+                found.append(self._likely(sigs, np.sort(band_pairs, axis=1)))
+
+        if not found:
+            return np.empty((0, 2), dtype=np.int64)
+        pairs = np.concatenate(found)
+        codes = np.unique(pairs[:, 0].astype(np.int64) * n + pairs[:, 1])
+        return np.stack((codes // n, codes % n), axis=1)
+
+    def _likely(self, sigs: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+        """서명 일치율이 임계값 - SIGNATURE_MARGIN 이상인 쌍만"""
+        keep = np.empty(len(pairs), dtype=bool)
+        for start in range(0, len(pairs), PAIR_CHUNK):
+            chunk = pairs[start:start + PAIR_CHUNK]
+            agree = (sigs[chunk[:, 0]] == sigs[chunk[:, 1]]).mean(axis=1)
+            keep[start:start + PAIR_CHUNK] = agree >= self.threshold - SIGNATURE_MARGIN
+        return pairs[keep]
+
+
+def group_near_duplicates(articles: list, threshold: float = DEFAULT_THRESHOLD, key: str = "title") -> list:
+    """근접 중복 기사 그룹화 (입력 순서대로 기준 기사를 잡고 미배정 후보를 묶음)"""
+    if not articles:
+        return []
+
+    sets = [shingles(a.get(key, "")) for a in articles]
+    lsh = MinHashLSH(threshold)
+    pairs = lsh.candidate_pairs(lsh.signatures(sets))
+
+    # 기준 기사는 항상 앞 번호라서 뒤 번호 쪽 이웃만 있으면 됨 (검증 통과한 쌍만 남김)
+    neighbors = defaultdict(list)
+    for i, j in pairs.tolist():
+        if jaccard(sets[i], sets[j]) >= threshold:
+            neighbors[i].append(j)
+
+    groups = []
+    used = set()
+    for i, article in enumerate(articles):
+        if i in used:
+            continue
+        group = [article]
+        used.add(i)
+        for j in neighbors.get(i, ()):
+            if j not in used:
+                group.append(articles[j])
+                used.add(j)
+        groups.append(group)
+
+    return groups
@@ -0,0 +1,40 @@
+"""
+뉴스 전체 개수 캐시 (GET /news의 total)
+- 요청마다 COUNT(*)를 돌리지 않고 프로세스별로 캐시
+- 이 프로세스에서 추가/삭제한 기사는 mapper 이벤트로 바로 반영
+- 다른 프로세스(수집 워커 등)의 변경은 TTL_SECONDS가 지나면 다시 세어 반영 (그 사이는 근사값)
+"""
+import time
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+from ..models.news import NewsArticle
+
+TTL_SECONDS = 300
+
+_cache = {"value": None, "counted_at": 0.0}
+
+
+def total(db: Session) -> int:
+    if _cache["value"] is None or time.monotonic() - _cache["counted_at"] > TTL_SECONDS:
+        _cache["value"] = db.query(func.count(NewsArticle.id)).scalar()
+        _cache["counted_at"] = time.monotonic()
+    return _cache["value"]
+
+
+def invalidate():
+    _cache["value"] = None
+
+
+def _adjust(delta: int):
+    if _cache["value"] is not None:
+        _cache["value"] = max(0, _cache["value"] + delta)
+
+
+@event.listens_for(NewsArticle, "after_insert")
+def _on_insert(mapper, connection, target):
+    _adjust(1)
+
+
+@event.listens_for(NewsArticle, "after_delete")
+def _on_delete(mapper, connection, target):
+    _adjust(-1)
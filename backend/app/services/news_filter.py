@@ -5,11 +5,16 @@
 3. 분야 분류 (8개 분야)
 4. 중요도 점수 계산
 5. 점수 컷
-6. 분야별 그룹화
+6. 근접 중복 제거 (전체 후보 대상)
 7. 분야당 1개 선정
 """
 
-from difflib import SequenceMatcher
+import logging
+from .keyword_matcher import KeywordMatcher
+from .near_duplicate import DEFAULT_THRESHOLD, group_near_duplicates
+from .instrumentation import stage
+
+logger = logging.getLogger(__name__)
 
 # 분야별 키워드 (8개 분야)
 CATEGORY_KEYWORDS = {
@@ -77,6 +82,50 @@ IMPORTANCE_KEYWORDS = [
 # 최소 요약 길이
 MIN_SUMMARY_LENGTH = 30
 
+# 점수 컷
+SCORE_CUT = 0.15
+
+
+def _build_matcher():
+    """분야/중요도 키워드 전체로 매처 1회 생성"""
+    keywords = [kw for kws in CATEGORY_KEYWORDS.values() for kw in kws] + IMPORTANCE_KEYWORDS
+    matcher = KeywordMatcher(keywords)
+    index = {kw: i for i, kw in enumerate(matcher.keywords)}
+
+    # 키워드 인덱스 -> 속한 분야 목록 (한 키워드가 여러 분야에 속할 수 있음, 예: "경기")
+    keyword_categories = [[] for _ in matcher.keywords]
+    for category, kws in CATEGORY_KEYWORDS.items():
+        for kw in kws:
+            keyword_categories[index[kw]].append(category)
+
+    importance = [False] * len(matcher.keywords)
+    for kw in IMPORTANCE_KEYWORDS:
+        importance[index[kw]] = True
+
+    return matcher, keyword_categories, importance
+
+
+_MATCHER, _KEYWORD_CATEGORIES, _IS_IMPORTANCE = _build_matcher()
+
+
+def match_keywords(title: str, summary: str = "") -> dict:
+    """title + summary 한 번 순회로 분야별/중요도 키워드 매칭 수 계산
+
+    Returns:
+        {"categories": {분야: 매칭 키워드 수}, "importance": 중요도 키워드 수}
+    """
+    found = _MATCHER.find_indices(f"{title} {summary}")
+
+    categories = dict.fromkeys(CATEGORY_KEYWORDS, 0)
+    importance = 0
+    for i in found:
+        for category in _KEYWORD_CATEGORIES[i]:
+            categories[category] += 1
+        if _IS_IMPORTANCE[i]:
+            importance += 1
+
+    return {"categories": categories, "importance": importance}
+
 
 def run_pipeline(articles: list, target_count: int = None) -> list:
     """전체 파이프라인 실행 (분야당 1개씩 선정)"""
@@ -85,25 +134,41 @@ def run_pipeline(articles: list, target_count: int = None) -> list:
         target_count = len(CATEGORY_KEYWORDS)
 
     # 1. 단문 필터
-    filtered = filter_basic(articles)
-    print(f"[Pipeline] 단문 필터 후: {len(filtered)}개")
+    with stage("filter.basic", len(articles)) as st:
+        filtered = filter_basic(articles)
+        st.set_output(len(filtered))
+        st.drop("short_summary", len(articles) - len(filtered))
 
-    # 2. 분야 분류
-    categorized = [classify_category(a) for a in filtered]
-    print(f"[Pipeline] 분야 분류 완료")
+    # 2. 분야 분류 (키워드 매칭은 기사당 한 번, 점수 계산과 공유)
+    with stage("filter.classify", len(filtered)) as st:
+        hits = [match_keywords(a.get("title", ""), a.get("summary", "")) for a in filtered]
+        categorized = [classify_category(a, h) for a, h in zip(filtered, hits)]
+        st.set_output(len(categorized))
 
     # 3. 중요도 점수 계산
-    scored = [calculate_score(a) for a in categorized]
-    print(f"[Pipeline] 점수 계산 완료")
+    with stage("filter.score", len(categorized)) as st:
+        scored = [calculate_score(a, h) for a, h in zip(categorized, hits)]
+        st.set_output(len(scored))
 
     # 4. 점수 컷 (0.15 이상만)
-    passed = [a for a in scored if a.get("score", 0) >= 0.15]
-    print(f"[Pipeline] 점수 컷 후: {len(passed)}개")
-
-    # 5. 분야별 그룹화 후 각 분야에서 1개씩 선정
-    final = select_one_per_category(passed)
-    print(f"[Pipeline] 분야별 선정: {len(final)}개")
-
+    with stage("filter.score_cut", len(scored)) as st:
+        passed = [a for a in scored if a.get("score", 0) >= SCORE_CUT]
+        st.set_output(len(passed))
+        st.drop("low_score", len(scored) - len(passed))
+
+    # 5. 근접 중복 제거 (분야 구분 없이 전체 후보에서, 그룹별 최고 점수 기사)
+    with stage("filter.dedup", len(passed)) as st:
+        deduped = select_representatives(group_similar_articles(passed))
+        st.set_output(len(deduped))
+        st.drop("duplicate", len(passed) - len(deduped))
+
+    # 6. 분야별 그룹화 후 각 분야에서 1개씩 선정
+    with stage("filter.select", len(deduped)) as st:
+        final = select_one_per_category(deduped)
+        st.set_output(len(final))
+        st.drop("not_top_in_category", len(deduped) - len(final))
+
+    logger.info(f"[Pipeline] {len(articles)}개 -> 점수 컷 {len(passed)}개 -> 중복 제거 {len(deduped)}개 -> 선정 {len(final)}개")
     return final
 
 
@@ -122,16 +187,11 @@ def filter_basic(articles: list) -> list:
     return result
 
 
-def classify_category(article: dict) -> dict:
-    """분야 분류: 경제/산업/기술/정책"""
-    title = article.get("title", "")
-    summary = article.get("summary", "")
-    text = f"{title} {summary}"
-
-    scores = {}
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        score = sum(1 for kw in keywords if kw in text)
-        scores[category] = score
+def classify_category(article: dict, hits: dict | None = None) -> dict:
+    """분야 분류: 경제/산업/기술/정책 (hits: 미리 계산한 match_keywords 결과)"""
+    if hits is None:
+        hits = match_keywords(article.get("title", ""), article.get("summary", ""))
+    scores = hits["categories"]
 
     # 가장 높은 점수의 분야 선택
     if max(scores.values()) > 0:
@@ -143,23 +203,22 @@ def classify_category(article: dict) -> dict:
     return article
 
 
-def calculate_score(article: dict) -> dict:
-    """중요도 점수 계산"""
+def calculate_score(article: dict, hits: dict | None = None) -> dict:
+    """중요도 점수 계산 (hits: 미리 계산한 match_keywords 결과)"""
     title = article.get("title", "")
-    summary = article.get("summary", "")
-    text = f"{title} {summary}"
+    if hits is None:
+        hits = match_keywords(title, article.get("summary", ""))
 
     # 기본 점수
     score = 0.3
 
     # 분야 키워드 매칭 가점
     category = article.get("category", "economy")
-    category_keywords = CATEGORY_KEYWORDS.get(category, [])
-    category_matches = sum(1 for kw in category_keywords if kw in text)
+    category_matches = hits["categories"].get(category, 0)
     score += min(category_matches * 0.1, 0.3)
 
     # 중요도 키워드 가점
-    importance_matches = sum(1 for kw in IMPORTANCE_KEYWORDS if kw in text)
+    importance_matches = hits["importance"]
     score += min(importance_matches * 0.1, 0.3)
 
     # 제목 길이 보정 (너무 짧으면 감점)
@@ -170,35 +229,9 @@ def calculate_score(article: dict) -> dict:
     return article
 
 
-def group_similar_articles(articles: list, threshold: float = 0.5) -> list:
-    """중복 기사 그룹화 (제목 유사도 기반)"""
-    groups = []
-    used = set()
-
-    for i, article in enumerate(articles):
-        if i in used:
-            continue
-
-        group = [article]
-        used.add(i)
-
-        for j, other in enumerate(articles):
-            if j in used:
-                continue
-
-            similarity = SequenceMatcher(
-                None,
-                article.get("title", ""),
-                other.get("title", "")
-            ).ratio()
-
-            if similarity >= threshold:
-                group.append(other)
-                used.add(j)
-
-        groups.append(group)
-
-    return groups
+def group_similar_articles(articles: list, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """중복 기사 그룹화 (제목 문자 n-gram MinHash/LSH 기반, threshold는 Jaccard)"""
+    return group_near_duplicates(articles, threshold)
 
 
 def select_representatives(groups: list) -> list:
@@ -220,21 +253,15 @@ def select_one_per_category(articles: list) -> list:
             by_category[cat] = []
         by_category[cat].append(article)
 
-    # 각 분야에서 중복 제거 후 최고 점수 1개 선택
+    # 각 분야에서 최고 점수 1개 선택 (중복 제거는 run_pipeline에서 전체 후보 대상으로 수행)
     result = []
     for cat in CATEGORY_KEYWORDS.keys():
         if cat not in by_category or not by_category[cat]:
             continue
 
-        # 해당 분야 내 중복 기사 그룹화
-        groups = group_similar_articles(by_category[cat])
-
-        # 각 그룹의 대표 기사 중 최고 점수
-        representatives = select_representatives(groups)
-        if representatives:
-            best = max(representatives, key=lambda x: x.get("score", 0))
-            best["category_name"] = CATEGORY_NAMES.get(cat, cat)
-            result.append(best)
+        best = max(by_category[cat], key=lambda x: x.get("score", 0))
+        best["category_name"] = CATEGORY_NAMES.get(cat, cat)
+        result.append(best)
 
     # 분야 순서대로 정렬
     category_order = list(CATEGORY_KEYWORDS.keys())
@@ -288,10 +315,7 @@ def is_investment_relevant(title: str, summary: str = "") -> bool:
     text = f"{title} {summary}"
     if any(kw in text for kw in EXCLUDE_KEYWORDS):
         return False
-    for keywords in CATEGORY_KEYWORDS.values():
-        if any(kw in text for kw in keywords):
-            return True
-    return False
+    return any(match_keywords(title, summary)["categories"].values())
 
 
 def filter_investment_news(articles: list) -> list:
@@ -1,30 +1,43 @@
 """뉴스 수집 및 분석 파이프라인"""
+import logging
 import uuid
 from datetime import datetime
 from sqlalchemy.orm import Session
-from .rss_service import fetch_all_feeds
-from .claude_service import recreate_news
+from .ingest_scheduler import collect_articles
+from .claude_service import recreate_news, recreate_news_batch, is_validated
+from .story_index import StoryIndex
+from .instrumentation import start_run, stage
 from ..models.news import NewsArticle, CausalityAnalysis, Insight
+from ..models.fingerprint import StoryFingerprint
 from ..database import SessionLocal
 
+logger = logging.getLogger(__name__)
 
-async def process_single_news(article: dict, db: Session) -> NewsArticle | None:
-    """단일 뉴스 처리: 재창작 + 분석 + DB 저장"""
+
+def _claim(article: dict, db: Session, index: StoryIndex, seen_urls: set | None = None) -> StoryFingerprint | None:
+    """처리 대상이면 지문을 먼저 등록해 반환 (같은 배치 안의 같은 스토리도 걸러짐)"""
     # 중복 체크
+    if seen_urls is not None:
+        if article["source_url"] in seen_urls:
+            return None
+        seen_urls.add(article["source_url"])
     exists = db.query(NewsArticle).filter(NewsArticle.source_url == article["source_url"]).first()
     if exists:
         return None
 
-    original_text = f"{article['title']}. {article['summary']}"
+    # 최근 처리한 같은 스토리 (다른 언론사/재송고) 건너뜀
+    if index.find(article["title"], source_url=article["source_url"]):
+        return None
+    return index.add(article["title"], article["source_url"])
+
+
+def _fallback(article: dict) -> dict:
+    # API 실패시 원본 사용
+    return {"title": article["title"], "summary": article["summary"], "content": article["summary"]}
 
-    try:
-        # Claude API 호출
-        recreated = await recreate_news(original_text)
-    except Exception as e:
-        print(f"Claude API error: {e}")
-        # API 실패시 원본 사용
-        recreated = {"title": article["title"], "summary": article["summary"], "content": article["summary"]}
 
+def _save(article: dict, recreated: dict, fingerprint: StoryFingerprint, db: Session) -> NewsArticle:
+    """재창작 결과 DB 저장"""
     # MVP: 인과관계/인사이트 미사용
     causalities = []
     insights = []
@@ -49,23 +62,61 @@ async def process_single_news(article: dict, db: Session) -> NewsArticle | None:
     for i in insights:
         db.add(Insight(article_id=news.id, title=i["title"], content=i["content"], insight_type=i.get("type", "neutral"), importance=i.get("importance", 0.5)))
 
+    # 검증을 통과한 재창작만 재사용 대상으로 (대체 결과/원문은 남기지 않음)
+    if is_validated(recreated):
+        fingerprint.recreated_title = recreated.get("title")
+        fingerprint.recreated_summary = recreated.get("summary")
+    fingerprint.article_id = news.id
     db.commit()
     return news
 
 
+async def process_single_news(article: dict, db: Session, index: StoryIndex | None = None) -> NewsArticle | None:
+    """단일 뉴스 처리: 재창작 + 분석 + DB 저장"""
+    fingerprint = _claim(article, db, index or StoryIndex(db))
+    if fingerprint is None:
+        return None
+
+    try:
+        # Claude API 호출
+        recreated = await recreate_news(f"{article['title']}. {article['summary']}")
+    except Exception as e:
+        logger.warning(f"Claude API error: {e}")
+        recreated = _fallback(article)
+    return _save(article, recreated, fingerprint, db)
+
+
 async def run_pipeline(limit: int = 5) -> dict:
     """전체 파이프라인 실행"""
     db = SessionLocal()
-    articles = fetch_all_feeds(limit)
-    processed = 0
-    skipped = 0
-
-    for article in articles:
-        result = await process_single_news(article, db)
-        if result:
-            processed += 1
-        else:
-            skipped += 1
+    async with start_run("news_pipeline", limit=limit):
+        with stage("collect") as st:
+            articles = await collect_articles(db, limit)
+            st.set_output(len(articles))
+
+        index = StoryIndex(db)
+
+        with stage("process", len(articles)) as st:
+            seen_urls = set()
+            claimed = []
+            for article in articles:
+                fingerprint = _claim(article, db, index, seen_urls)
+                if fingerprint is not None:
+                    claimed.append((article, fingerprint))
+            skipped = len(articles) - len(claimed)
+            st.drop("duplicate", skipped)
+
+            # 재창작은 배치 요청으로 (claude_service.BATCH_SIZE개씩), 저장은 순서대로
+            texts = [f"{a['title']}. {a['summary']}" for a, _ in claimed]
+            try:
+                results = await recreate_news_batch(texts)
+            except Exception as e:
+                logger.warning(f"Claude API error: {e}")
+                results = [_fallback(a) for a, _ in claimed]
+            for (article, fingerprint), recreated in zip(claimed, results):
+                _save(article, recreated, fingerprint, db)
+            processed = len(claimed)
+            st.set_output(processed)
 
     db.close()
     return {"processed": processed, "skipped": skipped, "total": len(articles)}
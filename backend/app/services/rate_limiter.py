@@ -0,0 +1,137 @@
+"""
+LLM 요청 속도 제한 (프로세스 공용)
+- 분당 요청 수(RPM), 분당 토큰 수(TPM) 토큰 버킷
+- 동시 요청 수는 AIMD로 조절: 성공이 이어지면 1씩 늘리고, 429/과부하면 절반으로
+- 429의 retry-after 동안은 모든 요청을 멈춤
+- 재시도 대기 시간은 지터를 넣은 지수 백오프 (backoff_delay)
+
+TPM은 요청 전에 추정치로 차감하고, 응답을 받으면 실제 사용량으로 보정한다.
+"""
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+
+BASE_BACKOFF = 1.0   # 초
+MAX_BACKOFF = 60.0
+
+
+def backoff_delay(attempt: int, base: float = BASE_BACKOFF, cap: float = MAX_BACKOFF) -> float:
+    """지수 백오프 + full jitter (attempt는 0부터)"""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class TokenBucket:
+    """분당 rate만큼 연속으로 채워지는 버킷 (최대 1분치)"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount를 꺼낼 수 있을 때까지 남은 시간 (초)"""
+        self._refill()
+        amount = min(amount, self.capacity)  # 버킷보다 큰 요청도 언젠가는 통과
+        return max(0.0, (amount - self.level) / self.rate)
+
+    def take(self, amount: float):
+        """차감 (음수가 되면 다음 요청들이 그만큼 기다림)"""
+        self._refill()
+        self.level -= amount
+
+
+class AdaptiveRateLimiter:
+    """RPM/TPM 버킷 + AIMD 동시성 제한"""
+
+    def __init__(self, rpm: int, tpm: int, concurrency: int, max_concurrency: int, min_concurrency: int = 1):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.limit = concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+
+        self._active = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._loop = None
+        self._cond = None
+        self.counters = {"requests": 0, "throttled": 0, "errors": 0, "waited_seconds": 0.0}
+
+    def _condition(self) -> asyncio.Condition:
+        # 이벤트 루프별로 새로 만듦 (스크립트에서 asyncio.run을 여러 번 호출해도 안전)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._cond = asyncio.Condition()
+            self._active = 0
+        return self._cond
+
+    @asynccontextmanager
+    async def slot(self, tokens: int):
+        """동시성 자리 + RPM/TPM 여유가 생길 때까지 기다린 뒤 요청 1건 실행"""
+        cond = self._condition()
+        started = time.monotonic()
+        async with cond:
+            await cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        try:
+            while True:
+                wait = max(
+                    self._paused_until - time.monotonic(),
+                    self.requests.wait_time(1),
+                    self.tokens.wait_time(tokens),
+                )
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            self.requests.take(1)
+            self.tokens.take(tokens)
+            self.counters["requests"] += 1
+            self.counters["waited_seconds"] += time.monotonic() - started
+            yield
+        finally:
+            async with cond:
+                self._active -= 1
+                cond.notify_all()
+
+    def on_success(self, estimated_tokens: int, actual_tokens: int):
+        """성공: 토큰 사용량 보정, 연속 성공이 현재 한도만큼 쌓이면 한도 +1"""
+        self.tokens.take(actual_tokens - estimated_tokens)
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_concurrency:
+            self.limit += 1
+            self._successes = 0
+
+    def on_throttled(self, retry_after: float | None = None):
+        """429: 한도 절반, retry-after 동안 전체 정지"""
+        self.counters["throttled"] += 1
+        self._decrease()
+        if retry_after:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+    def on_error(self):
+        """과부하/서버 오류/타임아웃: 한도 절반"""
+        self.counters["errors"] += 1
+        self._decrease()
+
+    def _decrease(self):
+        self.limit = max(self.min_concurrency, self.limit // 2)
+        self._successes = 0
+
+    def stats(self) -> dict:
+        return {
+            **self.counters,
+            "waited_seconds": round(self.counters["waited_seconds"], 2),
+            "concurrency_limit": self.limit,
+            "active": self._active,
+            "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 2),
+            "rpm_available": round(self.requests.level, 1),
+            "tpm_available": round(self.tokens.level),
+        }
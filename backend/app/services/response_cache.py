@@ -0,0 +1,106 @@
+"""
+브리핑 응답 캐시 (프로세스 메모리)
+- 포맷된 브리핑을 JSON 바이트로 한 번만 인코딩해 저장 (큰 응답은 gzip 본도 미리 만들어 둠)
+- 키: (briefing_id, RESPONSE_VERSION) - 응답 모양(_format_briefing)을 바꾸면 버전을 올림
+- 날짜 -> briefing_id 색인으로 /briefing/today도 DB 없이 응답
+- ETag는 본문 해시 (strong), gzip 본은 별도 ETag
+- 지난 날짜 브리핑은 바뀌지 않으므로 오래 캐시 (immutable)
+- 오늘/이후 날짜 브리핑(스케줄러가 미리 만든 내일 브리핑 포함)은 재생성될 수 있으므로 매번 재검증
+
+강제 재생성(_delete_briefing)하면 invalidate로 지운다. 다른 워커의 캐시는 지우지 못하므로
+오늘/이후 날짜 브리핑은 LIVE_TTL_SECONDS가 지나면 DB에서 다시 읽는다.
+날짜가 바뀌면(응답의 is_today, Cache-Control이 달라지므로) 모든 항목을 다시 만든다.
+"""
+import gzip
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import date
+
+RESPONSE_VERSION = 1
+MAX_ENTRIES = 256
+GZIP_MIN_BYTES = 1024
+LIVE_TTL_SECONDS = 60
+
+PAST_CACHE_CONTROL = "public, max-age=31536000, immutable"
+LIVE_CACHE_CONTROL = "no-cache"
+
+_entries = OrderedDict()  # (briefing_id, RESPONSE_VERSION) -> CachedResponse
+_by_date = {}             # briefing_date -> briefing_id
+_stats = {"hits": 0, "misses": 0, "not_modified": 0, "invalidations": 0}
+
+
+class CachedResponse:
+    """인코딩이 끝난 브리핑 응답 1건"""
+
+    def __init__(self, briefing_id: str, briefing_date: date, data: dict, today: date):
+        self.briefing_id = briefing_id
+        self.briefing_date = briefing_date
+        self.today = today
+        self.live = briefing_date >= today
+        self.created_at = time.monotonic()
+
+        # JSONResponse와 같은 인코딩
+        self.body = json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+        self.gzip_body = gzip.compress(self.body, compresslevel=6) if len(self.body) >= GZIP_MIN_BYTES else None
+        self.gzip_etag = f'"{self.etag.strip(chr(34))}-gz"'
+        self.cache_control = LIVE_CACHE_CONTROL if self.live else PAST_CACHE_CONTROL
+
+    def fresh(self, today: date) -> bool:
+        """같은 날 만든 항목이고, 오늘/이후 날짜 브리핑이면 TTL 안인지"""
+        if self.today != today:
+            return False
+        return not self.live or time.monotonic() - self.created_at < LIVE_TTL_SECONDS
+
+
+def put(briefing_id: str, briefing_date: date, data: dict, today: date) -> CachedResponse:
+    entry = CachedResponse(briefing_id, briefing_date, data, today)
+    key = (briefing_id, RESPONSE_VERSION)
+    _entries[key] = entry
+    _entries.move_to_end(key)
+    _by_date[briefing_date] = briefing_id
+    while len(_entries) > MAX_ENTRIES:
+        (old_id, _), old = _entries.popitem(last=False)
+        if _by_date.get(old.briefing_date) == old_id:
+            del _by_date[old.briefing_date]
+    return entry
+
+
+def get(briefing_id: str, today: date) -> CachedResponse | None:
+    key = (briefing_id, RESPONSE_VERSION)
+    entry = _entries.get(key)
+    if entry is None or not entry.fresh(today):
+        _stats["misses"] += 1
+        return None
+    _entries.move_to_end(key)
+    _stats["hits"] += 1
+    return entry
+
+
+def get_for_date(briefing_date: date, today: date) -> CachedResponse | None:
+    briefing_id = _by_date.get(briefing_date)
+    if briefing_id is None:
+        _stats["misses"] += 1
+        return None
+    return get(briefing_id, today)
+
+
+def invalidate(briefing_id: str):
+    """브리핑 삭제/재생성 시 호출"""
+    entry = _entries.pop((briefing_id, RESPONSE_VERSION), None)
+    if entry and _by_date.get(entry.briefing_date) == briefing_id:
+        del _by_date[entry.briefing_date]
+    for day, cached_id in list(_by_date.items()):
+        if cached_id == briefing_id:
+            del _by_date[day]
+    _stats["invalidations"] += 1
+
+
+def count_not_modified():
+    _stats["not_modified"] += 1
+
+
+def stats() -> dict:
+    return {**_stats, "entries": len(_entries), "bytes": sum(len(e.body) for e in _entries.values())}
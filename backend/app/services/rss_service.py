@@ -1,6 +1,19 @@
 """RSS 뉴스 수집 서비스"""
+import asyncio
+import hashlib
+import logging
+import time
 import feedparser
+import httpx
 from datetime import datetime
+from xml.etree.ElementTree import ParseError
+from sqlalchemy.orm import Session
+from ..models.feed import FeedState
+from .feed_parser import FeedStreamParser, build_article, clean_html, iter_feed_entries
+from . import feed_archive
+from .instrumentation import record_feed
+
+logger = logging.getLogger(__name__)
 
 # 한국 뉴스 RSS 피드
 RSS_FEEDS = {
@@ -31,26 +44,77 @@ RSS_FEEDS = {
     "yonhap": "https://www.yonhapnewstv.co.kr/browse/feed/",        # 연합뉴스
 }
 
+# 비동기 수집 설정
+FETCH_CONCURRENCY = len(RSS_FEEDS)  # 동시 다운로드 피드 수 (전부 동시 -> 전체 소요시간 ≈ 가장 느린 피드)
+CONNECT_TIMEOUT = 5.0          # 연결 타임아웃 (초)
+READ_TIMEOUT = 10.0            # 응답 읽기 타임아웃 (초)
+USER_AGENT = "Mozilla/5.0 (compatible; MACNAC-RSS/1.0)"
 
-def fetch_rss(feed_url: str, limit: int = 10) -> list:
-    """RSS 피드에서 뉴스 수집"""
-    feed = feedparser.parse(feed_url)
+# 피드별로 기억하는 최근 GUID 수
+MAX_SEEN_GUIDS = 500
+
+# 파서 모드: "stream" (증분 파싱, limit개 후 중단) / "feedparser" (전체 파싱)
+FEED_PARSER_MODE = "stream"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 원본 응답을 feed_archive에 저장 (재현/성능 측정용)
+ARCHIVE_RAW_FEEDS = False
+
+
+def parse_feed(content, limit: int | None = 10) -> list:
+    """RSS 본문(URL 또는 bytes) 파싱 후 기사 dict 목록 반환 (limit=None이면 전체)
+
+    제목/요약 정리는 스트리밍 파서와 같음 (feed_parser.build_article).
+    """
+    feed = feedparser.parse(content)
+    publisher = feed.feed.get("title", "")
     articles = []
 
     for entry in feed.entries[:limit]:
-        articles.append({
-            "title": entry.get("title", ""),
-            "summary": entry.get("summary", entry.get("description", "")),
-            "source_url": entry.get("link", ""),
-            "published_at": entry.get("published", ""),
-            "publisher": feed.feed.get("title", "Unknown"),
-        })
+        title = entry.get("title", "")
+        link = entry.get("link", "")
+        articles.append(build_article(
+            title,
+            entry.get("summary", entry.get("description", "")),
+            link,
+            entry.get("published", ""),
+            publisher,
+            entry.get("id") or link or clean_html(title),
+        ))
 
     return articles
 
 
+def parse_entries(content: bytes, limit: int | None = 10, seen: set | None = None) -> list:
+    """본문에서 seen에 없는 기사를 최대 limit개 파싱
+
+    스트리밍 모드에서 XML 오류가 나면 (비표준 엔티티, 멀티바이트 인코딩 등)
+    관대한 feedparser로 대체한다.
+    """
+    seen = set(seen or ())
+    if FEED_PARSER_MODE != "stream":
+        return _parse_feed_fresh(content, limit, seen)
+
+    chunks = (content[i:i + STREAM_CHUNK_SIZE] for i in range(0, len(content), STREAM_CHUNK_SIZE))
+    try:
+        return list(iter_feed_entries(chunks, limit, set(seen)))
+    except (ParseError, ValueError):
+        return _parse_feed_fresh(content, limit, seen)
+
+
+def _parse_feed_fresh(content: bytes, limit: int | None, seen: set | None = None) -> list:
+    """feedparser 대체 파싱 (seen에 없는 기사만 최대 limit개)"""
+    seen = seen or set()
+    return [a for a in parse_feed(content, None) if a["guid"] not in seen][:limit]
+
+
+def fetch_rss(feed_url: str, limit: int = 10) -> list:
+    """RSS 피드에서 뉴스 수집"""
+    return parse_feed(feed_url, limit)
+
+
 def fetch_all_feeds(limit_per_feed: int = 5) -> list:
-    """모든 RSS 피드에서 뉴스 수집"""
+    """모든 RSS 피드에서 뉴스 수집 (동기, 스크립트용)"""
     all_articles = []
 
     for name, url in RSS_FEEDS.items():
@@ -58,12 +122,180 @@ def fetch_all_feeds(limit_per_feed: int = 5) -> list:
             articles = fetch_rss(url, limit_per_feed)
             all_articles.extend(articles)
         except Exception as e:
-            print(f"RSS fetch error ({name}): {e}")
+            logger.warning(f"RSS fetch error ({name}): {e}")
 
     return all_articles
 
 
+def create_http_client(concurrency: int = FETCH_CONCURRENCY) -> httpx.AsyncClient:
+    """피드 수집용 HTTP 클라이언트 (연결 풀 + 타임아웃)
+
+    연결 수는 동시 수집 수와 같게 (적으면 세마포어를 통과한 요청이 풀에서 또 기다림),
+    keep-alive는 그 이하로 (donga 등 같은 호스트 피드는 연결 재사용).
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+    )
+
+
+async def _archive(feed_name: str | None, content: bytes):
+    """원본 응답 저장 (실패해도 수집은 계속)"""
+    if not ARCHIVE_RAW_FEEDS or not feed_name:
+        return
+    try:
+        await asyncio.to_thread(feed_archive.save_snapshot, feed_name, content)
+    except OSError as e:
+        logger.warning(f"RSS archive error ({feed_name}): {e}")
+
+
+async def fetch_rss_async(client: httpx.AsyncClient, feed_url: str, limit: int = 10, feed_name: str | None = None) -> list:
+    """RSS 피드 비동기 수집 (다운로드는 이벤트 루프, 파싱은 스레드)
+
+    스트리밍 모드에서는 청크가 도착하는 대로 파싱하고, limit개를 채우면
+    나머지 본문은 받지 않고 연결을 닫는다. 아카이브가 켜져 있으면
+    전체 본문이 필요하므로 한 번에 받는다.
+    """
+    if FEED_PARSER_MODE != "stream" or ARCHIVE_RAW_FEEDS:
+        response = await client.get(feed_url)
+        response.raise_for_status()
+        await _archive(feed_name, response.content)
+        return await asyncio.to_thread(parse_entries, response.content, limit)
+
+    async with client.stream("GET", feed_url) as response:
+        response.raise_for_status()
+        parser = FeedStreamParser(limit)
+        received = []
+        articles = []
+        chunks = response.aiter_bytes(STREAM_CHUNK_SIZE)
+        try:
+            async for chunk in chunks:
+                received.append(chunk)
+                articles.extend(await asyncio.to_thread(parser.feed, chunk))
+                if parser.done:
+                    return articles
+            articles.extend(await asyncio.to_thread(parser.close))
+            return articles
+        except (ParseError, ValueError):
+            # 남은 본문까지 받아서 feedparser로 재파싱
+            async for chunk in chunks:
+                received.append(chunk)
+            return await asyncio.to_thread(_parse_feed_fresh, b"".join(received), limit)
+
+
+async def _gather_feeds(fetch_one, concurrency: int) -> list:
+    """피드별 수집 코루틴을 동시 실행하고 결과를 피드 정의 순서로 합침"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _guarded(name: str, url: str) -> list:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                articles = await fetch_one(name, url)
+            except Exception as e:
+                elapsed = time.perf_counter() - started
+                record_feed(name, elapsed, 0, status=type(e).__name__)
+                logger.warning(f"RSS fetch error ({name}, {elapsed:.1f}s): {e!r}")
+                return []
+            record_feed(name, time.perf_counter() - started, len(articles))
+            return articles
+
+    results = await asyncio.gather(*(_guarded(name, url) for name, url in RSS_FEEDS.items()))
+
+    all_articles = []
+    for articles in results:
+        all_articles.extend(articles)
+    return all_articles
+
+
+async def fetch_all_feeds_async(limit_per_feed: int = 5, concurrency: int = FETCH_CONCURRENCY) -> list:
+    """모든 RSS 피드 동시 수집 (전체 소요시간 ≈ 가장 느린 피드)"""
+    async with create_http_client(concurrency) as client:
+        async def _fetch(name: str, url: str) -> list:
+            return await fetch_rss_async(client, url, limit_per_feed, feed_name=name)
+
+        return await _gather_feeds(_fetch, concurrency)
+
+
+def load_snapshot_articles(snapshot: str, limit_per_feed: int = 5) -> list:
+    """아카이브 스냅샷에서 기사 수집 (네트워크 없음, 결정적)"""
+    contents = feed_archive.load_snapshot(snapshot)
+    all_articles = []
+
+    for name in RSS_FEEDS:
+        if name not in contents:
+            continue
+        try:
+            all_articles.extend(parse_entries(contents[name], limit_per_feed))
+        except Exception as e:
+            logger.warning(f"RSS snapshot parse error ({name}): {e}")
+
+    return all_articles
+
+
+def load_feed_states(db: Session) -> dict:
+    """피드 상태 로드 (없는 피드는 생성)"""
+    states = {s.feed_name: s for s in db.query(FeedState).all()}
+    for name, url in RSS_FEEDS.items():
+        if name not in states:
+            states[name] = FeedState(feed_name=name, url=url, seen_guids=[])
+            db.add(states[name])
+        elif states[name].url != url:
+            # URL이 바뀌면 이전 검증값은 무효
+            states[name].url = url
+            states[name].etag = None
+            states[name].last_modified = None
+            states[name].content_hash = None
+    return states
+
+
+async def fetch_rss_conditional(client: httpx.AsyncClient, state: FeedState, limit: int = 10) -> list:
+    """조건부 GET으로 피드 수집 후 처음 보는 항목만 반환
+
+    304 응답이거나 본문 해시가 같으면 파싱 없이 빈 목록을 반환한다.
+    state는 호출 후 갱신되며 커밋은 호출자가 한다.
+    """
+    headers = {}
+    if state.etag:
+        headers["If-None-Match"] = state.etag
+    if state.last_modified:
+        headers["If-Modified-Since"] = state.last_modified
+
+    response = await client.get(state.url, headers=headers)
+    state.fetched_at = datetime.utcnow()
+
+    if response.status_code == 304:
+        return []
+    response.raise_for_status()
+
+    state.etag = response.headers.get("etag")
+    state.last_modified = response.headers.get("last-modified")
+    await _archive(state.feed_name, response.content)
+
+    content_hash = hashlib.sha256(response.content).hexdigest()
+    if content_hash == state.content_hash:
+        return []
+    state.content_hash = content_hash
+
+    # 한 개 더 파싱해서 남은 새 항목이 있는지 확인
+    fresh = await asyncio.to_thread(parse_entries, response.content, limit + 1, set(state.seen_guids or []))
+
+    if len(fresh) > limit:
+        # 남은 새 항목은 다음 수집에서 반환되도록 검증값을 비움
+        fresh = fresh[:limit]
+        state.etag = None
+        state.last_modified = None
+        state.content_hash = None
+
+    if fresh:
+        new_guids = [a["guid"] for a in fresh]
+        state.seen_guids = (new_guids + list(state.seen_guids or []))[:MAX_SEEN_GUIDS]
+    return fresh
+
+
 if __name__ == "__main__":
-    articles = fetch_all_feeds(3)
+    articles = asyncio.run(fetch_all_feeds_async(3))
     for a in articles:
         print(f"[{a['publisher']}] {a['title'][:30]}...")
@@ -0,0 +1,194 @@
+"""
+뉴스/브리핑 전문 검색 색인 (SQLite FTS5)
+- 대상: NewsArticle(title, summary, recreated_content), BriefingNewsItem(title, summary)
+- 한국어는 공백 단위 토큰으로는 조사("삼성전자가") 때문에 검색이 안 되므로
+  단어마다 문자 2-gram으로 쪼개 넣고 (삼성전자 -> 삼성 성전 전자), 검색어도 같은 방식으로 쪼개 구(phrase) 검색
+- 쓰기 시 mapper 이벤트로 같은 트랜잭션에서 색인 갱신, 색인이 비어 있으면 시작 시 전체 재구성
+- BM25 점수(제목 가중치 TITLE_WEIGHT)순, (점수, rowid) 키셋 페이지네이션
+
+FTS5가 없는 DB(PostgreSQL 등)에서는 available()이 False -> 라우트에서 LIKE 검색으로 대체.
+"""
+import logging
+import re
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from ..database import engine
+from ..models.news import NewsArticle
+from ..models.briefing import BriefingNewsItem
+
+logger = logging.getLogger(__name__)
+
+TITLE_WEIGHT = 3.0
+BODY_WEIGHT = 1.0
+
+DOC_NEWS = "news"
+DOC_BRIEFING = "briefing"
+
+_WORD_RE = re.compile(r"\w+")
+_state = {"available": None}
+
+# search_docs: (문서 종류, id) -> FTS rowid (삭제/갱신 시 UNINDEXED 열을 스캔하지 않도록)
+_DDL = (
+    "CREATE TABLE IF NOT EXISTS search_docs ("
+    " rowid INTEGER PRIMARY KEY, doc_type TEXT NOT NULL, doc_id TEXT NOT NULL,"
+    " UNIQUE (doc_type, doc_id))",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(title, body, tokenize='unicode61')",
+)
+
+
+def bigrams(value: str) -> str:
+    """단어별 문자 2-gram을 공백으로 이은 색인용 문자열 (1글자 단어는 그대로)"""
+    grams = []
+    for word in _WORD_RE.findall((value or "").lower()):
+        if len(word) == 1:
+            grams.append(word)
+        else:
+            grams.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return " ".join(grams)
+
+
+def match_query(query: str) -> str | None:
+    """검색어 -> FTS5 MATCH 식 (단어마다 2-gram 구, 단어끼리는 AND)"""
+    terms = []
+    for word in _WORD_RE.findall((query or "").lower()):
+        if len(word) == 1:
+            terms.append(f'"{word}"*')  # 1글자: 그 글자로 시작하는 2-gram
+        else:
+            terms.append('"' + " ".join(word[i:i + 2] for i in range(len(word) - 1)) + '"')
+    return " AND ".join(terms) or None
+
+
+def available(connection: Connection | None = None) -> bool:
+    """FTS 색인 테이블이 있는지 (프로세스별 1회 확인)"""
+    if _state["available"] is None:
+        if engine.dialect.name != "sqlite":
+            _state["available"] = False
+        else:
+            sql = text("SELECT 1 FROM sqlite_master WHERE name = 'search_fts'")
+            if connection is not None:
+                _state["available"] = connection.execute(sql).first() is not None
+            else:
+                with engine.connect() as conn:
+                    _state["available"] = conn.execute(sql).first() is not None
+    return _state["available"]
+
+
+def ensure_search_index():
+    """색인 테이블 생성 + 비어 있으면 기존 데이터로 채움 (앱 시작 시)"""
+    if engine.dialect.name != "sqlite":
+        _state["available"] = False
+        return
+    try:
+        with engine.begin() as conn:
+            for ddl in _DDL:
+                conn.execute(text(ddl))
+            _state["available"] = True
+            if conn.execute(text("SELECT count(*) FROM search_docs")).scalar() == 0:
+                count = rebuild(conn)
+                if count:
+                    logger.info(f"[Search] 검색 색인 구성: {count}건")
+    except Exception as e:
+        # FTS5 없이 빌드된 SQLite
+        logger.warning(f"검색 색인을 만들 수 없음 (LIKE 검색 사용): {e}")
+        _state["available"] = False
+
+
+def rebuild(conn: Connection) -> int:
+    """전체 재구성"""
+    conn.execute(text("DELETE FROM search_fts"))
+    conn.execute(text("DELETE FROM search_docs"))
+    count = 0
+    for row in conn.execute(text("SELECT id, title, summary, recreated_content FROM news_articles")):
+        _upsert(conn, DOC_NEWS, row.id, row.title, f"{row.summary or ''} {row.recreated_content or ''}")
+        count += 1
+    for row in conn.execute(text("SELECT id, title, summary FROM briefing_news_items")):
+        _upsert(conn, DOC_BRIEFING, row.id, row.title, row.summary)
+        count += 1
+    return count
+
+
+def _upsert(conn: Connection, doc_type: str, doc_id: str, title: str, body: str):
+    rowid = conn.execute(
+        text("SELECT rowid FROM search_docs WHERE doc_type = :t AND doc_id = :i"), {"t": doc_type, "i": doc_id}
+    ).scalar()
+    if rowid is None:
+        rowid = conn.execute(
+            text("INSERT INTO search_docs (doc_type, doc_id) VALUES (:t, :i)"), {"t": doc_type, "i": doc_id}
+        ).lastrowid
+    else:
+        conn.execute(text("DELETE FROM search_fts WHERE rowid = :r"), {"r": rowid})
+    conn.execute(
+        text("INSERT INTO search_fts (rowid, title, body) VALUES (:r, :title, :body)"),
+        {"r": rowid, "title": bigrams(title), "body": bigrams(body)},
+    )
+
+
+def _remove(conn: Connection, doc_type: str, doc_ids: list):
+    for doc_id in doc_ids:
+        rowid = conn.execute(
+            text("SELECT rowid FROM search_docs WHERE doc_type = :t AND doc_id = :i"), {"t": doc_type, "i": doc_id}
+        ).scalar()
+        if rowid is not None:
+            conn.execute(text("DELETE FROM search_fts WHERE rowid = :r"), {"r": rowid})
+            conn.execute(text("DELETE FROM search_docs WHERE rowid = :r"), {"r": rowid})
+
+
+def remove_briefing_items(db: Session, item_ids: list):
+    """벌크 삭제(query.delete())는 mapper 이벤트가 없으므로 직접 호출"""
+    if item_ids and available():
+        _remove(db.connection(), DOC_BRIEFING, item_ids)
+
+
+def search(db: Session, query: str, limit: int, after: tuple | None = None, offset: int = 0) -> tuple[list, int]:
+    """BM25순 검색 결과 [(doc_type, doc_id, score, rowid)]와 전체 건수
+
+    after: 이전 페이지 마지막 (score, rowid) - 점수가 낮을수록(음수) 관련도 높음
+    offset: after 없이 page로 요청할 때
+    """
+    expr = match_query(query)
+    if expr is None:
+        return [], 0
+
+    params = {"q": expr, "limit": limit, "offset": offset, "tw": TITLE_WEIGHT, "bw": BODY_WEIGHT}
+    keyset = ""
+    if after is not None:
+        keyset = "WHERE (hits.score, hits.rowid) > (:score, :rowid)"
+        params.update(score=after[0], rowid=after[1])
+
+    rows = db.execute(text(
+        "SELECT d.doc_type, d.doc_id, hits.score, hits.rowid FROM ("
+        "  SELECT rowid, bm25(search_fts, :tw, :bw) AS score FROM search_fts WHERE search_fts MATCH :q"
+        f") AS hits JOIN search_docs d ON d.rowid = hits.rowid {keyset} "
+        "ORDER BY hits.score, hits.rowid LIMIT :limit OFFSET :offset"
+    ), params).all()
+    total = db.execute(text("SELECT count(*) FROM search_fts WHERE search_fts MATCH :q"), {"q": expr}).scalar()
+    return [tuple(row) for row in rows], total
+
+
+# 쓰기 시 같은 트랜잭션에서 색인 갱신
+@event.listens_for(NewsArticle, "after_insert")
+@event.listens_for(NewsArticle, "after_update")
+def _on_news_write(mapper, connection, target):
+    if available(connection):
+        _upsert(connection, DOC_NEWS, target.id, target.title,
+                f"{target.summary or ''} {target.recreated_content or ''}")
+
+
+@event.listens_for(BriefingNewsItem, "after_insert")
+@event.listens_for(BriefingNewsItem, "after_update")
+def _on_briefing_item_write(mapper, connection, target):
+    if available(connection):
+        _upsert(connection, DOC_BRIEFING, target.id, target.title, target.summary)
+
+
+@event.listens_for(NewsArticle, "after_delete")
+def _on_news_delete(mapper, connection, target):
+    if available(connection):
+        _remove(connection, DOC_NEWS, [target.id])
+
+
+@event.listens_for(BriefingNewsItem, "after_delete")
+def _on_briefing_item_delete(mapper, connection, target):
+    if available(connection):
+        _remove(connection, DOC_BRIEFING, [target.id])
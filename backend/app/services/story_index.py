@@ -0,0 +1,143 @@
+"""
+스토리 지문 인덱스 (날짜를 넘는 중복 스토리 탐지)
+- 처리한 기사 제목의 문자 2-gram 지문을 DB에 저장 (FINGERPRINT_WINDOW_DAYS 동안)
+- 새 기사를 재창작하기 전에 최근 처리한 스토리와 MinHash/LSH로 비교
+- 같은 스토리면 건너뛰거나 저장된 재창작 결과를 재사용 (Claude 호출 절약)
+
+제목 유사도만으로는 "금리 인하 시사"/"금리 동결 시사"처럼 한 단어만 다른 반대 기사도
+같은 스토리가 된다. 그래서
+- 건너뛰기(find): 유사도 + 숫자가 같고 한쪽 제목의 단어가 모두 다른 쪽에 들어 있을 때만
+  (말머리/꼬리말만 붙은 변형은 통과, 단어가 서로 바뀐 제목은 다른 스토리)
+- 재창작 재사용(find_reusable): 같은 원문 URL이거나 정규화한 제목이 똑같을 때만
+"""
+import re
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from sqlalchemy.orm import Session
+from ..models.fingerprint import StoryFingerprint
+from .near_duplicate import _BRACKET_RE, MinHashLSH, jaccard, shingles
+
+FINGERPRINT_WINDOW_DAYS = 3
+# 후보 선별용 제목 유사도 (같은 스토리 판정은 same_story의 단어/숫자 검사까지)
+FINGERPRINT_THRESHOLD = 0.35
+
+_WORD_RE = re.compile(r"[0-9a-z가-힣]+")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+# RSS 제목 끝의 언론사 표기 ("... - 연합뉴스", "... | 한국경제")
+_PUBLISHER_TAIL_RE = re.compile(r"\s+[-|]\s+[^-|]{1,20}$")
+
+_LSH = MinHashLSH(FINGERPRINT_THRESHOLD)
+
+
+def _words(title: str) -> list:
+    title = _PUBLISHER_TAIL_RE.sub("", _BRACKET_RE.sub("", title or ""))
+    return _WORD_RE.findall(title.lower())
+
+
+def same_story(title: str, other: str) -> bool:
+    """제목 유사도 + 숫자 일치 + 한쪽 제목의 단어가 모두 다른 쪽에 포함 (띄어쓰기 무시)"""
+    if jaccard(shingles(title), shingles(other)) < FINGERPRINT_THRESHOLD:
+        return False
+    words, other_words = _words(title), _words(other)
+    if set(_NUMBER_RE.findall(" ".join(words))) != set(_NUMBER_RE.findall(" ".join(other_words))):
+        return False
+    joined, other_joined = "".join(words), "".join(other_words)
+    return all(w in other_joined for w in words) or all(w in joined for w in other_words)
+
+
+def evict_expired(db: Session, now: datetime | None = None) -> int:
+    """보관 기간이 지난 지문 삭제"""
+    cutoff = (now or datetime.utcnow()) - timedelta(days=FINGERPRINT_WINDOW_DAYS)
+    return db.query(StoryFingerprint).filter(StoryFingerprint.created_at < cutoff).delete(synchronize_session=False)
+
+
+def _before(row: StoryFingerprint, before: date | None) -> bool:
+    return before is None or (row.briefing_date is not None and row.briefing_date < before)
+
+
+class StoryIndex:
+    """최근 지문을 메모리 LSH 버킷으로 올려두고 조회/추가"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        # 정리 결과는 바로 커밋 (DELETE가 잡은 SQLite 쓰기 잠금이 재창작 내내 남으면 LLM 캐시 저장이 막힘)
+        evict_expired(db)
+        db.commit()
+        self._entries = []   # (StoryFingerprint, 2-gram 집합)
+        self._buckets = defaultdict(list)  # (밴드, 키) -> 엔트리 인덱스
+        self._by_url = {}    # 원문 URL -> StoryFingerprint
+
+        rows = db.query(StoryFingerprint).all()
+        if rows:
+            sets = [set(r.shingles or ()) for r in rows]
+            keys = _LSH.band_keys(_LSH.signatures(sets))
+            for row, shingle_set, row_keys in zip(rows, sets, keys):
+                self._insert(row, shingle_set, row_keys)
+
+    def _insert(self, row: StoryFingerprint, shingle_set: set, row_keys):
+        idx = len(self._entries)
+        self._entries.append((row, shingle_set))
+        self._by_url[row.source_url] = row
+        for band, key in enumerate(row_keys.tolist()):
+            self._buckets[(band, key)].append(idx)
+
+    def _matches(self, title: str, before: date | None):
+        """LSH 후보 중 same_story인 기존 지문 (제목 유사도 높은 순)"""
+        shingle_set = shingles(title)
+        if not shingle_set or not self._entries:
+            return []
+
+        keys = _LSH.band_keys(_LSH.signatures([shingle_set]))[0].tolist()
+        candidates = {i for band, key in enumerate(keys) for i in self._buckets.get((band, key), ())}
+
+        scored = []
+        for i in candidates:
+            row, other = self._entries[i]
+            if not _before(row, before):
+                continue
+            score = jaccard(shingle_set, other)
+            if score >= FINGERPRINT_THRESHOLD and same_story(title, row.title):
+                scored.append((score, i, row))
+        return [row for _, _, row in sorted(scored, key=lambda s: (-s[0], s[1]))]
+
+    def find(self, title: str, before: date | None = None, source_url: str | None = None) -> StoryFingerprint | None:
+        """같은 스토리로 보이는 기존 지문 (없으면 None) - 건너뛰기 판단용
+
+        before를 주면 그 날짜 이전 브리핑에 실린 스토리만 본다.
+        """
+        row = self._by_url.get(source_url) if source_url else None
+        if row is not None and _before(row, before):
+            return row
+        matches = self._matches(title, before)
+        return matches[0] if matches else None
+
+    def find_reusable(self, title: str, source_url: str | None = None) -> StoryFingerprint | None:
+        """재창작 결과를 그대로 써도 되는 지문 - 같은 원문 URL이거나 정규화한 제목이 같을 때만"""
+        row = self._by_url.get(source_url) if source_url else None
+        if row is not None and row.recreated_title and row.recreated_summary:
+            return row
+        key = "".join(_words(title))
+        for row in self._matches(title, None):
+            if row.recreated_title and row.recreated_summary and "".join(_words(row.title)) == key:
+                return row
+        return None
+
+    def add(self, title: str, source_url: str, recreated: dict | None = None,
+            article_id: str | None = None, briefing_date: date | None = None) -> StoryFingerprint:
+        """처리한 스토리 지문 저장 (커밋은 호출자가 함)"""
+        shingle_set = shingles(title)
+        recreated = recreated or {}
+        row = StoryFingerprint(
+            title=title[:500],
+            source_url=source_url,
+            shingles=sorted(shingle_set),
+            recreated_title=recreated.get("title"),
+            recreated_summary=recreated.get("summary"),
+            article_id=article_id,
+            briefing_date=briefing_date,
+        )
+        self.db.add(row)
+        if shingle_set:
+            keys = _LSH.band_keys(_LSH.signatures([shingle_set]))[0]
+            self._insert(row, shingle_set, keys)
+        return row
@@ -0,0 +1,135 @@
+"""
+뉴스 태그 역색인 (tags + article_tags)
+- NewsArticle.tags(JSON)는 응답 표시용으로 그대로 두고, 태그별 기사 조회/집계는 정규화 테이블로
+- 기사 저장/수정/삭제 시 mapper 이벤트로 같은 트랜잭션에서 연결 갱신
+- 앱 시작 시 연결 테이블이 비어 있으면 기존 JSON 태그로 채움 (backfill)
+- 새 태그는 insert-or-ignore 후 다시 조회 (동시에 같은 새 태그를 저장해도 unique 충돌 없음)
+"""
+import logging
+from sqlalchemy import delete, event, func, insert, inspect, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..database import engine
+from ..models.news import NewsArticle, Tag, article_tags
+
+logger = logging.getLogger(__name__)
+
+MAX_TAG_LENGTH = 50
+
+# 충돌 시 무시하는 INSERT (ON CONFLICT DO NOTHING)를 지원하는 방언
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def normalize(tags) -> list:
+    """공백 정리 + 빈 값/중복 제거 (순서 유지)"""
+    names = []
+    for tag in tags or []:
+        name = " ".join(str(tag or "").split())[:MAX_TAG_LENGTH]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def _tag_ids(conn: Connection, names: list) -> dict:
+    """이름 -> tag id (없는 태그는 생성)"""
+    ids = dict(conn.execute(select(Tag.name, Tag.id).where(Tag.name.in_(names))).all())
+    missing = [name for name in names if name not in ids]
+    if missing:
+        _insert_missing(conn, missing)
+        ids.update(conn.execute(select(Tag.name, Tag.id).where(Tag.name.in_(missing))).all())
+    return ids
+
+
+def _insert_missing(conn: Connection, names: list):
+    """태그 생성 (그 사이 다른 트랜잭션이 만든 이름은 건너뜀)"""
+    dialect_insert = _UPSERT_INSERTS.get(conn.dialect.name)
+    if dialect_insert is not None:
+        conn.execute(dialect_insert(Tag).on_conflict_do_nothing(index_elements=[Tag.name]),
+                     [{"name": name} for name in names])
+        return
+    for name in names:
+        try:
+            with conn.begin_nested():
+                conn.execute(insert(Tag), {"name": name})
+        except IntegrityError:
+            pass
+
+
+def sync_article(conn: Connection, article_id: str, tags):
+    """기사 1건의 태그 연결을 JSON 태그 목록과 같게"""
+    conn.execute(delete(article_tags).where(article_tags.c.article_id == article_id))
+    names = normalize(tags)
+    if names:
+        ids = _tag_ids(conn, names)
+        conn.execute(insert(article_tags), [{"article_id": article_id, "tag_id": ids[name]} for name in names])
+
+
+def backfill() -> int:
+    """연결 테이블이 비어 있으면 news_articles.tags(JSON)로 채움 (앱 시작 시)"""
+    with engine.begin() as conn:
+        if conn.execute(select(article_tags.c.article_id).limit(1)).first():
+            return 0
+        count = 0
+        for article_id, tags in conn.execute(select(NewsArticle.id, NewsArticle.tags)):
+            if normalize(tags):
+                sync_article(conn, article_id, tags)
+                count += 1
+    if count:
+        logger.info(f"[Tags] 태그 색인 구성: 기사 {count}건")
+    return count
+
+
+def tagged_article_ids(names: list):
+    """모든 태그가 붙은 기사 id 서브쿼리 (태그별 (tag_id, article_id) 인덱스 조회의 교집합)"""
+    query = None
+    for name in names:
+        ids = select(article_tags.c.article_id).join(Tag, Tag.id == article_tags.c.tag_id).where(Tag.name == name)
+        query = ids if query is None else query.intersect(ids)
+    return query
+
+
+def tag_counts(db: Session, limit: int) -> list:
+    """태그별 기사 수 (많은 순)"""
+    rows = db.execute(
+        select(Tag.name, func.count(article_tags.c.article_id).label("count"))
+        .join(article_tags, article_tags.c.tag_id == Tag.id)
+        .group_by(Tag.id, Tag.name)
+        .order_by(func.count(article_tags.c.article_id).desc(), Tag.name)
+        .limit(limit)
+    ).all()
+    return [{"name": name, "count": count} for name, count in rows]
+
+
+def related_tags(db: Session, article_id: str, limit: int) -> list:
+    """이 기사의 태그와 같은 기사에 자주 함께 붙은 다른 태그 (함께 붙은 횟수순)"""
+    own = select(article_tags.c.tag_id).where(article_tags.c.article_id == article_id)
+    neighbors = select(article_tags.c.article_id).where(article_tags.c.tag_id.in_(own))
+    rows = db.execute(
+        select(Tag.name, func.count().label("count"))
+        .select_from(article_tags)
+        .join(Tag, Tag.id == article_tags.c.tag_id)
+        .where(article_tags.c.article_id.in_(neighbors), article_tags.c.tag_id.not_in(own))
+        .group_by(Tag.id, Tag.name)
+        .order_by(func.count().desc(), Tag.name)
+        .limit(limit)
+    ).all()
+    return [name for name, _ in rows]
+
+
+# 기사 쓰기 시 같은 트랜잭션에서 연결 갱신 (after_update는 tags가 바뀐 경우만)
+@event.listens_for(NewsArticle, "after_insert")
+def _on_insert(mapper, connection, target):
+    sync_article(connection, target.id, target.tags)
+
+
+@event.listens_for(NewsArticle, "after_update")
+def _on_update(mapper, connection, target):
+    if inspect(target).attrs.tags.history.has_changes():
+        sync_article(connection, target.id, target.tags)
+
+
+@event.listens_for(NewsArticle, "after_delete")
+def _on_delete(mapper, connection, target):
+    connection.execute(delete(article_tags).where(article_tags.c.article_id == target.id))
@@ -0,0 +1,60 @@
+"""저장된 재창작 기사 저작권 일괄 검사
+
+수집 원문(raw_articles, 보관 기간 내)이 남아 있는 기사만 원문과 비교한다.
+
+사용:
+    python scripts/audit_copyright.py               # news_articles + 브리핑 뉴스
+    python scripts/audit_copyright.py --show 20     # 위반 20건 상세 출력
+"""
+import argparse
+import sys
+import os
+import time
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.models.news import NewsArticle
+from app.models.briefing import BriefingNewsItem
+from app.models.feed import RawArticle
+from app.services import copyright_validator
+
+
+def _pairs(rows, originals: dict):
+    """(id, 원문, 재창작 요약, 출처) - 원문 없는 기사는 제외"""
+    for row in rows:
+        raw = originals.get(row.source_url)
+        if raw is None:
+            continue
+        yield row.id, f"{raw.title}. {raw.summary}", row.summary or "", {
+            "source_url": row.source_url, "publisher": row.publisher,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="재창작 기사 저작권 일괄 검사")
+    parser.add_argument("--show", type=int, default=10, help="상세 출력할 위반 건수")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        originals = {r.source_url: r for r in db.query(RawArticle).order_by(RawArticle.fetched_at).all()}
+        for label, model in (("news_articles", NewsArticle), ("briefing_news_items", BriefingNewsItem)):
+            rows = db.query(model).all()
+            started = time.perf_counter()
+            result = copyright_validator.audit(_pairs(rows, originals))
+            elapsed = time.perf_counter() - started
+
+            print(f"[{label}] 전체 {len(rows)}건, 원문 대조 {result['checked']}건, "
+                  f"위반 {len(result['violations'])}건 ({elapsed * 1000:.1f}ms)")
+            for v in result["violations"][:args.show]:
+                print(f"  {v['id']}: {', '.join(v['errors'])}")
+                for span in v["copied_spans"][:3]:
+                    print(f"    - \"{span}\"")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
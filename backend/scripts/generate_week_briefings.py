@@ -9,9 +9,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import SessionLocal, engine, Base
 from app.models.briefing import DailyBriefing, BriefingNewsItem
-from app.services.rss_service import fetch_all_feeds
+from app.services.ingest_scheduler import collect_articles
 from app.services.news_filter import run_pipeline
-from app.services.claude_service import recreate_news, generate_daily_summary
+from app.services.claude_service import recreate_news_batch, generate_daily_summary, is_validated
+from app.services.story_index import StoryIndex
+from app.services.instrumentation import start_run
+from app.services import search_index  # noqa: F401 (저장 시 검색 색인 갱신)
 import uuid
 
 
@@ -30,10 +33,14 @@ async def generate_briefing_for_date(target_date: date, db):
         return False
 
     # RSS에서 뉴스 수집
-    print(f"[{target_date}] RSS 뉴스 수집 중...")
-    all_news = fetch_all_feeds(limit_per_feed=10)
+    print(f"[{target_date}] 뉴스 수집 중...")
+    all_news = await collect_articles(db, limit_per_feed=10)
     print(f"[{target_date}] 수집된 뉴스: {len(all_news)}개")
 
+    # 이전 날짜 브리핑에 이미 실린 스토리 제외
+    index = StoryIndex(db)
+    all_news = [n for n in all_news if not index.find(n["title"], before=target_date)]
+
     # 파이프라인 실행
     filtered_news = run_pipeline(all_news)
     print(f"[{target_date}] 필터링 후: {len(filtered_news)}개")
@@ -46,16 +53,30 @@ async def generate_briefing_for_date(target_date: date, db):
     news_items_data = []
     recreated_titles = []
 
+    # 최근 재창작한 같은 스토리가 있으면 결과 재사용
+    recreated_list = [None] * len(filtered_news)
+    pending = []
     for i, news in enumerate(filtered_news):
-        print(f"[{target_date}] 뉴스 {i+1}/{len(filtered_news)} 재창작 중...")
-        original_text = f"{news['title']}. {news['summary']}"
-
-        try:
-            recreated = await recreate_news(original_text)
-        except Exception as e:
-            print(f"  Claude API 오류: {e}")
-            recreated = {"title": news["title"], "summary": news["summary"]}
-
+        known = index.find(news["title"])
+        if known and known.recreated_title and known.recreated_summary:
+            recreated_list[i] = {"title": known.recreated_title, "summary": known.recreated_summary, "validated": True}
+        else:
+            pending.append(i)
+    print(f"[{target_date}] 재창작 {len(pending)}개 (재사용 {len(filtered_news) - len(pending)}개)...")
+
+    # 나머지는 배치 요청으로 재창작 (검증 실패분만 개별 재시도)
+    try:
+        results = await recreate_news_batch([f"{filtered_news[i]['title']}. {filtered_news[i]['summary']}" for i in pending])
+    except Exception as e:
+        print(f"  Claude API 오류: {e}")
+        results = [{"title": filtered_news[i]["title"], "summary": filtered_news[i]["summary"]} for i in pending]
+    for i, result in zip(pending, results):
+        recreated_list[i] = result
+
+    for i, (news, recreated) in enumerate(zip(filtered_news, recreated_list)):
+        # 검증을 통과한 재창작만 재사용 대상으로 저장
+        index.add(news["title"], news["source_url"], recreated if is_validated(recreated) else None,
+                  briefing_date=target_date)
         recreated_titles.append(recreated.get("title", news["title"]))
         news_items_data.append((news, recreated))
 
@@ -111,14 +132,11 @@ async def main():
 
         for i in range(7):
             target_date = today - timedelta(days=i)
-            result = await generate_briefing_for_date(target_date, db)
+            async with start_run("week_briefing", date=target_date.isoformat()):
+                result = await generate_briefing_for_date(target_date, db)
             if result:
                 success_count += 1
-
-            # API 호출 간격 (rate limit 방지)
-            if i < 6:
-                print("\n잠시 대기 중... (3초)")
-                await asyncio.sleep(3)
+            # 호출 간격은 claude_service.limiter가 조절
 
         print("\n" + "=" * 50)
         print(f"완료! {success_count}개 브리핑 생성됨")
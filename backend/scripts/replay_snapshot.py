@@ -0,0 +1,97 @@
+"""RSS 스냅샷 재생 스크립트 (네트워크 없이 파이프라인 재현/성능 측정)
+
+사용:
+    python scripts/replay_snapshot.py                       # 저장된 스냅샷 목록
+    python scripts/replay_snapshot.py 2026-10-17            # 필터 파이프라인만 실행
+    python scripts/replay_snapshot.py 2026-10-17 --repeat 20
+    python scripts/replay_snapshot.py 2026-10-17T063000 --briefing 2026-10-17   # 브리핑 생성 (Claude 호출)
+    python scripts/replay_snapshot.py 2026-10-17 --briefing 2026-10-17 --fake-llm  # 가짜 LLM으로 완전 오프라인
+"""
+import argparse
+import asyncio
+import sys
+import os
+import time
+from datetime import date
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal, engine, Base
+from app.services import feed_archive
+from app.services.rss_service import load_snapshot_articles
+from app.services.news_filter import run_pipeline
+
+
+def replay_pipeline(snapshot: str, limit_per_feed: int, repeat: int):
+    """스냅샷으로 필터 파이프라인 실행 후 소요시간 출력"""
+    started = time.perf_counter()
+    articles = load_snapshot_articles(snapshot, limit_per_feed)
+    load_time = time.perf_counter() - started
+    print(f"[{snapshot}] 기사 {len(articles)}개 로드 ({load_time * 1000:.1f}ms)")
+
+    timings = []
+    selected = []
+    for _ in range(repeat):
+        # 파이프라인이 dict를 수정하므로 매번 복사본 사용
+        batch = [dict(a) for a in articles]
+        started = time.perf_counter()
+        selected = run_pipeline(batch)
+        timings.append(time.perf_counter() - started)
+
+    timings.sort()
+    print(f"[{snapshot}] 파이프라인 {repeat}회: 최소 {timings[0] * 1000:.2f}ms, "
+          f"중앙값 {timings[len(timings) // 2] * 1000:.2f}ms")
+    for a in selected:
+        print(f"  - [{a.get('category_name')}] {a['title'][:40]} (score={a.get('score', 0):.2f})")
+
+
+async def replay_briefing(snapshot: str, target_date: date):
+    """스냅샷으로 브리핑 생성 (재창작은 Claude 호출)"""
+    from app.routes.briefing import _generate_briefing_internal
+    from app.models.briefing import DailyBriefing
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if db.query(DailyBriefing).filter(DailyBriefing.briefing_date == target_date).first():
+            print(f"[{target_date}] 이미 브리핑이 존재합니다")
+            return
+        briefing = await _generate_briefing_internal(target_date, db, snapshot=snapshot)
+        print(f"[{target_date}] 브리핑 생성 완료: {briefing.id} (뉴스 {len(briefing.news_items)}개)")
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RSS 스냅샷 재생")
+    parser.add_argument("snapshot", nargs="?", help="YYYY-MM-DD 또는 YYYY-MM-DDTHHMMSS")
+    parser.add_argument("--limit-per-feed", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--briefing", type=date.fromisoformat, help="이 날짜로 브리핑 생성")
+    parser.add_argument("--fake-llm", action="store_true", help="Claude 대신 가짜 LLM 사용 (app/services/fake_llm.py)")
+    args = parser.parse_args()
+
+    if not args.snapshot:
+        snapshots = feed_archive.list_snapshots()
+        print("저장된 스냅샷:" if snapshots else "저장된 스냅샷 없음")
+        for s in snapshots:
+            print(f"  {s}")
+        return
+
+    if not feed_archive.snapshot_exists(args.snapshot):
+        print(f"스냅샷을 찾을 수 없습니다: {args.snapshot}")
+        sys.exit(1)
+
+    if args.briefing:
+        if args.fake_llm:
+            from app.services import claude_service
+            from app.services.fake_llm import FakeLLM
+            claude_service.set_client(FakeLLM())
+        asyncio.run(replay_briefing(args.snapshot, args.briefing))
+    else:
+        replay_pipeline(args.snapshot, args.limit_per_feed, max(args.repeat, 1))
+
+
+if __name__ == "__main__":
+    main()
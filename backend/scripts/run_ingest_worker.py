@@ -0,0 +1,29 @@
+"""RSS 수집 워커 (API 서버와 분리 실행)
+
+사용: python scripts/run_ingest_worker.py
+API 서버는 INGEST_SCHEDULER=0으로 실행 (켜 둬도 실행권을 잡은 한 프로세스만 폴링)
+"""
+import asyncio
+import logging
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import engine, Base
+from app.models import feed  # noqa: F401 (테이블 등록)
+from app.services.ingest_scheduler import IngestScheduler
+
+
+async def main():
+    Base.metadata.create_all(bind=engine)
+    await IngestScheduler().run_forever()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n수집 워커 종료")
@@ -0,0 +1,69 @@
+"""pytest 공통 설정
+
+- 임시 SQLite DB, 가짜 LLM(FAKE_LLM=1), 백그라운드 스케줄러 끔 - app을 import하기 전에 환경변수로 지정
+- app/config.py(.env 설정)가 없는 체크아웃에서는 같은 환경변수를 읽는 최소 설정 모듈을 대신 등록
+"""
+import os
+import sys
+import tempfile
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_TMP_DIR = tempfile.mkdtemp(prefix="macnac-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TMP_DIR, 'test.db')}"
+os.environ.setdefault("ANTHROPIC_API_KEY", "test")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ["FAKE_LLM"] = "1"
+os.environ["BRIEFING_SCHEDULER"] = "0"
+os.environ["INGEST_SCHEDULER"] = "0"
+
+try:
+    import app.config  # noqa: F401
+except ImportError:
+    class _Settings:
+        app_name = "MACNAC"
+        debug = False
+        database_url = os.environ["DATABASE_URL"]
+        anthropic_api_key = os.environ["ANTHROPIC_API_KEY"]
+        secret_key = os.environ["SECRET_KEY"]
+        jwt_algorithm = "HS256"
+        access_token_expire_minutes = 60
+
+    _config = types.ModuleType("app.config")
+    _config.get_settings = lambda: _Settings()
+    sys.modules["app.config"] = _config
+
+
+@pytest.fixture(scope="session")
+def client():
+    """API 테스트 클라이언트 (app.main import 시 테이블/색인 생성, lifespan은 실행하지 않음)"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    return TestClient(app)
+
+
+@pytest.fixture
+def db(client):
+    from app.database import SessionLocal
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """요청 수를 세는 가짜 LLM + LLM 캐시 끔 (테스트끼리 캐시 결과를 공유하지 않도록)"""
+    from app.services import claude_service, llm_cache
+    from app.services.fake_llm import FakeLLM
+
+    fake = FakeLLM()
+    previous = claude_service.client
+    claude_service.set_client(fake)
+    monkeypatch.setattr(llm_cache, "CACHE_ENABLED", False)
+    yield fake
+    claude_service.set_client(previous)
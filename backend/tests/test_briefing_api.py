@@ -0,0 +1,95 @@
+"""브리핑 조회 API 테스트 (목록 날짜 범위, 응답 캐시 Cache-Control/ETag/gzip)"""
+from datetime import timedelta
+
+import pytest
+
+from app.models.briefing import BriefingNewsItem, DailyBriefing
+from app.services import briefing_scheduler, response_cache
+
+
+@pytest.fixture(scope="module")
+def briefings(client):
+    """어제/오늘/내일(스케줄러가 미리 만든) 브리핑 - 날짜 -> id"""
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    today = briefing_scheduler.today()
+    rows = {}
+    for offset in (-1, 0, 1):
+        briefing = DailyBriefing(briefing_date=today + timedelta(days=offset), daily_summary="요약")
+        # gzip 본이 생기도록 GZIP_MIN_BYTES보다 큰 응답
+        briefing.news_items = [BriefingNewsItem(
+            title=f"뉴스 {i}", summary="반도체 수출이 석 달째 늘었다. " * 5, publisher="테스트일보",
+            source_url=f"https://example.com/{offset}/{i}", category="industry", order=i,
+        ) for i in range(5)]
+        rows[offset] = briefing
+    db.add_all(rows.values())
+    db.commit()
+    ids = {offset: briefing.id for offset, briefing in rows.items()}
+    yield ids
+
+    for briefing in rows.values():
+        response_cache.invalidate(briefing.id)
+        for item in briefing.news_items:
+            db.delete(item)
+        db.delete(briefing)
+    db.commit()
+    db.close()
+
+
+def test_list_excludes_future_briefing(client, briefings):
+    listed = {b["id"]: b for b in client.get("/api/v1/briefing").json()["briefings"]}
+
+    assert briefings[-1] in listed and briefings[0] in listed
+    assert briefings[1] not in listed
+    assert listed[briefings[0]]["is_today"] and not listed[briefings[-1]]["is_today"]
+
+
+@pytest.mark.parametrize("offset, cache_control", [
+    (-1, response_cache.PAST_CACHE_CONTROL),
+    (0, response_cache.LIVE_CACHE_CONTROL),
+    (1, response_cache.LIVE_CACHE_CONTROL),  # 내일 브리핑은 재생성될 수 있으므로 immutable이 아님
+])
+def test_cache_control_by_date(client, briefings, offset, cache_control):
+    # 첫 요청(DB) / 두 번째 요청(캐시) 모두 같은 헤더
+    for _ in range(2):
+        response = client.get(f"/api/v1/briefing/{briefings[offset]}")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == cache_control
+
+
+def test_etag_not_modified(client, briefings):
+    url = f"/api/v1/briefing/{briefings[-1]}"
+    first = client.get(url, headers={"Accept-Encoding": "identity"})
+    etag = first.headers["etag"]
+
+    again = client.get(url, headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+
+    changed = client.get(url, headers={"Accept-Encoding": "identity", "If-None-Match": '"other"'})
+    assert changed.status_code == 200
+    assert changed.json() == first.json()
+
+
+def test_gzip_body_has_own_etag(client, briefings):
+    url = f"/api/v1/briefing/{briefings[-1]}"
+    plain = client.get(url, headers={"Accept-Encoding": "identity"})
+    gzipped = client.get(url, headers={"Accept-Encoding": "gzip"})
+
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["etag"] != plain.headers["etag"]
+    assert gzipped.json() == plain.json()  # 클라이언트가 풀어서 같은 본문
+    assert client.get(url, headers={"Accept-Encoding": "gzip",
+                                    "If-None-Match": gzipped.headers["etag"]}).status_code == 304
+
+
+def test_cached_entry_rebuilt_after_date_change(briefings):
+    today = briefing_scheduler.today()
+    entry = response_cache.put("test-entry", today, {"is_today": True}, today)
+
+    assert entry.cache_control == response_cache.LIVE_CACHE_CONTROL
+    assert response_cache.get("test-entry", today) is entry
+    # 자정이 지나면 어제 브리핑이 되므로 다시 만들어야 함 (is_today/Cache-Control이 바뀜)
+    assert response_cache.get("test-entry", today + timedelta(days=1)) is None
+    response_cache.invalidate("test-entry")
@@ -0,0 +1,121 @@
+"""브리핑 생성 단일 실행(briefing_jobs) 테스트"""
+import asyncio
+import itertools
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.models.briefing import BriefingJob, DailyBriefing
+from app.services import briefing_jobs
+
+_days = itertools.count()
+
+
+@pytest.fixture
+def target_date(db):
+    """테스트마다 다른 날짜 (작업/브리핑 행이 섞이지 않도록)"""
+    day = date(2001, 1, 1) + timedelta(days=next(_days))
+    yield day
+    db.query(BriefingJob).filter(BriefingJob.briefing_date == day).delete()
+    db.query(DailyBriefing).filter(DailyBriefing.briefing_date == day).delete()
+    db.commit()
+
+
+def _status(db, job_id: str) -> str:
+    db.expire_all()
+    return db.query(BriefingJob).filter(BriefingJob.id == job_id).one().status
+
+
+def test_first_claim_owns_second_waits(db, target_date):
+    job, owned = briefing_jobs.claim(db, target_date)
+    other, other_owned = briefing_jobs.claim(db, target_date)
+
+    assert owned and not other_owned
+    assert other.id == job.id
+
+
+def test_failed_job_taken_over(db, target_date):
+    job, _ = briefing_jobs.claim(db, target_date)
+    briefing_jobs.finish(job.id, error="RuntimeError: 실패")
+
+    again, owned = briefing_jobs.claim(db, target_date)
+
+    assert owned
+    assert again.id == job.id
+    assert again.status == "running" and again.error is None
+
+
+def test_stale_running_job_taken_over(db, target_date):
+    job, _ = briefing_jobs.claim(db, target_date)
+    stale = datetime.utcnow() - timedelta(seconds=briefing_jobs.JOB_STALE_SECONDS + 1)
+    db.query(BriefingJob).filter(BriefingJob.id == job.id).update({"started_at": stale, "owner": "dead:1"})
+    db.commit()
+
+    again, owned = briefing_jobs.claim(db, target_date)
+
+    assert owned
+    assert again.owner == briefing_jobs._OWNER
+
+
+def test_done_job_reclaimed_only_after_briefing_deleted(db, target_date):
+    briefing = DailyBriefing(briefing_date=target_date)
+    db.add(briefing)
+    db.commit()
+    job, _ = briefing_jobs.claim(db, target_date)
+    briefing_jobs.finish(job.id, briefing_id=briefing.id)
+
+    assert briefing_jobs.claim(db, target_date)[1] is False
+
+    db.delete(briefing)
+    db.commit()
+    assert briefing_jobs.claim(db, target_date)[1] is True
+
+
+def test_failure_does_not_overwrite_done(db, target_date):
+    job, _ = briefing_jobs.claim(db, target_date)
+    briefing_jobs.finish(job.id, briefing_id="b1")
+    briefing_jobs.finish(job.id, error="GeneratorExit: ")
+
+    assert _status(db, job.id) == "done"
+
+
+def test_single_flight_runs_generate_once(db, target_date):
+    calls = []
+
+    async def generate(session, emit):
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        briefing = DailyBriefing(briefing_date=target_date)
+        session.add(briefing)
+        session.commit()
+        session.refresh(briefing)
+        return briefing
+
+    async def main():
+        return await asyncio.gather(*(briefing_jobs.run_single_flight(target_date, generate) for _ in range(5)))
+
+    ids = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert len(set(ids)) == 1
+
+
+def test_single_flight_wait_timeout_raises_pending(db, target_date):
+    async def generate(session, emit):
+        await asyncio.sleep(0.2)
+        briefing = DailyBriefing(briefing_date=target_date)
+        session.add(briefing)
+        session.commit()
+        session.refresh(briefing)
+        return briefing
+
+    async def main():
+        with pytest.raises(briefing_jobs.JobPending) as pending:
+            await briefing_jobs.run_single_flight(target_date, generate, wait=0.01)
+        # 기다림이 끝나도 생성은 계속됨
+        return pending.value.job_id, await briefing_jobs.run_single_flight(target_date, generate)
+
+    job_id, briefing_id = asyncio.run(main())
+
+    assert _status(db, job_id) == "done"
+    assert briefing_id
@@ -0,0 +1,129 @@
+"""브리핑 생성 SSE 스트림 테스트 (백그라운드 생성 구독, 연결 끊김)"""
+import asyncio
+import itertools
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.briefing import BriefingJob, DailyBriefing
+from app.routes import briefing as briefing_route
+from app.services import briefing_jobs
+
+_days = itertools.count()
+
+
+@pytest.fixture
+def target_date(db):
+    day = date(2002, 1, 1) + timedelta(days=next(_days))
+    yield day
+    db.query(BriefingJob).filter(BriefingJob.briefing_date == day).delete()
+    db.query(DailyBriefing).filter(DailyBriefing.briefing_date == day).delete()
+    db.commit()
+
+
+@pytest.fixture
+def fake_events(monkeypatch):
+    """RSS 수집/재창작 대신 stage 1건 + item 2건 후 빈 브리핑 저장 (release가 set될 때까지 중간에 멈춤)"""
+    release = asyncio.Event()
+    calls = []
+
+    async def events(target_date, db, news_count, snapshot, recreate_batch_size=None):
+        calls.append(target_date)
+        yield "stage", {"stage": "collect", "count": 2}
+        yield "item", {"index": 0}
+        await release.wait()
+        yield "item", {"index": 1}
+        briefing = DailyBriefing(briefing_date=target_date)
+        db.add(briefing)
+        db.commit()
+        db.refresh(briefing)
+        yield "done", briefing
+
+    monkeypatch.setattr(briefing_route, "_briefing_events", events)
+    return release, calls
+
+
+def _parse(chunk: str) -> tuple[str, dict]:
+    event, data = chunk.strip().split("\n")
+    return event.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+async def _open(target_date: date):
+    response = await briefing_route.generate_briefing_stream(target_date=target_date, news_count=3, snapshot=None)
+    return response.body_iterator
+
+
+def test_stream_sends_progress_then_done(target_date, fake_events):
+    release, _ = fake_events
+
+    async def main():
+        stream = await _open(target_date)
+        received = []
+        async for chunk in stream:
+            received.append(_parse(chunk))
+            if len(received) == 2:
+                release.set()
+        return received
+
+    received = asyncio.run(main())
+
+    assert [event for event, _ in received] == ["stage", "item", "item", "done"]
+    assert received[-1][1]["existing"] is False
+
+
+def test_disconnect_does_not_abort_generation(db, target_date, fake_events):
+    release, calls = fake_events
+
+    async def main():
+        stream = await _open(target_date)
+        assert _parse(await stream.__anext__())[0] == "stage"
+        await stream.aclose()  # 클라이언트 연결 끊김
+
+        # /today, /generate처럼 같은 날짜를 기다리는 요청
+        waiter = asyncio.create_task(briefing_jobs.run_single_flight(target_date, None))
+        await asyncio.sleep(0.05)
+        release.set()
+        return await waiter
+
+    briefing_id = asyncio.run(main())
+
+    assert len(calls) == 1
+    db.expire_all()
+    job = db.query(BriefingJob).filter(BriefingJob.briefing_date == target_date).one()
+    assert job.status == "done" and job.briefing_id == briefing_id
+
+
+def test_late_subscriber_gets_events_from_start(target_date, fake_events):
+    release, calls = fake_events
+
+    async def collect(stream):
+        return [_parse(chunk)[0] async for chunk in stream]
+
+    async def main():
+        first = await _open(target_date)
+        await first.__anext__()
+        second = asyncio.create_task(collect(await _open(target_date)))
+        await asyncio.sleep(0.05)
+        release.set()
+        rest = await collect(first)
+        return rest, await second
+
+    rest, second = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert rest == ["item", "item", "done"]
+    assert second == ["stage", "item", "item", "done"]
+
+
+def test_existing_briefing_returned_without_regenerating(db, target_date, fake_events):
+    _, calls = fake_events
+    briefing = DailyBriefing(briefing_date=target_date)
+    db.add(briefing)
+    db.commit()
+
+    async def main():
+        return [_parse(chunk) async for chunk in await _open(target_date)]
+
+    assert asyncio.run(main()) == [("done", {"briefing_id": briefing.id, "news_count": 0, "existing": True})]
+    assert calls == []
@@ -0,0 +1,103 @@
+"""배치 재창작 테스트 (FakeLLM)"""
+import asyncio
+import json
+
+from app.services import claude_service
+from app.services.claude_service import is_validated, recreate_news, recreate_news_batch
+
+
+def _texts(count: int) -> list:
+    # FakeLLM 제목에 단어 수가 들어가므로 기사마다 단어 수를 다르게
+    return [
+        "한국은행이 기준금리를 동결했다. " + " ".join(f"추가{j}" for j in range(i + 1)) + " 시장은 예상했다는 반응이다."
+        for i in range(count)
+    ]
+
+
+def _topic(text: str) -> str:
+    return f"({len(text.split())})"
+
+
+class _CountingLLM:
+    """FakeLLM 앞단: 배치/단건 요청 수를 세고, 배치 응답에서 drop_ids 항목을 뺌"""
+
+    def __init__(self, inner, drop_ids=()):
+        self.inner = inner
+        self.drop_ids = set(drop_ids)
+        self.batch_sizes = []
+        self.single_calls = 0
+        self.messages = self
+
+    async def create(self, **kwargs):
+        response = await self.inner.messages.create(**kwargs)
+        prompt = kwargs["messages"][0]["content"]
+        if "원문 목록" not in prompt:
+            self.single_calls += 1
+            return response
+        items = json.loads("[" + response.content[0].text)
+        self.batch_sizes.append(len(items))
+        kept = [item for item in items if item["id"] not in self.drop_ids]
+        response.content[0].text = json.dumps(kept, ensure_ascii=False)[1:]
+        return response
+
+
+def test_batch_splits_into_chunks_and_keeps_order(fake_llm):
+    llm = _CountingLLM(fake_llm)
+    claude_service.set_client(llm)
+    texts = _texts(5)
+
+    results = asyncio.run(recreate_news_batch(texts, batch_size=2))
+
+    assert sorted(llm.batch_sizes) == [1, 2, 2]
+    assert llm.single_calls == 0
+    assert all(is_validated(r) for r in results)
+    assert [r["title"].endswith(_topic(t)) for r, t in zip(results, texts)] == [True] * 5
+
+
+def test_missing_batch_item_retried_individually(fake_llm):
+    llm = _CountingLLM(fake_llm, drop_ids={2})
+    claude_service.set_client(llm)
+    texts = _texts(4)
+
+    results = asyncio.run(recreate_news_batch(texts, batch_size=4))
+
+    assert llm.batch_sizes == [4]
+    assert llm.single_calls == 1  # 빠진 2번 기사만
+    assert all(is_validated(r) for r in results)
+    assert results[1]["title"].endswith(_topic(texts[1]))
+
+
+def test_validation_failure_retried_then_flagged(fake_llm, monkeypatch):
+    # 모든 결과가 검증 실패 -> 배치 1번 + 기사별 단건 재시도, 최종 결과는 validated False
+    monkeypatch.setattr(claude_service, "validate_recreation", lambda *args: (False, "테스트"))
+    llm = _CountingLLM(fake_llm)
+    claude_service.set_client(llm)
+
+    results = asyncio.run(recreate_news_batch(_texts(2), batch_size=2))
+
+    assert llm.batch_sizes == [2]
+    assert llm.single_calls == 2 * 4  # 기사당 최초 1회 + 재시도 3회
+    assert [is_validated(r) for r in results] == [False, False]
+
+
+def test_empty_content_counted_as_parse_failure(fake_llm):
+    class _Empty:
+        def __init__(self):
+            self.messages = self
+            self.calls = 0
+
+        async def create(self, **kwargs):
+            self.calls += 1
+            response = await fake_llm.messages.create(**kwargs)
+            response.content = []
+            return response
+
+    llm = _Empty()
+    claude_service.set_client(llm)
+    before = claude_service.recreation_stats()["parse_failure"]
+
+    result = asyncio.run(recreate_news(_texts(1)[0], max_retries=1))
+
+    assert llm.calls == 2
+    assert not is_validated(result)
+    assert claude_service.recreation_stats()["parse_failure"] - before == 2
@@ -1,23 +1,20 @@
 """저작권 준수 검증 테스트"""
-import re
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.copyright_validator import SourceFingerprint, check_source
 
 
 def check_consecutive_words(original: str, recreated: str, max_consecutive: int = 3) -> bool:
-    """원문과 재창작 텍스트 간 연속 단어 중복 검사
+    """원문과 재창작 텍스트 간 연속 단어 중복 검사 (운영 검증과 같은 엔진)
 
     Returns:
         True: 저작권 준수 (중복 없음)
         False: 저작권 위반 (중복 있음)
     """
-    original_words = re.findall(r'\w+', original.lower())
-    recreated_words = re.findall(r'\w+', recreated.lower())
-
-    for i in range(len(recreated_words) - max_consecutive + 1):
-        phrase = recreated_words[i:i + max_consecutive]
-        for j in range(len(original_words) - max_consecutive + 1):
-            if original_words[j:j + max_consecutive] == phrase:
-                return False
-    return True
+    return not SourceFingerprint(original, max_consecutive).copied_spans(recreated)
 
 
 def check_analysis_ratio(summary_len: int, analysis_len: int, min_ratio: float = 1.0) -> bool:
@@ -39,8 +36,7 @@ def check_source_info(data: dict) -> bool:
         True: 출처 정보 있음
         False: 출처 정보 없음
     """
-    required = ['source_url', 'publisher']
-    return all(data.get(field) for field in required)
+    return check_source(data)
 
 
 def validate_copyright(original: str, recreated: dict) -> dict:
@@ -73,6 +69,55 @@ def validate_copyright(original: str, recreated: dict) -> dict:
     return {"valid": len(errors) == 0, "errors": errors}
 
 
+ORIGINAL = "테슬라가 3분기 실적을 발표하며 전년 대비 매출 20% 증가를 기록했습니다."
+
+
+def test_paraphrase_passes():
+    report = SourceFingerprint(ORIGINAL).check(
+        "전기차 기업 테슬라의 3분기 매출이 전년 동기 대비 20% 성장했다.",
+        {"source_url": "https://example.com/1", "publisher": "경제신문"},
+    )
+    assert report.valid
+    assert report.spans == []
+
+
+def test_copied_run_reported_with_original_text():
+    text = "업계에 따르면 테슬라가 3분기 실적을 발표하며 매출이 증가했습니다."
+    spans = SourceFingerprint(ORIGINAL).copied_spans(text)
+    assert [fragment for _, _, fragment in spans] == ["테슬라가 3분기 실적을 발표하며"]
+    assert not SourceFingerprint(ORIGINAL).check(text).valid
+
+
+def test_overlapping_runs_merged():
+    original = "가 나 다 라 마 바"
+    spans = SourceFingerprint(original).copied_spans("가 나 다 라 그리고 라 마 바")
+    assert [fragment for _, _, fragment in spans] == ["가 나 다 라", "라 마 바"]
+
+
+def test_high_jaccard_rejected():
+    report = SourceFingerprint("가 나 다 라 마").check("마 라 다 나 가")
+    assert report.spans == []
+    assert report.jaccard == 1.0
+    assert not report.valid
+
+
+def test_missing_source_rejected():
+    report = SourceFingerprint(ORIGINAL).check("전기차 업체의 매출이 크게 늘었다.", {"source_url": "", "publisher": ""})
+    assert report.source_ok is False
+    assert "출처 정보 누락" in report.errors
+
+
+def test_validate_copyright_helper():
+    recreated = {
+        "summary": "테슬라가 3분기 실적을 발표하며 매출이 증가했습니다.",
+        "causalities": [], "insights": [],
+        "source_url": "https://example.com/1", "publisher": "경제신문",
+    }
+    result = validate_copyright(ORIGINAL, recreated)
+    assert not result["valid"]
+    assert "3단어 이상 연속 복제 감지" in result["errors"]
+
+
 # 테스트 케이스
 if __name__ == "__main__":
     # 테스트 1: 정상 케이스
@@ -0,0 +1,98 @@
+"""RSS 파서 테스트 (스트리밍 파서와 feedparser 대체 경로의 결과 일치)"""
+import pytest
+
+from app.services import rss_service
+from app.services.feed_parser import FeedStreamParser, clean_html, iter_feed_entries
+from app.services.rss_service import parse_entries, parse_feed
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+<title>테스트일보</title>
+<item>
+  <title><![CDATA[한국은행,&nbsp;기준금리 <b>동결</b>]]></title>
+  <link>https://example.com/1</link>
+  <guid>g1</guid>
+  <description><![CDATA[<p>한국은행이 기준금리를&nbsp;연 3.5%로 <a href="#">동결</a>했다.</p>]]></description>
+  <pubDate>Mon, 01 Jan 2030 09:00:00 +0900</pubDate>
+</item>
+<item>
+  <title>반도체 수출 석 달째 증가</title>
+  <link>https://example.com/2</link>
+  <description>수출이 &lt;b&gt;늘었다&lt;/b&gt;.</description>
+</item>
+<item>
+  <title>세 번째 기사</title>
+  <link>https://example.com/3</link>
+  <guid>g3</guid>
+  <description>요약</description>
+</item>
+</channel></rss>""".encode("utf-8")
+
+ATOM = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>아톰 뉴스</title>
+<entry>
+  <title>아톰 기사</title>
+  <link rel="alternate" href="https://example.com/atom/1"/>
+  <id>tag:example.com,2030:1</id>
+  <summary type="html">&lt;p&gt;아톰 요약&lt;/p&gt;</summary>
+  <updated>2030-01-01T00:00:00Z</updated>
+</entry>
+</feed>""".encode("utf-8")
+
+
+def _stream(content: bytes, limit=None, seen=None, chunk_size: int = 50) -> list:
+    chunks = (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+    return list(iter_feed_entries(chunks, limit, seen))
+
+
+def test_clean_html_strips_tags_entities_and_nbsp():
+    assert clean_html("<p>가&nbsp;나 &amp; <b>다</b>\xa0라</p>") == "가 나 & 다 라"
+
+
+def test_stream_parses_rss_items():
+    articles = _stream(RSS)
+
+    assert [a["title"] for a in articles] == ["한국은행, 기준금리 동결", "반도체 수출 석 달째 증가", "세 번째 기사"]
+    assert articles[0]["summary"] == "한국은행이 기준금리를 연 3.5%로 동결 했다."  # 태그 자리는 공백
+    assert articles[0]["publisher"] == "테스트일보"
+    assert articles[0]["guid"] == "g1"
+    assert articles[1]["guid"] == "https://example.com/2"  # guid가 없으면 링크
+
+
+def test_stream_parses_atom_link_and_summary():
+    [article] = _stream(ATOM)
+
+    assert article["source_url"] == "https://example.com/atom/1"
+    assert article["summary"] == "아톰 요약"
+    assert article["publisher"] == "아톰 뉴스"
+    assert article["published_at"] == "2030-01-01T00:00:00Z"
+
+
+def test_stream_stops_after_limit_and_skips_seen():
+    parser = FeedStreamParser(limit=1, seen={"g1"})
+    articles = parser.feed(RSS)
+
+    assert [a["guid"] for a in articles] == ["https://example.com/2"]
+    assert parser.done
+
+
+@pytest.mark.parametrize("content", [RSS, ATOM])
+def test_feedparser_path_matches_stream(content):
+    # 스트리밍 XML 오류 시 쓰는 feedparser 경로도 제목 nbsp/요약 HTML을 같은 규칙으로 정리
+    fallback = parse_feed(content, None)
+    stream = _stream(content)
+
+    keys = ("title", "summary", "source_url", "publisher", "guid")
+    assert [{k: a[k] for k in keys} for a in fallback] == [{k: a[k] for k in keys} for a in stream]
+
+
+def test_invalid_xml_falls_back_to_cleaned_feedparser(monkeypatch):
+    # 정의되지 않은 엔티티(&nbsp;)는 XML 파서 오류 -> feedparser로 대체
+    broken = RSS.replace(b"<title>\xeb\xb0\x98\xeb\x8f\x84\xec\xb2\xb4", b"<title>&nbsp;\xeb\xb0\x98\xeb\x8f\x84\xec\xb2\xb4")
+    monkeypatch.setattr(rss_service, "FEED_PARSER_MODE", "stream")
+
+    articles = parse_entries(broken, limit=2, seen={"g1"})
+
+    assert [a["title"] for a in articles] == ["반도체 수출 석 달째 증가", "세 번째 기사"]
+    assert articles[0]["summary"] == "수출이 늘었다 ."
@@ -0,0 +1,101 @@
+"""백그라운드 RSS 수집 스케줄러 테스트 (폴링 간격, 실행권, 스테이징 저장, 폴링 1회)"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.feed import FeedState, RawArticle, SchedulerLease
+from app.services import ingest_scheduler
+from app.services.ingest_scheduler import (
+    MAX_BACKOFF_INTERVAL, MAX_POLL_INTERVAL, MIN_POLL_INTERVAL, IngestScheduler, acquire_lease,
+    backoff_interval, load_staged_articles, next_interval, store_raw_articles,
+)
+from app.services.rss_service import RSS_FEEDS
+
+NOW = datetime(2030, 1, 1, 9, 0)
+
+
+@pytest.fixture
+def clean_tables(db):
+    yield
+    db.rollback()
+    for model in (RawArticle, FeedState, SchedulerLease):
+        db.query(model).delete()
+    db.commit()
+
+
+def _article(guid: str, feed: str = "feed") -> dict:
+    return {"guid": guid, "title": f"제목 {guid}", "summary": "요약", "source_url": f"https://example.com/{feed}/{guid}",
+            "publisher": "테스트일보", "published_at": ""}
+
+
+def test_interval_shrinks_with_new_items_and_grows_without():
+    state = FeedState(poll_interval=600)
+    assert next_interval(state, new_count=3) == 420
+    assert next_interval(state, new_count=0) == 900
+
+    assert next_interval(FeedState(poll_interval=MIN_POLL_INTERVAL), 5) == MIN_POLL_INTERVAL
+    assert next_interval(FeedState(poll_interval=MAX_POLL_INTERVAL), 0) == MAX_POLL_INTERVAL
+
+
+def test_backoff_doubles_per_failure_up_to_cap():
+    assert [backoff_interval(FeedState(poll_interval=600, failure_count=n)) for n in range(3)] == [600, 1200, 2400]
+    assert backoff_interval(FeedState(poll_interval=600, failure_count=10)) == MAX_BACKOFF_INTERVAL
+
+
+def test_lease_held_by_one_owner_until_expired(db, clean_tables, monkeypatch):
+    assert acquire_lease(db, NOW, "test")
+    assert acquire_lease(db, NOW + timedelta(seconds=10), "test")  # 보유자 갱신
+
+    monkeypatch.setattr(ingest_scheduler, "_OWNER", "other:1")
+    assert not acquire_lease(db, NOW + timedelta(seconds=20), "test")
+    expired = NOW + timedelta(seconds=10 + ingest_scheduler.LEASE_SECONDS + 1)
+    assert acquire_lease(db, expired, "test")
+    db.expire_all()
+    assert db.query(SchedulerLease).filter(SchedulerLease.name == "test").one().owner == "other:1"
+
+
+def test_store_skips_known_guids(db, clean_tables):
+    assert store_raw_articles(db, "feed", [_article("a"), _article("b"), _article("a")]) == 2
+    db.commit()
+    assert store_raw_articles(db, "feed", [_article("b"), _article("c")]) == 1
+    db.commit()
+    assert db.query(RawArticle).count() == 3
+
+
+def test_staged_articles_limited_per_feed_in_feed_order(db, clean_tables):
+    first, second = list(RSS_FEEDS)[:2]
+    for feed in (second, first):
+        for i in range(4):
+            db.add(RawArticle(feed_name=feed, guid=str(i), title=f"{feed} {i}", summary="요약",
+                              source_url=f"https://example.com/{feed}/{i}", publisher="테스트일보",
+                              fetched_at=datetime.utcnow() - timedelta(minutes=i)))
+    db.commit()
+
+    titles = [a["title"] for a in load_staged_articles(db, limit_per_feed=2)]
+
+    assert titles == [f"{first} 0", f"{first} 1", f"{second} 0", f"{second} 1"]
+
+
+def test_poll_due_feeds_stores_new_items_and_backs_off_failures(db, clean_tables, monkeypatch):
+    failing = list(RSS_FEEDS)[0]
+
+    async def fetch(client, state, limit):
+        if state.feed_name == failing:
+            raise ConnectionError("down")
+        return [_article(f"{state.feed_name}-1", state.feed_name)]
+
+    monkeypatch.setattr(ingest_scheduler, "fetch_rss_conditional", fetch)
+
+    results = asyncio.run(IngestScheduler().poll_due_feeds())
+
+    assert failing not in results
+    assert set(results) == set(RSS_FEEDS) - {failing}
+    assert all(count == 1 for count in results.values())
+    db.expire_all()
+    states = {s.feed_name: s for s in db.query(FeedState)}
+    assert states[failing].failure_count == 1
+    assert all(s.failure_count == 0 and s.next_poll_at > datetime.utcnow() for name, s in states.items() if name != failing)
+
+    # 바로 다시 돌리면 도래한 피드가 없음
+    assert asyncio.run(IngestScheduler().poll_due_feeds()) == {}
@@ -0,0 +1,39 @@
+"""파이프라인 계측(start_run/stage) 테스트"""
+import asyncio
+import threading
+
+from app.models.pipeline_run import PipelineRun
+from app.services import instrumentation
+from app.services.instrumentation import record_feed, stage, start_run
+
+
+def test_run_saved_with_stages(db):
+    async def main():
+        async with start_run("test_run", source="pytest"):
+            with stage("collect", 3) as st:
+                st.set_output(2)
+                st.drop("short", 1)
+            record_feed("feed", 0.25, 2)
+
+    asyncio.run(main())
+
+    run = db.query(PipelineRun).filter(PipelineRun.kind == "test_run").one()
+    assert run.status == "ok" and run.meta == {"source": "pytest"}
+    assert run.stages[0]["name"] == "collect" and run.stages[0]["drops"] == {"short": 1}
+    assert run.feeds == [{"name": "feed", "latency_ms": 250.0, "count": 2, "status": "ok"}]
+    db.delete(run)
+    db.commit()
+
+
+def test_save_runs_off_event_loop(monkeypatch):
+    threads = []
+    monkeypatch.setattr(instrumentation, "_save", lambda recorder: threads.append(threading.get_ident()))
+
+    async def main():
+        async with start_run("test_thread"):
+            pass
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+
+    assert len(threads) == 1 and threads[0] != loop_thread
@@ -0,0 +1,48 @@
+"""LLM JSON 응답 파서 테스트"""
+import pytest
+
+from app.services.llm_json import ParseError, parse_array, parse_object
+
+FIELDS = ("title", "summary")
+
+
+def test_parse_object_standard_json():
+    assert parse_object('{"title": "제목", "summary": "요약 문장"}', FIELDS) == {"title": "제목", "summary": "요약 문장"}
+
+
+def test_parse_object_ignores_fence_and_prose():
+    text = '설명입니다.\n```json\n{"title": "제목",\n "summary": "첫 줄\\n둘째 줄"}\n```\n이상입니다.'
+    assert parse_object(text, FIELDS) == {"title": "제목", "summary": "첫 줄 둘째 줄"}
+
+
+def test_parse_object_prefilled_brace():
+    # 재창작 요청은 "{"를 미리 채워 보내고 응답 앞에 다시 붙임
+    response = '"title": "제목", "summary": "요약"}'
+    assert parse_object("{" + response, FIELDS) == {"title": "제목", "summary": "요약"}
+
+
+def test_parse_object_unescaped_quotes_fall_back_to_key_scan():
+    text = '{"title": "삼성 "초격차" 전략", "summary": "줄바꿈이\n그대로 있는 요약"}'
+    assert parse_object(text, FIELDS) == {"title": '삼성 "초격차" 전략', "summary": "줄바꿈이 그대로 있는 요약"}
+
+
+def test_parse_object_missing_field():
+    with pytest.raises(ParseError):
+        parse_object('{"title": "제목"}', FIELDS)
+
+
+def test_parse_object_no_object():
+    with pytest.raises(ParseError):
+        parse_object("죄송합니다. 요청을 처리할 수 없습니다.", FIELDS)
+
+
+def test_parse_array_skips_incomplete_items():
+    text = '[{"id": "1", "title": "가", "summary": "나"}, {"id": "2", "title": "다"}]'
+    assert parse_array(text, ("id",) + FIELDS) == [{"id": "1", "title": "가", "summary": "나"}]
+
+
+def test_parse_array_key_scan_per_item():
+    text = '[{"id": 1, "title": "가 "인용"", "summary": "나"}, {"id": 2, "title": "다", "summary": "라"}]'
+    items = parse_array(text, ("id",) + FIELDS)
+    assert [item["id"] for item in items] == ["1", "2"]
+    assert items[0]["title"] == '가 "인용"'
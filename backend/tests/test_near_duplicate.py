@@ -0,0 +1,116 @@
+"""근접 중복 탐지(MinHash + LSH) 재현율 테스트
+
+기준은 두 가지:
+- 정확한 규칙: 모든 쌍의 2-gram Jaccard >= 임계값 (LSH가 근사하는 대상)
+- 이전 규칙: 제목 SequenceMatcher ratio >= 0.5 (news_filter가 LSH 이전에 쓰던 전체 비교)
+"""
+import itertools
+import os
+import random
+import sys
+from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.near_duplicate import (
+    DEFAULT_THRESHOLD, LSH_ROWS, MAX_BUCKET_SIZE, TARGET_RECALL, MinHashLSH, group_near_duplicates, jaccard,
+    lsh_bands, shingles,
+)
+
+OLD_RULE_RATIO = 0.5
+
+PREFIXES = ["[속보] ", "[단독] ", "(종합) ", ""]
+SUFFIXES = ["", "…시장 촉각", " - 연합뉴스", ", 전년 대비 개선", "…업계 주목"]
+
+
+def _overlapping_titles(count: int, seed: int = 1) -> list:
+    """흔한 경제 단어를 Zipf 분포로 공유하는 서로 다른 제목 (무관한 쌍끼리도 2-gram이 많이 겹침)"""
+    rng = random.Random(seed)
+    syllables = "가나다라마바사아자차카타파하강남동서북산업기술정책투자증권은행전자자동차에너지건설유통항공"
+    common = ["정부", "시장", "투자", "확대", "발표", "추진", "증가", "감소", "전망", "우려", "실적", "금리",
+              "수출", "규제", "지원", "최대", "회복", "동결", "인하", "분기", "영업이익", "매출"]
+    vocab = common + ["".join(rng.choice(syllables) for _ in range(rng.randint(2, 3))) for _ in range(2000)]
+    weights = [1 / (i + 1) ** 0.9 for i in range(len(vocab))]
+    return [
+        "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) + " "
+        + " ".join(rng.choices(vocab, weights, k=rng.randint(3, 6)))
+        for _ in range(count)
+    ]
+
+
+def _corpus(seed: int = 7) -> tuple[list, list]:
+    """(기사 목록, 스토리 번호 목록) - 스토리마다 말머리/꼬리말/띄어쓰기만 다른 변형 2~4개"""
+    rng = random.Random(seed)
+    articles, stories = [], []
+    for story, base in enumerate(_overlapping_titles(60, seed)):
+        for _ in range(rng.randint(2, 4)):
+            title = f"{rng.choice(PREFIXES)}{base}{rng.choice(SUFFIXES)}"
+            if rng.random() < 0.3:
+                title = title.replace(" ", "", 1)
+            articles.append({"title": title})
+            stories.append(story)
+    return articles, stories
+
+
+def test_bands_reach_target_recall_at_threshold():
+    for threshold in (DEFAULT_THRESHOLD, 0.35):
+        bands = lsh_bands(threshold)
+        assert 1 - (1 - threshold ** LSH_ROWS) ** bands >= TARGET_RECALL
+        # 최소 밴드 수 (서명 길이를 필요 이상 늘리지 않음)
+        assert 1 - (1 - threshold ** LSH_ROWS) ** (bands - 1) < TARGET_RECALL or bands == 1
+
+
+def test_candidates_recall_exact_jaccard_pairs():
+    articles, _ = _corpus()
+    sets = [shingles(a["title"]) for a in articles]
+    exact = {
+        (i, j) for i, j in itertools.combinations(range(len(articles)), 2)
+        if jaccard(sets[i], sets[j]) >= DEFAULT_THRESHOLD
+    }
+
+    lsh = MinHashLSH(DEFAULT_THRESHOLD)
+    found = set(map(tuple, lsh.candidate_pairs(lsh.signatures(sets)).tolist()))
+
+    assert exact
+    assert len(exact & found) / len(exact) >= 0.9
+
+
+def test_groups_keep_old_rule_duplicates_together():
+    articles, stories = _corpus()
+    # 이전 규칙으로 중복인 같은 스토리 변형 쌍
+    old_pairs = [
+        (i, j) for i, j in itertools.combinations(range(len(articles)), 2)
+        if stories[i] == stories[j]
+        and SequenceMatcher(None, articles[i]["title"], articles[j]["title"]).ratio() >= OLD_RULE_RATIO
+    ]
+    group_of = {}
+    for g, group in enumerate(group_near_duplicates(articles)):
+        for article in group:
+            group_of[id(article)] = g
+
+    together = sum(group_of[id(articles[i])] == group_of[id(articles[j])] for i, j in old_pairs)
+    assert old_pairs
+    assert together / len(old_pairs) >= 0.95
+
+
+
+def test_candidate_pairs_scale_linearly_with_overlapping_vocabulary():
+    lsh = MinHashLSH(DEFAULT_THRESHOLD)
+    counts = {}
+    for count in (2000, 8000):
+        sets = [shingles(title) for title in _overlapping_titles(count)]
+        counts[count] = len(lsh.candidate_pairs(lsh.signatures(sets)))
+
+    # 2-gram Jaccard 0.2 / 밴드당 2행이던 때는 2000건에서 이미 후보 쌍이 기사 수의 몇 배였음
+    for count, pairs in counts.items():
+        assert pairs < count / 4
+
+
+def test_oversized_bucket_still_grouped():
+    # 같은 제목 변형이 버킷 상한보다 많아도 (첫 기사와의 쌍으로) 한 그룹
+    articles = [{"title": f"{prefix}한국은행 기준금리 동결 결정"} for prefix in ["[속보] ", ""] * MAX_BUCKET_SIZE]
+    articles.append({"title": "현대차 신규 공장 착공 발표"})
+
+    groups = group_near_duplicates(articles)
+
+    assert [len(group) for group in groups] == [MAX_BUCKET_SIZE * 2, 1]
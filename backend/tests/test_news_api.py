@@ -0,0 +1,146 @@
+"""뉴스 목록(커서)/검색/태그 API 테스트"""
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.models.briefing import BriefingNewsItem, DailyBriefing
+from app.models.news import NewsArticle
+from app.services import news_count, search_index
+
+ARTICLE_COUNT = 25
+BASE_TIME = datetime(2030, 1, 1, 9, 0)
+
+
+@pytest.fixture(scope="module")
+def articles(client):
+    """기사 25건 (created_at이 같은 기사 쌍 포함) + 브리핑 뉴스 1건"""
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    rows = []
+    for i in range(ARTICLE_COUNT):
+        tags = ["반도체"] if i % 2 == 0 else ["금리"]
+        if i % 5 == 0:
+            tags.append("수출")
+        rows.append(NewsArticle(
+            title=f"테스트 기사 {i}",
+            summary="삼성전자가 반도체 수출 실적을 발표했다." if i == 7 else "시장 동향 요약입니다.",
+            recreated_content="본문",
+            source_url=f"https://example.com/{i}",
+            publisher="테스트일보",
+            original_published_at=BASE_TIME,
+            tags=tags,
+            created_at=BASE_TIME + timedelta(minutes=i // 2),  # 두 건씩 같은 시각
+        ))
+    briefing = DailyBriefing(briefing_date=date(2030, 1, 1))
+    briefing.news_items = [BriefingNewsItem(
+        title="반도체 수출 호조", summary="반도체 수출이 석 달째 늘었다.", publisher="테스트일보",
+        source_url="https://example.com/b", category="industry", order=0,
+    )]
+    db.add_all(rows + [briefing])
+    db.commit()
+    ids = [row.id for row in rows]
+    news_count.invalidate()
+    yield ids
+
+    for row in rows:
+        db.delete(row)
+    db.delete(briefing.news_items[0])
+    db.delete(briefing)
+    db.commit()
+    db.close()
+    news_count.invalidate()
+
+
+def _expected_order() -> list:
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return [a.id for a in db.query(NewsArticle).order_by(NewsArticle.created_at.desc(), NewsArticle.id.desc())]
+    finally:
+        db.close()
+
+
+def test_cursor_pages_cover_list_without_duplicates(client, articles):
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 4, **({"cursor": cursor} if cursor else {})}
+        body = client.get("/api/v1/news", params=params).json()
+        seen.extend(a["id"] for a in body["articles"])
+        cursor = body["next_cursor"]
+        if not body["has_more"]:
+            assert cursor is None
+            break
+
+    assert seen == _expected_order()
+    assert body["total"] == len(seen)
+
+
+def test_cursor_matches_offset_page(client, articles):
+    first = client.get("/api/v1/news", params={"limit": 5}).json()
+    by_cursor = client.get("/api/v1/news", params={"limit": 5, "cursor": first["next_cursor"]}).json()
+    by_page = client.get("/api/v1/news", params={"limit": 5, "page": 2}).json()
+
+    assert [a["id"] for a in by_cursor["articles"]] == [a["id"] for a in by_page["articles"]]
+
+
+def test_invalid_cursor_rejected(client, articles):
+    assert client.get("/api/v1/news", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_tag_filter(client, articles):
+    body = client.get("/api/v1/news", params={"tag": "수출", "limit": 100}).json()
+    assert body["total"] == len(body["articles"]) == 5
+    assert all("수출" in a["tags"] for a in body["articles"])
+
+    # 여러 태그는 모두 붙은 기사만
+    both = client.get("/api/v1/news", params={"tags": "반도체,수출", "limit": 100}).json()
+    assert both["total"] == 3
+    assert all({"반도체", "수출"} <= set(a["tags"]) for a in both["articles"])
+
+
+def test_tag_filter_cursor(client, articles):
+    seen, cursor = [], None
+    while True:
+        params = {"tag": "반도체", "limit": 3, **({"cursor": cursor} if cursor else {})}
+        body = client.get("/api/v1/news", params=params).json()
+        seen.extend(a["id"] for a in body["articles"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == len(set(seen)) == 13
+
+
+def test_tag_counts(client, articles):
+    counts = {t["name"]: t["count"] for t in client.get("/api/v1/news/tags").json()["tags"]}
+    assert counts["반도체"] == 13
+    assert counts["금리"] == 12
+    assert counts["수출"] == 5
+
+
+def test_search_matches_news_and_briefing_items(client, articles):
+    body = client.get("/api/v1/news/search", params={"q": "반도체 수출"}).json()
+    types = {(a["type"], a["title"]) for a in body["articles"]}
+
+    assert ("news", "테스트 기사 7") in types
+    assert ("briefing", "반도체 수출 호조") in types
+    # 제목에 검색어가 있는 브리핑 뉴스가 본문에만 있는 기사보다 앞
+    if search_index.available():
+        assert body["articles"][0]["title"] == "반도체 수출 호조"
+
+
+def test_search_korean_particles(client, articles):
+    # "삼성전자가"로 저장된 문장을 "삼성전자"로 검색
+    body = client.get("/api/v1/news/search", params={"q": "삼성전자"}).json()
+    assert [a["title"] for a in body["articles"]] == ["테스트 기사 7"]
+
+
+def test_search_cursor(client, articles):
+    first = client.get("/api/v1/news/search", params={"q": "시장 동향", "limit": 10}).json()
+    assert first["total"] == ARTICLE_COUNT - 1
+    second = client.get("/api/v1/news/search", params={"q": "시장 동향", "limit": 10,
+                                                        "cursor": first["next_cursor"]}).json()
+    ids = [a["id"] for a in first["articles"] + second["articles"]]
+    assert len(ids) == len(set(ids)) == 20
@@ -0,0 +1,88 @@
+"""LLM 요청 속도 제한(토큰 버킷 + AIMD 동시성) 테스트"""
+import asyncio
+import time
+
+from app.services import rate_limiter
+from app.services.rate_limiter import AdaptiveRateLimiter, TokenBucket, backoff_delay
+
+
+def test_backoff_delay_within_exponential_cap(monkeypatch):
+    monkeypatch.setattr(rate_limiter.random, "uniform", lambda low, high: high)
+    assert [backoff_delay(a) for a in range(8)] == [1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 60.0, 60.0]
+
+
+def test_bucket_wait_time_and_refill(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    bucket = TokenBucket(60)  # 초당 1
+
+    bucket.take(60)
+    assert bucket.wait_time(1) == 1.0
+    now[0] += 30
+    assert bucket.wait_time(1) == 0.0
+    assert bucket.level == 30
+    # 버킷보다 큰 요청도 가득 차면 통과
+    assert bucket.wait_time(1000) == 30.0
+
+
+def test_aimd_increase_and_halve():
+    limiter = AdaptiveRateLimiter(rpm=1000, tpm=100_000, concurrency=4, max_concurrency=5, min_concurrency=1)
+
+    for _ in range(4):
+        limiter.on_success(100, 100)
+    assert limiter.limit == 5
+    for _ in range(10):
+        limiter.on_success(100, 100)
+    assert limiter.limit == 5  # 상한
+
+    limiter.on_throttled()
+    assert limiter.limit == 2
+    limiter.on_error()
+    limiter.on_error()
+    assert limiter.limit == 1  # 하한
+    assert limiter.counters["throttled"] == 1 and limiter.counters["errors"] == 2
+
+
+def test_token_usage_corrected_after_response():
+    limiter = AdaptiveRateLimiter(rpm=1000, tpm=10_000, concurrency=1, max_concurrency=1)
+
+    async def main():
+        async with limiter.slot(tokens=1000):
+            pass
+
+    asyncio.run(main())
+    before = limiter.tokens.level
+    limiter.on_success(estimated_tokens=1000, actual_tokens=400)
+    assert limiter.tokens.level > before + 590  # 추정치보다 적게 썼으면 돌려받음
+
+
+def test_slot_limits_concurrency():
+    limiter = AdaptiveRateLimiter(rpm=10_000, tpm=1_000_000, concurrency=2, max_concurrency=2)
+    active, peak = [0], [0]
+
+    async def request():
+        async with limiter.slot(tokens=10):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+
+    async def main():
+        await asyncio.gather(*(request() for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak[0] == 2
+    assert limiter.counters["requests"] == 6
+    assert limiter.stats()["active"] == 0
+
+
+def test_retry_after_pauses_all_requests():
+    limiter = AdaptiveRateLimiter(rpm=10_000, tpm=1_000_000, concurrency=2, max_concurrency=2)
+    limiter.on_throttled(retry_after=0.2)
+
+    async def main():
+        started = time.monotonic()
+        async with limiter.slot(tokens=10):
+            return time.monotonic() - started
+
+    assert asyncio.run(main()) >= 0.15
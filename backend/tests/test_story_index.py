@@ -0,0 +1,59 @@
+"""스토리 지문 인덱스(날짜를 넘는 중복 판정/재창작 재사용) 테스트"""
+from datetime import date
+
+import pytest
+
+from app.services.story_index import StoryIndex, same_story
+
+# 제목이 비슷해도 내용이 반대/다른 기사 (2-gram Jaccard 0.38~0.71)
+OPPOSITE_PAIRS = [
+    ("미국 연준 금리 인하 시사", "미국 연준 금리 동결 시사"),
+    ("삼성전자 3분기 영업이익 증가", "삼성전자 3분기 영업이익 감소"),
+    ("코스피 2600선 회복", "코스피 2500선 붕괴"),
+]
+# 말머리/꼬리말/띄어쓰기만 다른 같은 기사
+VARIANT_PAIRS = [
+    ("[속보] 한국은행 기준금리 동결", "한국은행, 기준금리 동결…시장 촉각"),
+    ("삼성전자 3분기 영업이익 10조 돌파 - 연합뉴스", "삼성전자,3분기 영업이익 10조 돌파"),
+]
+RECREATED = {"title": "재창작 제목", "summary": "재창작 요약"}
+
+
+@pytest.fixture
+def index(db):
+    yield StoryIndex(db)
+    db.rollback()
+
+
+@pytest.mark.parametrize("title, other", OPPOSITE_PAIRS)
+def test_opposite_stories_not_same(title, other):
+    assert not same_story(title, other)
+
+
+@pytest.mark.parametrize("title, other", VARIANT_PAIRS)
+def test_variants_are_same_story(title, other):
+    assert same_story(title, other)
+    assert same_story(other, title)
+
+
+@pytest.mark.parametrize("title, other", OPPOSITE_PAIRS)
+def test_opposite_story_neither_skipped_nor_reused(index, title, other):
+    index.add(title, "https://example.com/a", RECREATED, briefing_date=date(2030, 1, 1))
+
+    assert index.find(other, source_url="https://example.com/b") is None
+    assert index.find(other, before=date(2030, 1, 2), source_url="https://example.com/b") is None
+    assert index.find_reusable(other, "https://example.com/b") is None
+
+
+def test_variant_skipped_but_reused_only_for_same_article(index):
+    title, other = VARIANT_PAIRS[0]
+    row = index.add(title, "https://example.com/a", RECREATED, briefing_date=date(2030, 1, 1))
+
+    # 다른 언론사 변형: 이전 브리핑 스토리라 건너뛰지만, 재창작 결과는 가져다 쓰지 않음
+    assert index.find(other, before=date(2030, 1, 2), source_url="https://example.com/b") is row
+    assert index.find(other, before=date(2030, 1, 1), source_url="https://example.com/b") is None
+    assert index.find_reusable(other, "https://example.com/b") is None
+
+    # 같은 URL이거나 정규화한 제목이 같으면 재사용
+    assert index.find_reusable("전혀 다른 제목", "https://example.com/a") is row
+    assert index.find_reusable(title.replace("[속보]", "(종합)"), "https://example.com/c") is row
@@ -0,0 +1,26 @@
+"""태그 역색인 테스트 (새 태그 생성 경합)"""
+from sqlalchemy import delete, insert, select
+
+from app.models.news import Tag
+from app.services import tag_index
+
+
+def test_tag_created_concurrently_is_reused(client):
+    from app.database import engine
+
+    names = ["경합태그", "새태그"]
+    try:
+        with engine.begin() as conn:
+            # 조회 후 INSERT 전에 다른 트랜잭션이 같은 태그를 만든 상황
+            conn.execute(insert(Tag), {"name": "경합태그"})
+            existing = conn.execute(select(Tag.id).where(Tag.name == "경합태그")).scalar_one()
+
+            tag_index._insert_missing(conn, names)
+            ids = tag_index._tag_ids(conn, names)
+
+            assert ids["경합태그"] == existing
+            assert set(ids) == set(names)
+            assert len(conn.execute(select(Tag.id).where(Tag.name.in_(names))).all()) == 2
+    finally:
+        with engine.begin() as conn:
+            conn.execute(delete(Tag).where(Tag.name.in_(names)))
@@ -21,6 +21,7 @@ class NewsProvider with ChangeNotifier {
   LoadingState _listState = LoadingState.initial;
   String? _listError;
   int _currentPage = 1;
+  String? _nextCursor;
   bool _hasMore = true;
   int _total = 0;
 
@@ -70,6 +71,7 @@ class NewsProvider with ChangeNotifier {
 
     if (refresh) {
       _currentPage = 1;
+      _nextCursor = null;
       _articles = [];
       _hasMore = true;
     }
@@ -83,6 +85,7 @@ class NewsProvider with ChangeNotifier {
     try {
       final response = await _newsService.getNewsList(
         page: _currentPage,
+        cursor: _nextCursor,
         sortBy: _sortBy,
         category: _selectedCategory,
         tags: _selectedTags.isNotEmpty ? _selectedTags : null,
@@ -91,6 +94,7 @@ class NewsProvider with ChangeNotifier {
       _articles = refresh ? response.articles : [..._articles, ...response.articles];
       _total = response.total;
       _hasMore = response.hasMore;
+      _nextCursor = response.nextCursor;
       _currentPage++;
       _listState = LoadingState.loaded;
     } on ApiException catch (e) {
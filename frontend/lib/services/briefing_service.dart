@@ -20,10 +20,22 @@ class BriefingService {
     }
   }
 
+  /// 생성 중(202) 응답 폴링 간격/최대 횟수
+  static const Duration _jobPollInterval = Duration(seconds: 5);
+  static const int _jobPollMaxAttempts = 60;
+
   /// 오늘의 브리핑 조회
-  Future<DailyBriefingModel?> getTodayBriefing() async {
+  Future<DailyBriefingModel?> getTodayBriefing({double? wait}) async {
     try {
-      final response = await _client.get('/briefing/today');
+      final response = await _client.get('/briefing/today', queryParameters: {
+        if (wait != null) 'wait': wait,
+      });
+
+      // 생성 중이면 {job_id, status} -> 작업이 끝날 때까지 폴링 후 상세 조회
+      if (response.statusCode == 202) {
+        final briefingId = await _waitForJob(response.data['job_id']);
+        return briefingId == null ? null : getBriefingDetail(briefingId);
+      }
       return _parseBriefingDetail(response.data);
     } catch (e) {
       print('getTodayBriefing error: $e');
@@ -31,6 +43,22 @@ class BriefingService {
     }
   }
 
+  /// 브리핑 생성 작업 폴링 (완료 시 briefing_id, 실패/시간 초과 시 null)
+  Future<String?> _waitForJob(String jobId) async {
+    for (var i = 0; i < _jobPollMaxAttempts; i++) {
+      await Future.delayed(_jobPollInterval);
+      final response = await _client.get('/briefing/jobs/$jobId');
+      switch (response.data['status']) {
+        case 'done':
+          return response.data['briefing_id'];
+        case 'failed':
+          print('briefing job failed: ${response.data['error']}');
+          return null;
+      }
+    }
+    return null;
+  }
+
   /// 브리핑 상세 조회
   Future<DailyBriefingModel?> getBriefingDetail(String briefingId) async {
     try {
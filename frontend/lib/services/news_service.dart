@@ -13,6 +13,7 @@ class NewsService {
   Future<NewsListResponse> getNewsList({
     int page = 1,
     int limit = 20,
+    String? cursor,
     String? sortBy,
     String? category,
     List<String>? tags,
@@ -23,6 +24,7 @@ class NewsService {
         queryParameters: {
           'page': page,
           'limit': limit,
+          if (cursor != null) 'cursor': cursor,
           if (sortBy != null) 'sort_by': sortBy,
           if (category != null) 'category': category,
           if (tags != null && tags.isNotEmpty) 'tags': tags.join(','),
@@ -120,6 +122,7 @@ class NewsListResponse {
   final int page;
   final int limit;
   final bool hasMore;
+  final String? nextCursor;
 
   NewsListResponse({
     required this.articles,
@@ -127,6 +130,7 @@ class NewsListResponse {
     required this.page,
     required this.limit,
     required this.hasMore,
+    this.nextCursor,
   });
 
   factory NewsListResponse.fromJson(Map<String, dynamic> json) {
@@ -138,6 +142,7 @@ class NewsListResponse {
       page: json['page'] as int,
       limit: json['limit'] as int,
       hasMore: json['has_more'] as bool,
+      nextCursor: json['next_cursor'] as String?,
     );
   }
 
@@ -148,6 +153,7 @@ class NewsListResponse {
       'page': page,
       'limit': limit,
       'has_more': hasMore,
+      'next_cursor': nextCursor,
     };
   }
 }